@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+import datetime
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from gj.assigned_date import AssignedDate
+from gj.grade_class import GradeUtil
+from gj.household import GjHouseholdLoad
+from gj.requirements import Consts, DateRequirement
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from gj.util import GjUtil
+from gj.validator import GjSolutionValidator
+from n_to_n_matching.person_player import PersonBank, PersonPlayer
+from n_to_n_matching.workdate_player import WorkDate
+
+
+class GjPersonClass(NamedTuple):
+    """
+    @summary: Persons who are interchangeable for the allocation of a duty.
+    """
+    # (responsibility IDs, role IDs, `exempted`), (person ID,) of a person with history,
+    # or (household ID, responsibility IDs, role IDs, `exempted`) of the persons of a household.
+    key: tuple
+    members: List[PersonPlayer]
+    # Indexes of the dates of the period that any grade of the members' family (`PersonPlayer.grade_classes`) is exempted on.
+    exempted: Tuple[int, ...]
+    # Dates the members were assigned on before the allocation. Only a class of a single person or of a household can have any.
+    history: Tuple[datetime.date, ...] = ()
+    # Set when the members are of the same household, i.e. they count as a single person.
+    household_id: Optional[int] = None
+
+
+class GjRosterCompression:
+    """
+    @summary: Groups the persons of a `PersonBank` into `GjPersonClass`es: same responsibilities, same roles, exempted on
+      the same dates, and not assigned on any date yet. A person with any assigned date is a class of its own.
+      On a school roster there are a few dozens of classes no matter how many families there are.
+      Persons of a household that the ingest didn't collapse (`PersonBank.households`) are a class of the household.
+    """
+    def __init__(self, logger_obj: logging.Logger=None):
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+
+    @staticmethod
+    def dates_assigned(dates: List[WorkDate]) -> Dict[int, List[datetime.date]]:
+        """
+        @return: Person ID -> dates the person is already an assignee of in `dates`.
+        """
+        dates_per_person = {}
+        for date_wd in dates:
+            for _, assignees, _ in GjSolutionValidator.slots(date_wd):
+                for person in assignees:
+                    dates_per_person.setdefault(person.id, []).append(date_wd.date)
+        return dates_per_person
+
+    def classes(self, person_bank: PersonBank, dates: List[WorkDate]) -> List[GjPersonClass]:
+        """
+        @param dates: All the dates of the period, including those already filled.
+        @return: In the order of the first member of each class in `person_bank`, each class' members in the same order.
+        """
+        _dates_assigned = self.dates_assigned(dates)
+        _dates_exempting = [(idx, date_wd.exempt_conditions) for idx, date_wd in enumerate(dates) if date_wd.exempt_conditions]
+        # Grades of a family -> indexes of the dates they're exempted on. There are only a few dozens of grades,
+        # and few combinations of them.
+        _exempted_per_grade = {}
+        classes: Dict[tuple, GjPersonClass] = {}
+        _households = person_bank.households if (person_bank.households and person_bank.households.has_shared) else None
+        # Class key -> dates assigned before, of the classes of households.
+        _history_per_household = {}
+        for person in person_bank.persons.values():
+            _grade = tuple(map(str, person.grade_classes))
+            if _grade not in _exempted_per_grade:
+                _exempted_per_grade[_grade] = tuple(idx for idx, conditions in _dates_exempting
+                                                    if GradeUtil.included_any_grade(person.grade_classes, conditions))
+            _exempted = _exempted_per_grade[_grade]
+            # Same as `GjVolunteerAllocationGame.can_assign`, only the last date matters for the spacing.
+            _last_assigned = person.last_assigned_date
+            _history = ([_last_assigned.date] if _last_assigned else []) + _dates_assigned.get(person.id, [])
+            key = (tuple(sorted(resp.id for resp in person.responsibilities)),
+                   tuple(sorted(str(role.id) for role in person.roles)),
+                   _exempted)
+            _household_id = _households.household_id(person.id) if _households else None
+            if (_household_id is not None) and (1 < len(_households.members(_household_id))):
+                key = (_household_id,) + key
+                classes.setdefault(key, GjPersonClass(key, [], _exempted, household_id=_household_id)).members.append(person)
+                _history_per_household.setdefault(key, set()).update(_history)
+            elif _history:
+                classes[(person.id,)] = GjPersonClass((person.id,), [person], _exempted, tuple(sorted(set(_history))))
+            else:
+                classes.setdefault(key, GjPersonClass(key, [], _exempted)).members.append(person)
+        for key, history in _history_per_household.items():
+            classes[key] = classes[key]._replace(history=tuple(sorted(history)))
+        self._logger.info(f"{len(person_bank.persons)} persons in {len(classes)} classes.")
+        return list(classes.values())
+
+
+class _ClassState:
+    """
+    @summary: Assignments of a `GjPersonClass` during the allocation. The members are taken round-robin, so the next member
+      is always the least loaded and least recently assigned one, and the state of the class is only its counts.
+      A class of a household is counted and limited by `GjHouseholdLoad` instead, shared with the other classes of
+      the household (e.g. its rows of another responsibility) and with `GjVolunteerAllocationGame`.
+    """
+    def __init__(self, person_class: GjPersonClass, num_assigned: int, household_load: GjHouseholdLoad=None):
+        self.person_class = person_class
+        self.household_load = household_load if person_class.household_id is not None else None
+        # The persons of a household are taken in turn, but count as one.
+        self.size = 1 if person_class.household_id is not None else len(person_class.members)
+        # Number of assignments so far. Member `total % size` is the next one.
+        self.total = num_assigned
+        # (date, number of members taken on it), oldest first.
+        self.picks: List[Tuple[datetime.date, int]] = [(date_assigned, 1) for date_assigned in person_class.history]
+
+    @property
+    def load(self) -> float:
+        """
+        @return: Number of the dates per member.
+        """
+        if self.household_load:
+            return self.household_load.num_dates(self.person_class.household_id)
+        return self.total / self.size
+
+    def available(self, date: datetime.date, interval: int, responsibility: RespLvl, max_stint: Optional[int], overbook: bool=False) -> int:
+        """
+        @param max_stint: Max number of dates per member, or None for no limit. Not used for a household, see `GjHouseholdLoad.max_dates`.
+        @param overbook: If True, 1 more date than `max_stint` is allowed, as the overbooking of the game does.
+        @return: Number of members that can be taken next on `date`, i.e. not assigned within `interval` days
+          and with less than `max_stint` dates.
+        """
+        if self.household_load:
+            _household_id = self.person_class.household_id
+            return int(not (self.household_load.too_soon(_household_id, date, interval)
+                            or self.household_load.full(_household_id, responsibility, overbook)))
+        if overbook and (max_stint is not None):
+            max_stint += 1
+        # Members taken within the interval are the most recent ones in the round.
+        _recent = sum(num for date_picked, num in self.picks if abs((date - date_picked).days) <= interval)
+        _available = max(self.size - _recent, 0)
+        if max_stint is not None:
+            _round, _next = divmod(self.total, self.size)
+            if max_stint <= _round:
+                return 0
+            if max_stint == _round + 1:
+                _available = min(_available, self.size - _next)
+        return _available
+
+    def take(self, date: datetime.date, num: int):
+        if self.household_load:
+            for _ in range(num):
+                self.household_load.add(self.person_class.household_id, date)
+        self.total += num
+        if self.picks and self.picks[-1][0] == date:
+            self.picks[-1] = (date, self.picks[-1][1] + num)
+        else:
+            self.picks.append((date, num))
+
+
+class GjClassAllocation:
+    """
+    @summary: Allocates the slots of the dates to `GjPersonClass`es instead of to persons, then spreads the count of each
+      class to its members round-robin. The allocation costs O(dates * slots * classes), independent of the number of persons.
+
+      Same rules as `GjVolunteerAllocationGame.assign_person`: the responsibilities of the duty
+      (`DateRequirement.RESPONSIBILITIES_PER_DUTY`) are filled in order on each date, by persons eligible for the slot
+      (`GjSolutionValidator.eligible`), not in the roles excluded from the duty, not exempted on the date,
+      apart by `interval_assigneddates_*` and within `Consts.ATTR_MAX_STINT_OPPORTUNITIES` dates.
+      A household whose persons are not collapsed is limited by `GjHouseholdLoad` as in the game.
+      When a slot is still short, a date more than the max is allowed, as the overbooking of the game does.
+      Within those rules, each slot goes to the class whose members have the fewest dates per member.
+    """
+    def __init__(self, logger_obj: logging.Logger=None):
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self._compression = GjRosterCompression(self._logger)
+
+    def quotas(self,
+               dates: List[WorkDate],
+               person_bank: PersonBank,
+               requirements: DateRequirement,
+               dates_period: List[WorkDate]=None,
+               household_load: GjHouseholdLoad=None) -> Tuple[List[GjPersonClass], Dict[Tuple[int, RespLvl], Counter]]:
+        """
+        @param dates: Dates to allocate, in the order to fill. Must be in `dates_period`.
+        @param dates_period: All the dates of the period incl. those already filled. If None, `dates`.
+        @param household_load: Updated as the slots are allocated. If None, `GjHouseholdLoad.of` the persons and `dates_period`.
+        @return: Classes, and (index in `dates`, responsibility) -> number of members to take per index of the class.
+        @raise ValueError: When `requirements.type_duty` is not one of `DateRequirement.RESPONSIBILITIES_PER_DUTY`.
+        """
+        if requirements.type_duty not in DateRequirement.RESPONSIBILITIES_PER_DUTY:
+            raise ValueError(f"{requirements.type_duty=} were not identified.")
+        dates_period = dates_period or dates
+        _excluded_roles = {role.value for role in DateRequirement.EXCLUDED_ROLES_PER_DUTY[requirements.type_duty]}
+        classes = [person_class for person_class in self._compression.classes(person_bank, dates_period)
+                   if not any(role.id in _excluded_roles for role in person_class.members[0].roles)]
+        _dates_assigned = Counter(person_id for person_id, dates_assigned in self._compression.dates_assigned(dates_period).items()
+                                  for _ in dates_assigned)
+        if household_load is None:
+            household_load = GjHouseholdLoad.of(person_bank, dates_period, self._logger)
+        states = [_ClassState(person_class, sum(_dates_assigned[member.id] for member in person_class.members), household_load)
+                  for person_class in classes]
+        _intervals = GjSolutionValidator.intervals(requirements)
+        _max_allowance = person_bank.max_allowance or {}
+        _idx_per_date = {id(date_wd): idx for idx, date_wd in enumerate(dates_period)}
+
+        quotas = {}
+        for date_idx, date_wd in enumerate(dates):
+            _idx_period = _idx_per_date[id(date_wd)]
+            for resp, assignees, required in GjSolutionValidator.slots(date_wd, requirements.type_duty):
+                _num_needed = required - len(assignees)
+                if _num_needed <= 0:
+                    continue
+                _allowance = _max_allowance.get(resp)
+                _max_stint = _allowance.get(Consts.ATTR_MAX_STINT_OPPORTUNITIES) if _allowance else None
+                _candidates = [(state_idx, state) for state_idx, state in enumerate(states)
+                               if (_idx_period not in state.person_class.exempted)
+                               and GjSolutionValidator.eligible(state.person_class.members[0], resp, requirements.type_duty)]
+                _quota = Counter()
+                for overbook in (False, True):
+                    while _num_needed:
+                        _available = [(state.load, state_idx, state) for state_idx, state in _candidates
+                                      if state.available(date_wd.date, _intervals[resp], resp, _max_stint, overbook)]
+                        if not _available:
+                            break
+                        _, state_idx, state = min(_available, key=lambda load_idx_state: load_idx_state[:2])
+                        state.take(date_wd.date, 1)
+                        _quota[state_idx] += 1
+                        _num_needed -= 1
+                    if (not _num_needed) or overbook or ((_max_stint is None) and (household_load is None)):
+                        break
+                    self._logger.warning(f"Overbooking is triggered for {date_wd.name}, {resp}.")
+                quotas[(date_idx, resp)] = _quota
+        return classes, quotas
+
+    def assign(self,
+               dates: List[WorkDate],
+               person_bank: PersonBank,
+               requirements: DateRequirement,
+               dates_period: List[WorkDate]=None,
+               household_load: GjHouseholdLoad=None) -> List[WorkDate]:
+        """
+        @summary: Fills `dates` by `quotas`, taking the members of each class round-robin.
+          The persons and the dates are updated as `GjVolunteerAllocationGame.assign_unchecked` does.
+        @return: `dates`
+        """
+        classes, quotas = self.quotas(dates, person_bank, requirements, dates_period, household_load)
+        # Index of the next member of each class. A class with history is a single person or a household.
+        _next = [0] * len(classes)
+        for (date_idx, resp), quota in quotas.items():
+            date_wd = dates[date_idx]
+            for class_idx, num in quota.items():
+                members = classes[class_idx].members
+                for _ in range(num):
+                    person = members[_next[class_idx] % len(members)]
+                    _next[class_idx] += 1
+                    date_wd.assign_responsibility(resp, person)
+                    person.assign_myself(AssignedDate(date_wd.date, resp))
+        return dates
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import datetime
+import json
+import logging
+import os
+from typing import Dict, Iterator, List, NamedTuple, TextIO
+
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from gj.util import GjUtil
+from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
+from n_to_n_matching.person_player import PersonPlayer
+from n_to_n_matching.workdate_player import WorkDate
+
+
+class GjAssignment(NamedTuple):
+    """
+    @summary: A person assigned on a date, as `GjExporter.iter_assignments` yields.
+    """
+    date: WorkDate
+    responsibility: RespLvl
+    person: PersonPlayer
+
+
+class GjExporter(ABC):
+    """
+    @summary: Writes a `GjVolunteerMatching` into a file, one assignment at a time as they are read from the assignee lists
+      of `GjVolunteerMatching.dates_lgtm`, so nothing proportional to the solution is built in between.
+    """
+    COLUMNS = ("date", "duty", "responsibility", "person_id", "name", "grade_class", "email", "phone")
+    EXTENSION = ""
+    ENCODING = "utf-8"
+
+    def __init__(self, logger_obj: logging.Logger=None):
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+
+    @classmethod
+    def output_name(cls, stem: str) -> str:
+        """
+        @return: Name of what `export` writes for `stem`, e.g. "<stem>.csv".
+        """
+        return f"{stem}{cls.EXTENSION}"
+
+    @staticmethod
+    def iter_assignments(solution: GjVolunteerMatching) -> Iterator[GjAssignment]:
+        """
+        @summary: In the order of the dates in `solution`. Within a date, the leader(s) come first, then committee members,
+          then the other guardians, same as `gj.printing.GjDocx.distributable_rows`.
+        """
+        for date_wd in solution.dates_lgtm:
+            for persons, responsibility in ((date_wd.assignees_leader, RespLvl.LEADER),
+                                            (date_wd.assignees_committee, RespLvl.COMMITTEE),
+                                            (date_wd.assignees_noncommittee, RespLvl.GENERAL)):
+                for person in persons:
+                    yield GjAssignment(date_wd, responsibility, person)
+
+    @staticmethod
+    def fields(assignment: GjAssignment, duty: str) -> tuple:
+        """
+        @return: Values of `COLUMNS` of `assignment`.
+        """
+        person = assignment.person
+        return (assignment.date.name, duty, assignment.responsibility.name, person.id, person.name,
+                None if person.grade_class is None else str(person.grade_class), person.email_addr, person.phone_num)
+
+    @abstractmethod
+    def write(self, solution: GjVolunteerMatching, stream: TextIO) -> int:
+        """
+        @return: Number of the assignments written.
+        """
+        raise NotImplementedError()
+
+    def export(self, solution: GjVolunteerMatching, path: str) -> str:
+        """
+        @param path: Of the file to write. Overwritten if it exists.
+        @return: `path`
+        """
+        with open(path, "w", encoding=self.ENCODING, newline="") as f:
+            _num = self.write(solution, f)
+        self._logger.info(f"{_num} assignments written to {path}")
+        return path
+
+
+class GjCsvExporter(GjExporter):
+    """
+    @summary: A row per assignment under a header row of `COLUMNS`, e.g. as the data source of a mail merge.
+    """
+    EXTENSION = ".csv"
+    # With the BOM, Excel opens the file as UTF-8 rather than as the locale encoding.
+    ENCODING = "utf-8-sig"
+
+    def write(self, solution: GjVolunteerMatching, stream: TextIO) -> int:
+        _duty = solution.reqs.type_duty.value
+        writer = csv.writer(stream)
+        writer.writerow(self.COLUMNS)
+        _num = 0
+        for assignment in self.iter_assignments(solution):
+            writer.writerow(self.fields(assignment, _duty))
+            _num += 1
+        return _num
+
+
+class GjJsonExporter(GjExporter):
+    """
+    @summary: A single JSON object: `{"duty": ..., "assignments": [{<COLUMNS>: ...}, ...]}`.
+      The array is written an element at a time instead of dumping the whole object at once.
+    """
+    EXTENSION = ".json"
+    ATTR_DUTY = "duty"
+    ATTR_ASSIGNMENTS = "assignments"
+
+    def write(self, solution: GjVolunteerMatching, stream: TextIO) -> int:
+        _duty = solution.reqs.type_duty.value
+        stream.write(f'{{{json.dumps(self.ATTR_DUTY)}: {json.dumps(_duty, ensure_ascii=False)}, {json.dumps(self.ATTR_ASSIGNMENTS)}: [')
+        _num = 0
+        for assignment in self.iter_assignments(solution):
+            if _num:
+                stream.write(",")
+            stream.write("\n")
+            stream.write(json.dumps(dict(zip(self.COLUMNS, self.fields(assignment, _duty))), ensure_ascii=False))
+            _num += 1
+        stream.write("\n]}\n")
+        return _num
+
+
+class GjIcsExporter(GjExporter):
+    """
+    @summary: An iCalendar (RFC 5545) file per person, with an all-day event per date the person is assigned on.
+      The files are independent of each other, so they are written by a pool of threads.
+    """
+    EXTENSION = ".ics"
+    PRODID = "-//Kinu Garage//nton_matching//JA"
+    UID_DOMAIN = "gjls.org"
+    # Content lines longer than this (in octets, excluding CRLF) are folded.
+    _LEN_LINE_MAX = 75
+
+    @classmethod
+    def output_name(cls, stem: str) -> str:
+        """
+        @return: Name of the directory, without `EXTENSION` as it's not a calendar file itself, e.g. "<stem>_ics".
+        """
+        return f"{stem}_{cls.EXTENSION.lstrip('.')}"
+
+    def __init__(self, max_workers: int=None, logger_obj: logging.Logger=None):
+        """
+        @param max_workers: Number of threads writing the files. If None, `ThreadPoolExecutor` default.
+        """
+        super().__init__(logger_obj)
+        self._max_workers = max_workers
+
+    @staticmethod
+    def escape(text: str) -> str:
+        return str(text).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+    @classmethod
+    def fold(cls, line: str) -> str:
+        """
+        @summary: Splits `line` into lines of up to `_LEN_LINE_MAX` octets in UTF-8 without splitting a character,
+          each but the first starting with a space.
+        """
+        if len(line.encode("utf-8")) <= cls._LEN_LINE_MAX:
+            return line
+        _folded = []
+        _current, _len = [], 0
+        for char in line:
+            _len_char = len(char.encode("utf-8"))
+            # The leading space of a continuation line counts.
+            if cls._LEN_LINE_MAX < _len + _len_char:
+                _folded.append("".join(_current))
+                _current, _len = [" "], 1
+            _current.append(char)
+            _len += _len_char
+        _folded.append("".join(_current))
+        return "\r\n".join(_folded)
+
+    def persons_assignments(self, solution: GjVolunteerMatching) -> Dict[int, List[GjAssignment]]:
+        """
+        @return: Person ID -> the assignments of the person in the order of the dates.
+        """
+        _per_person = {}
+        for assignment in self.iter_assignments(solution):
+            _per_person.setdefault(assignment.person.id, []).append(assignment)
+        return _per_person
+
+    def write_person(self, assignments: List[GjAssignment], duty: str, stream: TextIO, timestamp: str) -> int:
+        """
+        @param assignments: Of a single person.
+        @param timestamp: DTSTAMP of the events, in UTC e.g. "20250607T120000Z".
+        """
+        def _line(text):
+            stream.write(self.fold(text))
+            stream.write("\r\n")
+
+        _line("BEGIN:VCALENDAR")
+        _line("VERSION:2.0")
+        _line(f"PRODID:{self.PRODID}")
+        _line("CALSCALE:GREGORIAN")
+        for assignment in assignments:
+            _date = assignment.date.date
+            _line("BEGIN:VEVENT")
+            _line(f"UID:{_date.isoformat()}-{assignment.responsibility.name.lower()}-{assignment.person.id}@{self.UID_DOMAIN}")
+            _line(f"DTSTAMP:{timestamp}")
+            _line(f"DTSTART;VALUE=DATE:{_date.strftime('%Y%m%d')}")
+            _line(f"DTEND;VALUE=DATE:{(_date + datetime.timedelta(days=1)).strftime('%Y%m%d')}")
+            _line(f"SUMMARY:{self.escape(duty)} ({assignment.responsibility.name.lower()})")
+            _line("END:VEVENT")
+        _line("END:VCALENDAR")
+        return len(assignments)
+
+    def write(self, solution: GjVolunteerMatching, stream: TextIO) -> int:
+        """
+        @summary: All the persons in a single calendar, e.g. for the organizers. Use `export` for a file per person.
+        """
+        _timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        return self.write_person(list(self.iter_assignments(solution)), solution.reqs.type_duty.value, stream, _timestamp)
+
+    def export(self, solution: GjVolunteerMatching, path: str) -> str:
+        """
+        @summary: Same as `export_persons`, for the contract of `GjExporter.export`.
+        @return: `path`, the directory.
+        """
+        self.export_persons(solution, path)
+        return path
+
+    def export_persons(self, solution: GjVolunteerMatching, path: str) -> List[str]:
+        """
+        @param path: Directory to write "<person ID>.ics" into. Made if it doesn't exist. Existing files are overwritten.
+        @return: Paths of the files written.
+        """
+        os.makedirs(path, exist_ok=True)
+        _duty = solution.reqs.type_duty.value
+        _timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+        def _export_person(person_id, assignments):
+            _path = os.path.join(path, f"{person_id}{self.EXTENSION}")
+            # iCalendar requires CRLF, which is written as is.
+            with open(_path, "w", encoding=self.ENCODING, newline="") as f:
+                self.write_person(assignments, _duty, f, _timestamp)
+            return _path
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            paths = list(executor.map(lambda item: _export_person(*item), self.persons_assignments(solution).items()))
+        self._logger.info(f"{len(paths)} calendars written to {path}")
+        return paths
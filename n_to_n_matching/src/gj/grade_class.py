@@ -71,16 +71,32 @@ class GjGradeGroup(Enum):
 
 
 class GradeUtil():
+    _GRADES_BY_VALUE = {gr.value: gr for gr in GjGrade}
+
     @staticmethod
     def find_grade(grade: str, logger=None) -> GjGrade:
-        if not logger:
-            logger = NtonUtil.get_logger()
-        
-        for gr in GjGrade:
-            logger.debug(f"Given grade: {grade}")
-            if grade == gr.value:
-                return gr
-        return None
+        """
+        @return: None if `grade` doesn't match any `GjGrade`.
+        """
+        return GradeUtil._GRADES_BY_VALUE.get(grade)
+
+    @staticmethod
+    def exemption_group(value):
+        """
+        @summary: For the grades exempted on a date as written in an input file, where a group can be given by its name (e.g. "ELEM_SHOU").
+        @return: `GjGradeGroup` if `value` is the name of one, otherwise `value` as is (e.g. `GjGradeGroup`, or a grade "小1－1"),
+          as `included_grade` takes.
+        """
+        if isinstance(value, str) and (value in GjGradeGroup.__members__):
+            return GjGradeGroup[value]
+        return value
+
+    @staticmethod
+    def included_any_grade(in_grades: List[GjGrade], group, logger=None) -> bool:
+        """
+        @summary: `included_grade` for any of `in_grades`, e.g. the grades of the children of a family (`PersonPlayer.grade_classes`).
+        """
+        return any(GradeUtil.included_grade(in_grade, group, logger=logger) for in_grade in in_grades)
 
     @staticmethod
     def included_grade(in_grade: GjGrade, group, logger=None) -> bool:
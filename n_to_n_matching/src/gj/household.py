@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import logging
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import unicodedata
+
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from gj.util import GjUtil
+from n_to_n_matching.person_player import PersonBank
+from n_to_n_matching.workdate_player import WorkDate
+
+
+class GjHouseholdIndex:
+    """
+    @summary: Which family rows belong to the same household, keyed by the guardian and the contact of a row
+      (`key`), built in the same pass as the rows are read.
+      A household with several children may be in the master as one row with the siblings in the sibling columns,
+      or as a row per child. `collapse` merges the latter into one row, so that a household gets its duty once.
+
+      The ID of a household is the ID of its first row. Person IDs of the other rows stay resolvable by `household_id`.
+    """
+    _RE_NON_DIGIT = re.compile(r"\D")
+    _RE_SPACE = re.compile(r"\s+")
+
+    def __init__(self, logger_obj: logging.Logger=None):
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self._household_per_key: Dict[Tuple[str, str], int] = {}
+        self._household_per_person: Dict[int, int] = {}
+        self._members: Dict[int, List[int]] = {}
+
+    @classmethod
+    def normalize(cls, text) -> str:
+        """
+        @return: Width (NFKC), case and white spaces folded. "" for None.
+        """
+        if text is None:
+            return ""
+        return cls._RE_SPACE.sub("", unicodedata.normalize("NFKC", str(text))).casefold()
+
+    @classmethod
+    def key(cls, guardian_name, email, phone) -> Optional[Tuple[str, str]]:
+        """
+        @return: (guardian, contact), where contact is the e-mail, or the digits of the phone when there's no e-mail.
+          None when either is missing, i.e. the row can't be told the same household as any other.
+        """
+        _contact = cls.normalize(email) or cls._RE_NON_DIGIT.sub("", cls.normalize(phone))
+        _guardian = cls.normalize(guardian_name)
+        if not (_guardian and _contact):
+            return None
+        return _guardian, _contact
+
+    def add(self, person_id: int, guardian_name, email, phone) -> int:
+        """
+        @return: ID of the household of the person.
+        """
+        key = self.key(guardian_name, email, phone)
+        household_id = self._household_per_key.setdefault(key, person_id) if key else person_id
+        self._household_per_person[person_id] = household_id
+        self._members.setdefault(household_id, []).append(person_id)
+        return household_id
+
+    def household_id(self, person_id: int) -> int:
+        """
+        @return: `person_id` itself when the person is not indexed.
+        """
+        return self._household_per_person.get(person_id, person_id)
+
+    def members(self, household_id: int) -> List[int]:
+        """
+        @return: Person IDs in the order added, including those collapsed.
+        """
+        return self._members.get(household_id, [household_id])
+
+    @property
+    def households(self) -> Dict[int, List[int]]:
+        return self._members
+
+    @property
+    def has_shared(self) -> bool:
+        """
+        @return: True if any household has more than one person.
+        """
+        return len(self._members) < len(self._household_per_person)
+
+    def collapse(self, records: Iterable, fields: Tuple[str, str, str]=("guardian_name", "email", "phone")) -> Iterator:
+        """
+        @summary: Indexes `records`, and yields one record per household: the first row of the household, with the grade
+          of the others added to its `siblings`, and its `exempted_on` filled by the others' if empty.
+          The grades in `siblings` exempt the household on a date as its own grade does (`PersonPlayer.grade_classes`),
+          so no exemption is lost whichever row comes first.
+          Consumes all of `records` before yielding.
+        @param records: `gj.spreadsheet_access.GjPersonRecord`, or any named tuple with `fields`, "id", "grade_class",
+          "siblings" and "exempted_on".
+        """
+        _firsts = {}
+        for record in records:
+            household_id = self.add(record.id, *(getattr(record, field) for field in fields))
+            first = _firsts.get(household_id)
+            if first is None:
+                _firsts[household_id] = record
+                continue
+            self._logger.info(f"ID {record.id} at row {record.row_id} is the same household as ID {household_id}. Collapsed.")
+            _siblings = tuple(dict.fromkeys(first.siblings + tuple(
+                str(grade) for grade in (record.grade_class,) + tuple(record.siblings) if grade and (grade != first.grade_class))))
+            _exempted_on = first.exempted_on
+            if record.exempted_on and (record.exempted_on != first.exempted_on):
+                if first.exempted_on:
+                    self._logger.warning(f"ID {record.id} is '{record.exempted_on}' while ID {household_id} of the same household is '{first.exempted_on}'. Keeping the latter.")
+                else:
+                    _exempted_on = record.exempted_on
+            _firsts[household_id] = first._replace(siblings=_siblings, exempted_on=_exempted_on)
+        if self.has_shared:
+            self._logger.warning(f"{len(self._household_per_person)} rows collapsed into {len(self._members)} households.")
+        yield from _firsts.values()
+
+
+class GjHouseholdLoad:
+    """
+    @summary: Number of the dates and the last date assigned per household, updated in O(1) per assignment,
+      and the limits on them. The single place that limits a household whose persons are not collapsed, for both
+      `GjVolunteerAllocationGame` and `GjClassAllocation`.
+
+      The rules are the same as a person's (`GjUtil.find_free_workers`, `GjVolunteerAllocationGame.can_assign`), applied
+      to the household as a whole:
+      - Dates of every responsibility count against the max stint of the slot being filled (`max_stint`), and when
+        overbooking, a household at the max can take 1 more.
+      - The last date of the household, whichever responsibility it was, must be more than the interval of the slot being
+        filled before the date.
+      A household collapsed into a single person at ingest is limited by these rules as that person.
+    """
+    def __init__(self, index: GjHouseholdIndex, max_stint: Dict[RespLvl, int]=None):
+        """
+        @param max_stint: Responsibility -> max number of the dates per household, e.g. `GjUtil.max_stint_per_household`.
+          No limit for a responsibility not in it.
+        """
+        self._index = index
+        self._max_stint = max_stint or {}
+        self._num_dates: Dict[int, int] = {}
+        self._last_date: Dict[int, datetime.date] = {}
+
+    @classmethod
+    def of(cls, person_bank: PersonBank, dates: List[WorkDate], logger: logging.Logger=None) -> Optional["GjHouseholdLoad"]:
+        """
+        @summary: The load of the households of `person_bank` (`PersonBank.households`), with the max stint per household
+          for `dates`, and the dates the persons are already assigned on (incl. `PersonPlayer.last_assigned_date` before the period).
+        @param dates: All the dates of the period, including those already filled.
+        @return: None when no household has more than one person, i.e. the limits per person are the limits per household.
+        """
+        if not (person_bank.households and person_bank.households.has_shared):
+            return None
+        load = cls(person_bank.households, GjUtil.max_stint_per_household(dates, person_bank, logger))
+        for person in person_bank.persons.values():
+            if person.last_assigned_date:
+                load.add(person.id, person.last_assigned_date.date, count=False)
+        for date in dates:
+            for person in date.assignees_leader + date.assignees_committee + date.assignees_noncommittee:
+                load.add(person.id, date.date)
+        return load
+
+    def add(self, person_id: int, date: datetime.date, count: bool=True):
+        """
+        @param count: If False, only the last date is updated, e.g. for a date before the period.
+        """
+        household_id = self._index.household_id(person_id)
+        if count:
+            self._num_dates[household_id] = self._num_dates.get(household_id, 0) + 1
+        _last_date = self._last_date.get(household_id)
+        if (_last_date is None) or (_last_date < date):
+            self._last_date[household_id] = date
+
+    def num_dates(self, person_id: int) -> int:
+        """
+        @return: Number of the dates of the household of the person.
+        """
+        return self._num_dates.get(self._index.household_id(person_id), 0)
+
+    def max_dates(self, responsibility: RespLvl, overbook: bool=False) -> Optional[int]:
+        """
+        @return: Max number of the dates a household can have to take a slot of `responsibility`. None for no limit.
+        """
+        _max_stint = self._max_stint.get(responsibility)
+        if _max_stint is None:
+            return None
+        return _max_stint + 1 if overbook else _max_stint
+
+    def full(self, person_id: int, responsibility: RespLvl, overbook: bool=False) -> bool:
+        """
+        @return: True if the household of the person already has `max_dates` dates.
+        """
+        _max_dates = self.max_dates(responsibility, overbook)
+        return (_max_dates is not None) and (_max_dates <= self.num_dates(person_id))
+
+    def too_soon(self, person_id: int, date: datetime.date, req_space_days: int) -> bool:
+        """
+        @return: True if the household of the person has a date within `req_space_days` days before `date`, or on it,
+          as `GjVolunteerAllocationGame.can_assign` judges for a person.
+        """
+        _last_date = self._last_date.get(self._index.household_id(person_id))
+        return (_last_date is not None) and ((date - _last_date).days <= req_space_days)
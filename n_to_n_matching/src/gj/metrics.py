@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from gj.requirements import Consts
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from gj.validator import GjSolutionValidator
+from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
+from n_to_n_matching.person_player import PersonBank
+
+
+class GjSolutionMetrics:
+    """
+    @summary: Fairness and load distribution of a solution as NumPy arrays, e.g. to compare solver runs or parameters.
+      The assignments are read once into flat arrays (person, responsibility, day), from which every metric is computed vectorized,
+      so this can be made for every candidate in a search loop.
+
+      The load of a person is the number of dates assigned. Persons whose responsibility is `TOUBAN_EXEMPT` are left out,
+      and the others are all in the load vectors incl. the ones assigned on no date.
+    """
+    # Columns of `loads`.
+    RESPONSIBILITIES = (RespLvl.LEADER, RespLvl.COMMITTEE, RespLvl.GENERAL)
+
+    def __init__(self, solution: GjVolunteerMatching, person_bank: PersonBank=None):
+        """
+        @param person_bank: If None, `solution.person_bank`. Persons assigned but not in the bank are added.
+        """
+        bank = person_bank or solution.person_bank
+        self._solution = solution
+        self._type_duty = solution.reqs.type_duty
+        self._max_allowance = (bank.max_allowance if bank else None) or solution.max_allowance or {}
+
+        self._positions: Dict[int, int] = {}
+        _person_resps = []
+        for person in (bank.persons.values() if bank else ()):
+            _resp = person.responsibilities[0].id if person.responsibilities else RespLvl.UNDEFINED
+            if _resp != RespLvl.TOUBAN_EXEMPT:
+                self._positions[person.id] = len(_person_resps)
+                _person_resps.append(_resp)
+
+        _persons, _resps, _days = [], [], []
+        _dates = list(solution.dates_lgtm) + list(solution.dates_failed or [])
+        _required = np.zeros((len(_dates), len(self.RESPONSIBILITIES)), dtype=np.int64)
+        _assigned = np.zeros_like(_required)
+        for idx_date, date_wd in enumerate(_dates):
+            _day = date_wd.date.toordinal()
+            _required[idx_date] = date_wd.get_required_persons()
+            for idx_resp, persons in enumerate((date_wd.assignees_leader, date_wd.assignees_committee, date_wd.assignees_noncommittee)):
+                _assigned[idx_date, idx_resp] = len(persons)
+                for person in persons:
+                    _pos = self._positions.get(person.id)
+                    if _pos is None:
+                        _pos = self._positions[person.id] = len(_person_resps)
+                        _person_resps.append(person.responsibilities[0].id if person.responsibilities else RespLvl.UNDEFINED)
+                    _persons.append(_pos)
+                    _resps.append(idx_resp)
+                    _days.append(_day)
+
+        self._num_persons = len(_person_resps)
+        self._person_resps = np.array(_person_resps, dtype=np.int64)
+        self._assign_persons = np.array(_persons, dtype=np.int64)
+        self._assign_resps = np.array(_resps, dtype=np.int64)
+        self._assign_days = np.array(_days, dtype=np.int64)
+        self._required = _required
+        self._assigned = _assigned
+        self._loads = np.bincount(self._assign_persons * len(self.RESPONSIBILITIES) + self._assign_resps,
+                                  minlength=self._num_persons * len(self.RESPONSIBILITIES)).reshape(self._num_persons, len(self.RESPONSIBILITIES))
+
+    @property
+    def person_ids(self) -> np.ndarray:
+        """
+        @return: Person ID of each row of `loads`.
+        """
+        return np.fromiter(self._positions, dtype=np.int64, count=len(self._positions))
+
+    @property
+    def loads(self) -> np.ndarray:
+        """
+        @return: (persons, `RESPONSIBILITIES`) number of the dates assigned.
+        """
+        return self._loads
+
+    def load_vector(self, responsibility: RespLvl=None) -> np.ndarray:
+        """
+        @param responsibility: If None, the total of all the responsibilities of every person.
+        @return: Load of each person eligible for `responsibility` of the duty of the solution (see `GjSolutionValidator.eligible_responsibilities`),
+          in the order of `person_ids`.
+        """
+        if responsibility is None:
+            return self._loads.sum(axis=1)
+        _col = self.RESPONSIBILITIES.index(responsibility)
+        _eligible = GjSolutionValidator.eligible_responsibilities(responsibility, self._type_duty)
+        return self._loads[np.isin(self._person_resps, np.array(_eligible, dtype=np.int64)), _col]
+
+    @staticmethod
+    def gini(loads: np.ndarray) -> float:
+        """
+        @return: 0 when every load is the same, up to (n - 1) / n when one takes all.
+        """
+        _total = loads.sum()
+        if (loads.size == 0) or (_total == 0):
+            return 0.0
+        _sorted = np.sort(loads)
+        return float(2 * np.dot(np.arange(1, loads.size + 1), _sorted) / (loads.size * _total) - (loads.size + 1) / loads.size)
+
+    def max_stint(self, responsibility: RespLvl) -> Optional[int]:
+        _allowance = self._max_allowance.get(responsibility)
+        return _allowance.get(Consts.ATTR_MAX_STINT_OPPORTUNITIES) if _allowance else None
+
+    def num_over_allowance(self, responsibility: RespLvl) -> int:
+        """
+        @return: Number of the persons whose load of `responsibility` exceeds its `Consts.ATTR_MAX_STINT_OPPORTUNITIES`. 0 if unknown.
+        """
+        _max = self.max_stint(responsibility)
+        return 0 if _max is None else int(np.count_nonzero(self.load_vector(responsibility) > _max))
+
+    def unfilled_slots(self) -> np.ndarray:
+        """
+        @return: Slots not filled over all the dates, per `RESPONSIBILITIES`.
+        """
+        return np.clip(self._required - self._assigned, 0, None).sum(axis=0)
+
+    def spacing_slack(self, intervals: Tuple[int, int, int]=None) -> np.ndarray:
+        """
+        @summary: For every 2 consecutive dates of a person, days between them beyond what's required, i.e. 0 is the minimum allowed
+          (`GjVolunteerAllocationGame.can_assign` rejects a gap of `interval` days or less) and negative is a violation.
+        @param intervals: `interval_assigneddates_*` per `RESPONSIBILITIES`, applied by the responsibility of the later date.
+          If None, taken from `solution.reqs`.
+        """
+        if intervals is None:
+            _reqs = self._solution.reqs
+            intervals = (_reqs.interval_assigneddates_leader, _reqs.interval_assigneddates_commitee, _reqs.interval_assigneddates_general)
+        if self._assign_days.size < 2:
+            return np.zeros(0, dtype=np.int64)
+        _order = np.lexsort((self._assign_days, self._assign_persons))
+        _persons, _days, _resps = self._assign_persons[_order], self._assign_days[_order], self._assign_resps[_order]
+        _same_person = _persons[1:] == _persons[:-1]
+        _gaps = (_days[1:] - _days[:-1])[_same_person]
+        return _gaps - (np.asarray(intervals, dtype=np.int64)[_resps[1:][_same_person]] + 1)
+
+    def spacing_slack_histogram(self, bin_days: int=7, intervals: Tuple[int, int, int]=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        @return: As `numpy.histogram`, with bins of `bin_days` from the smallest slack (or 0) to the largest.
+        """
+        slack = self.spacing_slack(intervals)
+        if slack.size == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(1, dtype=np.int64)
+        _start = min(int(slack.min()), 0)
+        return np.histogram(slack, bins=np.arange(_start, int(slack.max()) + bin_days + 1, bin_days))
+
+    def summary(self) -> Dict[str, float]:
+        """
+        @return: Flat dict of scalars, e.g. to be a row of a parameter sweep. Keys are "<metric>" for all the loads,
+          and "<metric>_<responsibility>" per responsibility.
+        """
+        result = {}
+        for responsibility in (None,) + self.RESPONSIBILITIES:
+            _suffix = f"_{responsibility.name.lower()}" if responsibility else ""
+            _loads = self.load_vector(responsibility)
+            result.update({
+                f"load_max{_suffix}": int(_loads.max()) if _loads.size else 0,
+                f"load_min{_suffix}": int(_loads.min()) if _loads.size else 0,
+                f"load_std{_suffix}": float(_loads.std()) if _loads.size else 0.0,
+                f"gini{_suffix}": self.gini(_loads),
+            })
+            if responsibility:
+                result[f"over_allowance{_suffix}"] = self.num_over_allowance(responsibility)
+        _unfilled = self.unfilled_slots()
+        for responsibility, num in zip(self.RESPONSIBILITIES, _unfilled):
+            result[f"unfilled_{responsibility.name.lower()}"] = int(num)
+        _slack = self.spacing_slack()
+        result["spacing_slack_min"] = int(_slack.min()) if _slack.size else 0
+        result["spacing_violations"] = int(np.count_nonzero(_slack < 0))
+        return result
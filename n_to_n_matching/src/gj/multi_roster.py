@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import os
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from gj.roster_cache import GjRosterCache
+from gj.spreadsheet_access import GjExemptionIndex, GjPersonRecord, GjToubanAccess, GjToubanAccess2024
+from gj.util import GjUtil
+from n_to_n_matching.person_player import PersonBank
+
+
+class GjRosterSource(NamedTuple):
+    """
+    @summary: A family master to ingest, e.g. a school's workbook and the sheet of a year.
+    """
+    path: str
+    # Only for .xlsx.
+    sheet_name: Optional[str] = None
+
+
+def _read_source(accessor_type: Type[GjToubanAccess], source: GjRosterSource, cache: Optional[GjRosterCache]) -> List[GjPersonRecord]:
+    # Module level so that it can be sent to a worker process.
+    return accessor_type().read_records(source.path, sheet_name=source.sheet_name, cache=cache)
+
+
+class GjMultiRosterIngest:
+    """
+    @summary: Parses several family masters concurrently in a process pool and merges them into a single `PersonBank`.
+      Parsing is CPU bound, so the wall time is about that of the slowest source rather than the sum of all.
+
+      Family IDs are only unique within a sheet, so the ID of a person is namespaced by the index of its source
+      in the list passed to `read`: `source index * id_stride + ID in the sheet`. Use `split_id` to get them back.
+    """
+    ID_STRIDE = 100000
+
+    def __init__(self,
+                 accessor_type: Type[GjToubanAccess]=GjToubanAccess2024,
+                 cache: GjRosterCache=None,
+                 max_workers: int=None,
+                 id_stride: int=ID_STRIDE,
+                 logger_obj: logging.Logger=None):
+        """
+        @param accessor_type: Instantiated in each worker to parse a source, and once here to make the persons.
+        @param cache: Used by the workers for .xlsx sources. See `GjToubanAccess.gj_xls_to_personobj`.
+        @param max_workers: Number of processes. If None, as many as the sources up to the number of CPUs.
+          With 1, or with a single source, sources are parsed in this process.
+        """
+        if id_stride < 1:
+            raise ValueError(f"'id_stride' must be positive. Got {id_stride}")
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self._accessor_type = accessor_type
+        self._accessor = accessor_type(logger_obj=self._logger)
+        self._cache = cache
+        self._max_workers = max_workers
+        self._id_stride = id_stride
+
+    @property
+    def exemption_index(self) -> Optional[GjExemptionIndex]:
+        """
+        @return: Index of the persons made by the last `read`, by namespaced person ID. See `GjToubanAccess.exemption_index`.
+        """
+        return self._accessor.exemption_index
+
+    def split_id(self, person_id: int) -> Tuple[int, int]:
+        """
+        @return: (index of the source, ID in the sheet)
+        """
+        return divmod(person_id, self._id_stride)
+
+    def read_records(self, sources: Sequence[GjRosterSource]) -> List[List[GjPersonRecord]]:
+        """
+        @return: Records of each source, in the order of `sources`.
+        """
+        _num_workers = min(len(sources), self._max_workers or os.cpu_count() or 1)
+        if _num_workers <= 1:
+            return [_read_source(self._accessor_type, source, self._cache) for source in sources]
+        self._logger.info(f"Reading {len(sources)} sources in {_num_workers} processes.")
+        with ProcessPoolExecutor(max_workers=_num_workers) as executor:
+            futures = [executor.submit(_read_source, self._accessor_type, source, self._cache) for source in sources]
+            return [future.result() for future in futures]
+
+    def read(self, sources: Sequence[GjRosterSource]) -> PersonBank:
+        """
+        @raise ValueError: When an ID in a sheet doesn't fit in `id_stride`.
+        @raise RuntimeError: When no person is made out of any of the sources.
+        """
+        sources = [GjRosterSource(*source) if isinstance(source, tuple) else GjRosterSource(source) for source in sources]
+        records_per_source = self.read_records(sources)
+
+        def _namespaced():
+            for source_idx, (source, records) in enumerate(zip(sources, records_per_source)):
+                self._logger.info(f"{len(records)} rows from '{source.path}' ({source.sheet_name=}).")
+                for record in records:
+                    if not (0 <= record.id < self._id_stride):
+                        raise ValueError(f"ID {record.id} at row {record.row_id} of '{source.path}' doesn't fit in {self._id_stride=}.")
+                    yield record._replace(id=source_idx * self._id_stride + record.id)
+
+        return self._accessor.persons_from_records(_namespaced(), ", ".join(source.path for source in sources))
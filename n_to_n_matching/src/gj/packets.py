@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import logging
+import os
+import time
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+import docx
+
+from gj.exporters import GjExporter
+from gj.printing import GjDocx, GjPdf
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from gj.role import Roles_Definition
+from gj.util import GjUtil
+from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
+
+
+class GjPacketEntry(NamedTuple):
+    date: str
+    duty: Roles_Definition
+    responsibility: RespLvl
+
+
+class GjFamilyPacket(NamedTuple):
+    """
+    @summary: What goes into the notice of a family. Plain values only, so that it's cheap to send to a worker process.
+    """
+    person_id: int
+    name: str
+    grade_class: str
+    # In the order of the dates.
+    entries: Tuple[GjPacketEntry, ...]
+
+
+class GjPacketReport(NamedTuple):
+    paths: List[str]
+    seconds: float
+
+    @property
+    def packets_per_second(self) -> float:
+        return len(self.paths) / self.seconds if self.seconds else float("inf")
+
+
+class GjPacketRenderer:
+    """
+    @summary: Renders a `GjFamilyPacket` into a file. A worker process makes one per format and output directory,
+      so e.g. the font of the PDF is registered only once per process.
+    """
+    FORMATS = ("docx", "pdf")
+    TABLE_TOP_ROW = ["日付", "当番", "担当"]
+    HEADING = "当番のお知らせ: {}"
+    PARAGRAPH_GRADE = "学級: {}"
+
+    def __init__(self, output_path: str, font_path: str=None):
+        self.output_path = output_path
+        self._font_path = font_path
+        self._pdf = None
+
+    def rows(self, packet: GjFamilyPacket) -> List[List[str]]:
+        return [[entry.date, entry.duty.value, GjDocx.RESPONSIBILITY_TEXTS[entry.responsibility]] for entry in packet.entries]
+
+    def render_docx(self, packet: GjFamilyPacket) -> str:
+        document = docx.Document()
+        document.add_heading(self.HEADING.format(packet.name), level=1)
+        if packet.grade_class:
+            document.add_paragraph(self.PARAGRAPH_GRADE.format(packet.grade_class))
+        _rows = [self.TABLE_TOP_ROW] + self.rows(packet)
+        table = document.add_table(rows=len(_rows), cols=len(self.TABLE_TOP_ROW))
+        table.style = "Table Grid"
+        for row, values in zip(table.rows, _rows):
+            for cell, value in zip(row.cells, values):
+                cell.text = value
+        path = os.path.join(self.output_path, f"{packet.person_id}.docx")
+        document.save(path)
+        return path
+
+    def render_pdf(self, packet: GjFamilyPacket) -> str:
+        if self._pdf is None:
+            self._pdf = GjPdf(self.output_path, font_path=self._font_path)
+        return self._pdf.print_table(f"{packet.person_id}.pdf", self.HEADING.format(packet.name), self.TABLE_TOP_ROW, self.rows(packet),
+                                     paragraph_before_table=self.PARAGRAPH_GRADE.format(packet.grade_class) if packet.grade_class else "")
+
+    def render(self, packet: GjFamilyPacket, file_format: str) -> str:
+        """
+        @param file_format: One of `FORMATS`.
+        @return: Path of the file.
+        """
+        if file_format not in self.FORMATS:
+            raise ValueError(f"'{file_format}' is not supported. Use one of {self.FORMATS}.")
+        return getattr(self, f"render_{file_format}")(packet)
+
+
+@functools.lru_cache(maxsize=None)
+def _renderer(output_path: str, font_path: str) -> GjPacketRenderer:
+    return GjPacketRenderer(output_path, font_path)
+
+
+def _render_packets(output_path: str, font_path: str, file_format: str, packets: List[GjFamilyPacket]) -> List[str]:
+    # Module level so that it can be sent to a worker process.
+    renderer = _renderer(output_path, font_path)
+    return [renderer.render(packet, file_format) for packet in packets]
+
+
+class GjPacketGenerator:
+    """
+    @summary: Makes a notice per family of all the dates the family is assigned on across the duties, e.g. out of the
+      solution of each of tosho, hoken and anzen. Families are split into batches rendered in a process pool.
+    """
+    def __init__(self,
+                 output_path: str,
+                 file_format: str="docx",
+                 font_path: str=None,
+                 max_workers: int=None,
+                 batch_size: int=32,
+                 logger_obj: logging.Logger=None):
+        """
+        @param file_format: One of `GjPacketRenderer.FORMATS`.
+        @param font_path: For "pdf". See `gj.printing.GjPdf`.
+        @param max_workers: Number of processes. If None, the number of CPUs. With 1, packets are rendered in this process.
+        @param batch_size: Number of packets sent to a worker at once.
+        """
+        if file_format not in GjPacketRenderer.FORMATS:
+            raise ValueError(f"'{file_format}' is not supported. Use one of {GjPacketRenderer.FORMATS}.")
+        if batch_size < 1:
+            raise ValueError(f"'batch_size' must be positive. Got {batch_size}")
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self.output_path = output_path
+        self._file_format = file_format
+        self._font_path = font_path
+        self._max_workers = max_workers
+        self._batch_size = batch_size
+
+    @staticmethod
+    def packets(solutions: Iterable[GjVolunteerMatching]) -> Dict[int, GjFamilyPacket]:
+        """
+        @summary: Indexes the assignments of `solutions` by person in a single pass over them.
+        @return: Person ID -> the packet of the person, in the order each person first appears.
+        """
+        _persons = {}
+        _entries = {}
+        for solution in solutions:
+            _duty = solution.reqs.type_duty
+            for assignment in GjExporter.iter_assignments(solution):
+                _person = assignment.person
+                if _person.id not in _persons:
+                    _persons[_person.id] = _person
+                    _entries[_person.id] = []
+                _entries[_person.id].append(GjPacketEntry(assignment.date.name, _duty, assignment.responsibility))
+        # A person without a grade has "" rather than "None".
+        return {person_id: GjFamilyPacket(person_id, person.name, "" if person.grade_class is None else str(person.grade_class),
+                                          # Date strings are "yyyy-mm-dd", so they sort as dates.
+                                          tuple(sorted(_entries[person_id], key=lambda entry: entry.date)))
+                for person_id, person in _persons.items()}
+
+    def generate(self, solutions: Iterable[GjVolunteerMatching]) -> GjPacketReport:
+        """
+        @param solutions: E.g. a solution per duty.
+        @return: The files written and how long it took.
+        """
+        _time_start = time.perf_counter()
+        os.makedirs(self.output_path, exist_ok=True)
+        packets = list(self.packets(solutions).values())
+        batches = [packets[idx:idx + self._batch_size] for idx in range(0, len(packets), self._batch_size)]
+        _num_workers = min(len(batches), self._max_workers or os.cpu_count() or 1)
+        if _num_workers <= 1:
+            paths_per_batch = [_render_packets(self.output_path, self._font_path, self._file_format, batch) for batch in batches]
+        else:
+            with ProcessPoolExecutor(max_workers=_num_workers) as executor:
+                futures = [executor.submit(_render_packets, self.output_path, self._font_path, self._file_format, batch) for batch in batches]
+                paths_per_batch = [future.result() for future in futures]
+        report = GjPacketReport([path for paths in paths_per_batch for path in paths], time.perf_counter() - _time_start)
+        self._logger.info(f"{len(report.paths)} packets written to {self.output_path} in {report.seconds:.2f} sec "
+                          f"({report.packets_per_second:.1f} packets/sec, {_num_workers} processes).")
+        return report
@@ -16,24 +16,33 @@
 
 import datetime
 import docx
-from docx.shared import Pt
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+import functools
 import logging
 import os
-from typing import List
+import re
+from typing import Iterable, Iterator, List, NamedTuple
+from xml.sax.saxutils import escape as xml_escape
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import cm
 from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Table, TableStyle
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
 from gj.requirements import DateRequirement
+from gj.responsibility import ResponsibilityLevel as RespLvl
 from n_to_n_matching.workdate_player import WorkDate
 from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
 from n_to_n_matching.util import Util as NtonUtil
 from n_to_n_matching.person_player import PersonPlayer
 
+_RE_RUN_SPECIAL_CHARS = re.compile(r"([\t\n\r])")
+
 class GjDocx():  
     def __init__(self, output_path=os.getcwd(), logger_obj: logging.Logger=None):
         self.output_path = output_path
@@ -42,40 +51,80 @@ class GjDocx():
             logger_obj = self._logger = NtonUtil.get_logger(__name__)
         self._logger = logger_obj
 
-    def _narrow_table_row_spacing(self, table, space_before=Pt(0), space_after=Pt(0)):
-        """
-        Narrows the spacing before and after paragraphs within all cells of a table.
-
-        Args:
-            table: The docx.table.Table object.
-            space_before: The spacing before each paragraph in points (docx.shared.Pt).
-            space_after: The spacing after each paragraph in points (docx.shared.Pt).
-        @ref: This method was suggested by Google Search
-        """
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    paragraph_format = paragraph.paragraph_format
-                    paragraph_format.space_before = space_before
-                    paragraph_format.space_after = space_after
-
-    def _print_table_row(self, table_obj, row_id, person_objs: List[PersonPlayer], date: WorkDate, role: str= "委員", increment_at_end=True):
-        """
-        @param increment_at_end: If False, do not increment at the very end of the loop.
-        """
-        for person in person_objs:
-            row_obj = table_obj.rows[row_id].cells
-            row_obj[0].text = date
-            row_obj[2].text = role
-            row_obj[3].text = str(person.grade_class)
-            row_obj[4].text = str(person)
-            row_obj[5].text = person.phone_num
-            row_id += 1
-            self._logger.debug(f"grade-class: {person.grade_class}")
-        if not increment_at_end:
-            row_id -= 1
-        return row_id
-        
+    # TODO This might need to be flexible
+    TABLE_TOP_ROW = ["日付", "順", "担当", "学級", "生徒氏名", "電話番号"]
+    # Text of the "担当" column.
+    RESPONSIBILITY_TEXTS = {RespLvl.LEADER: "リーダー", RespLvl.COMMITTEE: "委員", RespLvl.GENERAL: "保護者"}
+
+    @staticmethod
+    def distributable_rows(solution: GjVolunteerMatching) -> Iterator[List[List[str]]]:
+        """
+        @summary: Rows of the table of the distributable under `TABLE_TOP_ROW`, grouped by date in the order of `solution`.
+          Within a date, the leader(s) come first, then committee members, then the other guardians.
+        @return: Per date, the rows of the date. A cell without text is None.
+        """
+        for date, date_detail in solution.items():
+            yield [[date, None, role, str(person.grade_class), str(person), person.phone_num or ""]
+                   for persons, role in ((date_detail[WorkDate.ATTR_LIST_ASSIGNED_LEADER], GjDocx.RESPONSIBILITY_TEXTS[RespLvl.LEADER]),
+                                         (date_detail[WorkDate.ATTR_LIST_ASSIGNED_COMMITTEE], GjDocx.RESPONSIBILITY_TEXTS[RespLvl.COMMITTEE]),
+                                         (date_detail[WorkDate.ATTR_LIST_ASSIGNED_GENERAL], GjDocx.RESPONSIBILITY_TEXTS[RespLvl.GENERAL]))
+                   for person in persons]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _paragraph_props_xml(space_before: int=0, space_after: int=0) -> str:
+        """
+        @summary: Paragraph properties every cell of the table gets, made once and shared by all the cells.
+        @param space_before: Spacing before the paragraph in twips. Same for `space_after`.
+        """
+        return f'<w:pPr><w:spacing w:before="{space_before}" w:after="{space_after}"/></w:pPr>'
+
+    @staticmethod
+    def _run_xml(text: str) -> str:
+        """
+        @return: A run of `text`, as python-docx makes for `cell.text = text`: tab and line break as their own elements,
+          and spaces at either end preserved.
+        """
+        _parts = []
+        for piece in _RE_RUN_SPECIAL_CHARS.split(text):
+            if piece == "\t":
+                _parts.append("<w:tab/>")
+            elif piece in ("\n", "\r"):
+                _parts.append("<w:br/>")
+            elif piece:
+                _space = ' xml:space="preserve"' if piece != piece.strip() else ""
+                _parts.append(f"<w:t{_space}>{xml_escape(piece)}</w:t>")
+        return f"<w:r>{''.join(_parts)}</w:r>" if _parts else "<w:r/>"
+
+    def _table_rows_xml(self, rows: List[List[str]], widths: List[int], merge_from_top: List[int]=()) -> str:
+        """
+        @summary: XML of table rows (`<w:tr>`) all at once, instead of setting each cell via python-docx.
+        @param rows: Texts of the cells per row. None for a cell without text.
+        @param widths: Width of each cell (`w:tcW`) in twips.
+        @param merge_from_top: Per row, the number of the rows (including itself) that column 0 is merged over downwards.
+          0 for a row whose column 0 is merged into the row above, 1 for no merge.
+        """
+        _props = self._paragraph_props_xml()
+        _empty_p = f"<w:p>{_props}</w:p>"
+        _tc_props = [f'<w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>' for width in widths]
+        _xml = []
+        for row_idx, texts in enumerate(rows):
+            _xml.append("<w:tr>")
+            _merge = merge_from_top[row_idx] if merge_from_top else 1
+            for col_idx, text in enumerate(texts):
+                if col_idx == 0 and _merge != 1:
+                    if _merge == 0:
+                        # The content is in the first row of the merged cells.
+                        _xml.append(f"<w:tc>{_tc_props[0]}<w:vMerge/></w:tcPr>{_empty_p}</w:tc>")
+                        continue
+                    _vmerge = '<w:vMerge w:val="restart"/>'
+                else:
+                    _vmerge = ""
+                _run = "" if text is None else self._run_xml(text)
+                _xml.append(f"<w:tc>{_tc_props[col_idx]}{_vmerge}</w:tcPr><w:p>{_props}{_run}</w:p></w:tc>")
+            _xml.append("</w:tr>")
+        return "".join(_xml)
+
     def print_distributable(
             self,
             solution: GjVolunteerMatching,
@@ -84,10 +133,14 @@ class GjDocx():
             paragraph_before_table: str="",
             paragraph_after_table: str="",
             timestamp: str="",
-            path_input_file=""):
+            path_input_file="",
+            merge_date_cells: bool=True):
+        """
+        @param merge_date_cells: If True, the date column is a single cell across the rows of each date.
+          Otherwise the date is repeated in every row.
+        """
 
-        # TODO This might need to be flexible
-        TABLE_TOP_ROW = ["日付", "順", "担当", "学級", "生徒氏名", "電話番号"]
+        TABLE_TOP_ROW = self.TABLE_TOP_ROW
 
         # `_table_header_length` is 1 because the header row is the one contains`TABLE_TOP_ROW` and no other rows.
         # TODO This might have to be flexible in the future.
@@ -97,18 +150,10 @@ class GjDocx():
         document.add_heading(heading1, level=1)
         document.add_paragraph(paragraph_before_table)
 
-        # Total num of assignees over the all dates.
-        _all_dates = solution.dates_lgtm  # `solution.dates_failed` should not be included, right?
-        _total_num_assignees_alldates = 0
-        for date in _all_dates:
-            _day_total_assignees_num = date.total_assignees_num()
-            _total_num_assignees_alldates += _day_total_assignees_num
-            self._logger.debug(f"Adding {_day_total_assignees_num} assignees from {date=}")
-        self._logger.info(f"{_total_num_assignees_alldates=}")
-
-        table = document.add_table(
-            rows=(_total_num_assignees_alldates + _table_header_length),
-            cols=len(TABLE_TOP_ROW))
+        # Rows are added below as XML in bulk.
+        table = document.add_table(rows=0, cols=len(TABLE_TOP_ROW))
+        # Cells are as wide as python-docx makes them by default, regardless of the column widths set below.
+        _cell_widths = [column.width.twips for column in table.columns]
 
         # Adjusting column width. 
         table.autofit = True
@@ -119,37 +164,18 @@ class GjDocx():
         table.columns[5].width = docx.shared.Cm(5)
 
         # Title row in the table
-        hdr_cells = table.rows[0].cells
-        for index, col_title in enumerate(TABLE_TOP_ROW, 0):
-            # TODO This logic assumes the order of the elements in `TABLE_TOP_ROW` is 
-            hdr_cells[index].text = col_title
-
-        _row_id = _table_header_length  # Rows to print persons start after the heaer row.
-        for date, date_detail in solution.items():
-            leader_p_objs: List[PersonPlayer] = date_detail[WorkDate.ATTR_LIST_ASSIGNED_LEADER]
-            committee_p_objs: List[PersonPlayer] = date_detail[WorkDate.ATTR_LIST_ASSIGNED_COMMITTEE]
-            general_p_objs: List[PersonPlayer] = date_detail[WorkDate.ATTR_LIST_ASSIGNED_GENERAL]
-            _beginning_row_id = _row_id
-            _row_id = self._print_table_row(table, _row_id, leader_p_objs, date=date, role="リーダー")
-            self._logger.debug(f"{date=}. AFTER leader: {_row_id=}")
-
-            _row_id = self._print_table_row(table, _row_id, committee_p_objs, date=date)
-            self._logger.debug(f"{date=}. AFTER commitee: {_row_id=}")
-
-            _row_id = self._print_table_row(table, _row_id, general_p_objs, date=date, role="保護者", increment_at_end=False)
-            self._logger.info(f"{date=}. AFTER general: {_row_id=}")
-
-            # Merging ID column for the date.
-            _ending_row_id = _row_id
-            self._logger.info(f"{_beginning_row_id=}. {_ending_row_id=}")
-
-            # TODO Line below is an attempt to merge cells that contain the same `date` value.
-            # For some reasons this results in undesired look of the table so needs more work.
-            #table.cell(_beginning_row_id, 0).merge(table.cell(_ending_row_id, 0))
-
-            _row_id += 1
-
-        self._narrow_table_row_spacing(table, space_before=Pt(0), space_after=Pt(0))
+        _rows = [list(TABLE_TOP_ROW)]
+        _merge_from_top = [1] * _table_header_length
+        for _date_rows in self.distributable_rows(solution):
+            _rows.extend(_date_rows)
+            # The date column is merged across the rows of the date.
+            if merge_date_cells and _date_rows:
+                _merge_from_top.extend([len(_date_rows)] + [0] * (len(_date_rows) - 1))
+            else:
+                _merge_from_top.extend([1] * len(_date_rows))
+        self._logger.info(f"Total num of assignees over the all dates: {len(_rows) - _table_header_length}")
+        _tbl_parsed = parse_xml(f"<w:tbl {nsdecls('w')}>{self._table_rows_xml(_rows, _cell_widths, _merge_from_top)}</w:tbl>")
+        table._tbl.extend(list(_tbl_parsed))
 
         document.add_paragraph(paragraph_after_table)
 
@@ -164,3 +190,221 @@ class GjDocx():
 
         document.add_page_break()
         document.save(os.path.join(self.output_path, f"{_sys_timestamp}_GJLS_{requirements.type_duty.name}.docx"))
+
+
+class GjPdfSection(NamedTuple):
+    """
+    @summary: A duty to render by `GjPdf.print_distributables`, i.e. what `GjDocx.print_distributable` takes for a single file.
+    """
+    solution: GjVolunteerMatching
+    heading1: str
+    paragraph_before_table: str = ""
+    paragraph_after_table: str = ""
+
+
+class _GjLazyDocTemplate(SimpleDocTemplate):
+    """
+    @summary: Pulls the flowables from an iterator as the document is laid out, instead of taking them all as a list,
+      so that only the flowables up to `LOOKAHEAD` ahead of the one being laid out are held at a time.
+    """
+    # More than one, for `handle_keepWithNext` to see the flowable after.
+    LOOKAHEAD = 2
+
+    def __init__(self, filename, flowables: Iterator, **kw):
+        super().__init__(filename, **kw)
+        self._flowables_pending = flowables
+
+    def _pull(self, flowables: List):
+        while len(flowables) < self.LOOKAHEAD:
+            flowable = next(self._flowables_pending, None)
+            if flowable is None:
+                return
+            flowables.append(flowable)
+
+    def handle_flowable(self, flowables: List):
+        # Also called on the internal `_hanging` list (e.g. the beginning of a page), which is not to be filled.
+        if flowables is self._hanging:
+            return super().handle_flowable(flowables)
+        # `build` stops once `flowables` is empty, so it's filled again before that.
+        self._pull(flowables)
+        super().handle_flowable(flowables)
+        self._pull(flowables)
+
+    def build_lazily(self):
+        """
+        @raise ValueError: When the iterator yields no flowable.
+        """
+        flowables = []
+        self._pull(flowables)
+        if not flowables:
+            raise ValueError("No flowable to build.")
+        self.build(flowables)
+
+
+class GjPdf():
+    """
+    @summary: Renders the same table as `GjDocx.print_distributable` as a PDF, for one or several duties in a single file.
+      The table is built in chunks of up to `rows_per_chunk` rows, each with its own header row and without splitting a date,
+      and the chunks are made only as the pages are laid out (`_GjLazyDocTemplate`), so that memory and the cost per page
+      stay the same rather than growing with the whole schedule.
+    """
+    # Built into reportlab (Adobe-Japan1), so it works without any font file. The PDF viewer provides the glyphs.
+    FONT_NAME_CID = "HeiseiKakuGo-W5"
+    ROWS_PER_CHUNK = 40
+    # Same order as `GjDocx.TABLE_TOP_ROW`.
+    COL_WIDTHS = [2.6 * cm, 0.9 * cm, 2.2 * cm, 2.0 * cm, 4.5 * cm, 4.0 * cm]
+    _fonts_registered = {}
+
+    def __init__(self, output_path=os.getcwd(), font_path: str=None, rows_per_chunk: int=ROWS_PER_CHUNK, logger_obj: logging.Logger=None):
+        """
+        @param font_path: TrueType font (.ttf/.ttc) with Japanese glyphs, to be embedded. If None or if it fails to load,
+          `FONT_NAME_CID` is used.
+        """
+        if rows_per_chunk < 1:
+            raise ValueError(f"'rows_per_chunk' must be positive. Got {rows_per_chunk}")
+        self.output_path = output_path
+        self._logger = NtonUtil.get_logger(__name__, logger_obj)
+        self._rows_per_chunk = rows_per_chunk
+        self._font_name = self.register_font(font_path, self._logger)
+        _styles = getSampleStyleSheet()
+        self._style_heading = ParagraphStyle("GjHeading1", parent=_styles["Heading1"], fontName=self._font_name, wordWrap="CJK")
+        self._style_body = ParagraphStyle("GjBody", parent=_styles["Normal"], fontName=self._font_name, wordWrap="CJK")
+        self._table_style = TableStyle([
+            ("FONTNAME", (0, 0), (-1, -1), self._font_name),
+            ("FONTSIZE", (0, 0), (-1, -1), 9),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ])
+
+    @classmethod
+    def register_font(cls, font_path: str=None, logger: logging.Logger=None) -> str:
+        """
+        @summary: Registers the font with reportlab once per process. Loading a CJK TrueType font takes long, so it's not repeated per file.
+        @return: Name of the font to use.
+        """
+        if font_path in cls._fonts_registered:
+            return cls._fonts_registered[font_path]
+        font_name = None
+        if font_path:
+            _name = os.path.splitext(os.path.basename(font_path))[0]
+            try:
+                pdfmetrics.registerFont(TTFont(_name, font_path))
+                font_name = _name
+            except Exception as e:  # reportlab raises TTFError, IOError etc.
+                NtonUtil.get_logger(__name__, logger).warning(
+                    f"Font '{font_path}' cannot be used. Falling back to '{cls.FONT_NAME_CID}'. {str(e)}")
+        if not font_name:
+            font_name = cls.FONT_NAME_CID
+            if font_name not in pdfmetrics.getRegisteredFontNames():
+                pdfmetrics.registerFont(UnicodeCIDFont(font_name))
+        cls._fonts_registered[font_path] = font_name
+        return font_name
+
+    def _paragraph(self, text: str, style: ParagraphStyle) -> Paragraph:
+        # Paragraph takes markup, where line breaks in the text would be just spaces.
+        return Paragraph(xml_escape(text).replace("\n", "<br/>"), style)
+
+    def table_chunks(self, solution: GjVolunteerMatching) -> Iterator[Table]:
+        """
+        @summary: The table of `solution`, in chunks of up to `rows_per_chunk` rows (more only when a single date has more).
+          The date column is a single cell across the rows of each date.
+        """
+        _rows = []
+        _spans = []
+
+        def _chunk():
+            table = Table([GjDocx.TABLE_TOP_ROW] + _rows, colWidths=self.COL_WIDTHS, repeatRows=1)
+            table.setStyle(self._table_style)
+            table.setStyle(TableStyle(_spans))
+            return table
+
+        for _date_rows in GjDocx.distributable_rows(solution):
+            if not _date_rows:
+                continue
+            if _rows and (self._rows_per_chunk < len(_rows) + len(_date_rows)):
+                yield _chunk()
+                _rows, _spans = [], []
+            # +1 for the header row.
+            _first = len(_rows) + 1
+            _rows.extend([_date_rows[0]] + [[None] + row[1:] for row in _date_rows[1:]])
+            if 1 < len(_date_rows):
+                _spans.append(("SPAN", (0, _first), (0, _first + len(_date_rows) - 1)))
+        if _rows:
+            yield _chunk()
+
+    def _flowables(self, section: GjPdfSection) -> Iterator:
+        yield self._paragraph(section.heading1, self._style_heading)
+        if section.paragraph_before_table:
+            yield self._paragraph(section.paragraph_before_table, self._style_body)
+        yield from self.table_chunks(section.solution)
+        if section.paragraph_after_table:
+            yield Spacer(1, 6)
+            yield self._paragraph(section.paragraph_after_table, self._style_body)
+
+    def print_distributables(self, sections: Iterable[GjPdfSection], file_name: str, timestamp: str="", path_input_file="") -> str:
+        """
+        @summary: Renders `sections` (e.g. one per duty) into a single PDF, each starting on a new page, in one pass.
+          `sections` is iterated as the pages are laid out, so it can be a generator.
+        @param file_name: Of the PDF, in `output_path`.
+        @return: Path of the PDF.
+        @raise ValueError: When `sections` is empty.
+        """
+        if not timestamp:
+            timestamp = datetime.datetime.strftime(datetime.datetime.now(), '%Y-%m-%d-%H-%M-%S')
+        _footer = []
+        if path_input_file:
+            _footer.append(self._paragraph("使用マスタファイル名：" + os.path.basename(path_input_file), self._style_body))
+        _footer.append(self._paragraph(timestamp + " 更新", self._style_body))
+
+        def _document():
+            for idx, section in enumerate(sections):
+                if idx:
+                    yield PageBreak()
+                yield from self._flowables(section)
+                yield from _footer
+
+        path_pdf = os.path.join(self.output_path, file_name)
+        try:
+            _GjLazyDocTemplate(path_pdf, _document(), pagesize=letter).build_lazily()
+        except ValueError as e:
+            raise ValueError("No section to print.") from e
+        self._logger.info(f"PDF written to {path_pdf}")
+        return path_pdf
+
+    def print_distributable(
+            self,
+            solution: GjVolunteerMatching,
+            requirements: DateRequirement,
+            heading1: str,
+            paragraph_before_table: str="",
+            paragraph_after_table: str="",
+            timestamp: str="",
+            path_input_file="") -> str:
+        """
+        @summary: Same args as `GjDocx.print_distributable`, for a single duty.
+        @return: Path of the PDF.
+        """
+        _sys_timestamp = datetime.datetime.strftime(datetime.datetime.now(), '%Y-%m-%d-%H-%M-%S')
+        return self.print_distributables(
+            [GjPdfSection(solution, heading1, paragraph_before_table, paragraph_after_table)],
+            file_name=f"{_sys_timestamp}_GJLS_{requirements.type_duty.name}.pdf",
+            timestamp=timestamp,
+            path_input_file=path_input_file)
+
+    def print_table(self, file_name: str, heading1: str, header: List[str], rows: List[List[str]],
+                    paragraph_before_table: str="", col_widths: List[float]=None) -> str:
+        """
+        @summary: A single short table under a heading, e.g. the dates of a family. Unlike `print_distributables`, the table isn't chunked.
+        @param col_widths: In points. If None, reportlab decides.
+        @return: Path of the PDF.
+        """
+        table = Table([header] + rows, colWidths=col_widths, repeatRows=1)
+        table.setStyle(self._table_style)
+        flowables = [self._paragraph(heading1, self._style_heading)]
+        if paragraph_before_table:
+            flowables.append(self._paragraph(paragraph_before_table, self._style_body))
+        flowables.append(table)
+        path_pdf = os.path.join(self.output_path, file_name)
+        SimpleDocTemplate(path_pdf, pagesize=letter).build(flowables)
+        return path_pdf
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+from typing import Dict, Iterable, Iterator, List, NamedTuple
+
+from gj.grade_class import GradeUtil
+from n_to_n_matching.workdate_player import WorkDate
+
+
+class GjDateRecord(NamedTuple):
+    """
+    @summary: Requirement of a single date as plain values, before it's made a `WorkDate`.
+    """
+    date: datetime.date
+    school_off: bool
+    req_num_leader: int
+    req_num_committee: int
+    req_num_general: int
+    # `GjGradeGroup`, `GjGrade` or the string of a grade, as `GradeUtil.included_grade` takes. None if no grade is exempted.
+    exempted_grade: object
+
+    @staticmethod
+    def to_date(value) -> datetime.date:
+        """
+        @param value: "yyyy-mm-dd", or `datetime.date` as YAML parses such a value into.
+        @raise ValueError: When `value` is neither.
+        """
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, datetime.date):
+            return value
+        try:
+            return datetime.date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError("'{}' is incorrect data format, should be YYYY-MM-DD".format(value))
+
+    @classmethod
+    def from_dict(cls, date_obj: datetime.date, attrs: Dict, num_leader: int, num_committee: int, num_general: int) -> "GjDateRecord":
+        """
+        @param attrs: `WorkDate.ATTR_*` of the date as in the input, e.g. `{WorkDate.ATTR_NUM_GENERAL: 5}`. The rest is the default.
+        @param num_leader: Default when `attrs` doesn't have it. Same for `num_committee`, `num_general`.
+        """
+        return cls(date=date_obj,
+                   school_off=attrs.get(WorkDate.ATTR_SCHOOL_OFF, False),
+                   req_num_leader=attrs.get(WorkDate.ATTR_NUM_LEADER, num_leader),
+                   req_num_committee=attrs.get(WorkDate.ATTR_NUM_COMMITTEE, num_committee),
+                   req_num_general=attrs.get(WorkDate.ATTR_NUM_GENERAL, num_general),
+                   exempted_grade=GradeUtil.exemption_group(attrs.get(WorkDate.ATTR_EXEMPT_GRADE, None)))
+
+    def to_workdate(self) -> WorkDate:
+        return WorkDate(date_obj=self.date,
+                        school_off=self.school_off,
+                        req_num_leader=self.req_num_leader,
+                        req_num_committee=self.req_num_committee,
+                        req_num_noncommittee=self.req_num_general,
+                        exempt_conditions=self.exempted_grade)
+
+
+class GjRecurrence:
+    """
+    @summary: Dates given as a rule instead of one by one, e.g. every Saturday from 2025-04-12 to 2026-03-14 except some,
+      with the requirement of particular dates overridden. In the input (e.g. .yaml) it's written as:
+
+        Recurrence:
+          weekday: SAT               # Or 0 (Monday) to 6 (Sunday).
+          start: 2025-04-12
+          end: 2026-03-14            # Inclusive.
+          interval_weeks: 1          # Optional. E.g. 2 for every other week.
+          except: [2025-08-16, 2025-12-27]
+          overrides:
+            2025-05-10: {req_num_general: 5}
+            2025-05-17: {exempted_grade: ELEM_SHOU}   # Name of `GjGradeGroup`, or a grade e.g. "小1－1".
+
+      The section can also be a list of these, e.g. one per term. The input stays a few lines however long the period is,
+      but the solver still takes every date as a `WorkDate` (`GjVolunteerAllocationGame.create_from_dict_dates`).
+    """
+    ATTR_SECTION = "Recurrence"
+    ATTR_WEEKDAY = "weekday"
+    ATTR_START = "start"
+    ATTR_END = "end"
+    ATTR_INTERVAL_WEEKS = "interval_weeks"
+    ATTR_EXCEPT = "except"
+    ATTR_OVERRIDES = "overrides"
+    WEEKDAYS = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+
+    def __init__(self,
+                 weekday: int,
+                 date_start: datetime.date,
+                 date_end: datetime.date,
+                 interval_weeks: int=1,
+                 exceptions: Iterable[datetime.date]=(),
+                 overrides: Dict[datetime.date, Dict]=None):
+        """
+        @param weekday: 0 (Monday) to 6 (Sunday), as `datetime.date.weekday()`.
+        @param date_start: The first date is the first `weekday` on or after this.
+        @param overrides: Date -> `WorkDate.ATTR_*` of the date, see `GjDateRecord.from_dict`.
+        @raise ValueError: When an arg is out of range.
+        """
+        if not (0 <= weekday <= 6):
+            raise ValueError(f"'weekday' must be 0 (Monday) to 6 (Sunday). Got {weekday}")
+        if date_end < date_start:
+            raise ValueError(f"End date {date_end} is before the start date {date_start}.")
+        if interval_weeks < 1:
+            raise ValueError(f"'interval_weeks' must be positive. Got {interval_weeks}")
+        self._date_first = date_start + datetime.timedelta(days=(weekday - date_start.weekday()) % 7)
+        self._date_end = date_end
+        self._step = datetime.timedelta(weeks=interval_weeks)
+        self._exceptions = frozenset(exceptions)
+        self._overrides = overrides or {}
+
+    @classmethod
+    def parse_weekday(cls, value) -> int:
+        """
+        @param value: 0 (Monday) to 6 (Sunday), or the name of the day in English, e.g. "SAT", "Saturday".
+        @raise ValueError
+        """
+        if isinstance(value, int):
+            return value
+        try:
+            return cls.WEEKDAYS.index(str(value)[:3].upper())
+        except ValueError:
+            raise ValueError(f"Weekday '{value}' is not recognized. Use 0 (Monday) to 6 (Sunday), or one of {cls.WEEKDAYS}.")
+
+    @classmethod
+    def from_dict(cls, recurrence: Dict) -> "GjRecurrence":
+        """
+        @param recurrence: A section as in the class description.
+        @raise ValueError: When a required key is missing or a value is malformed.
+        """
+        try:
+            weekday, date_start, date_end = (recurrence[key] for key in (cls.ATTR_WEEKDAY, cls.ATTR_START, cls.ATTR_END))
+        except KeyError as e:
+            raise ValueError(f"'{e.args[0]}' is required in the section '{cls.ATTR_SECTION}'. Given: {recurrence}")
+        return cls(weekday=cls.parse_weekday(weekday),
+                   date_start=GjDateRecord.to_date(date_start),
+                   date_end=GjDateRecord.to_date(date_end),
+                   interval_weeks=int(recurrence.get(cls.ATTR_INTERVAL_WEEKS, 1)),
+                   exceptions=[GjDateRecord.to_date(d) for d in recurrence.get(cls.ATTR_EXCEPT) or []],
+                   overrides={GjDateRecord.to_date(d): attrs for d, attrs in (recurrence.get(cls.ATTR_OVERRIDES) or {}).items()})
+
+    @classmethod
+    def from_section(cls, section) -> List["GjRecurrence"]:
+        """
+        @param section: A recurrence, or a list of them.
+        """
+        return [cls.from_dict(recurrence) for recurrence in (section if isinstance(section, list) else [section])]
+
+    def iter_dates(self) -> Iterator[datetime.date]:
+        _date = self._date_first
+        while _date <= self._date_end:
+            if _date not in self._exceptions:
+                yield _date
+            _date += self._step
+
+    def iter_records(self, num_leader: int, num_committee: int, num_general: int) -> Iterator[GjDateRecord]:
+        """
+        @param num_leader: Requirement of the dates not overridden. Same for `num_committee`, `num_general`.
+        """
+        _default = None
+        for _date in self.iter_dates():
+            attrs = self._overrides.get(_date)
+            if attrs:
+                yield GjDateRecord.from_dict(_date, attrs, num_leader, num_committee, num_general)
+            else:
+                # Dates without an override only differ by the date.
+                if _default is None:
+                    _default = GjDateRecord(_date, False, num_leader, num_committee, num_general, None)
+                yield _default._replace(date=_date)
@@ -15,8 +15,10 @@
 # limitations under the License.
 
 import datetime
+from enum import IntEnum
 from typing import List
 
+from gj.responsibility import ResponsibilityLevel
 from gj.role import Roles_Definition
 from n_to_n_matching.workdate_player import WorkDate
 
@@ -24,11 +26,37 @@ class Consts():
     ATTR_MAX_STINT_OPPORTUNITIES = "max_stint_opportunities"
     ATTR_AVAILABLE_EXTRAS = "num_available_extra"
     ATTR_UNLUCKY_PERSON_NUMS = "num_unlucky_person"    
-    
+
+
+class ReasonCode(IntEnum):
+    """
+    @summary: Result of evaluating whether a person can take a slot on a date.
+      Returned by `GjVolunteerAllocationGame.can_assign` so that rejecting a candidate in the assignment loop
+      costs neither an exception nor a formatted message.
+    """
+    OK = 0
+    TOO_SOON = 1  # Not enough days have passed since the person's last assignment.
+    DATE_FILLED = 2  # All the slots of the date are already filled.
+    SLOT_FILLED = 3  # The slot for the requested responsibility is already filled (or the date has no such slot).
+
 
 class DateRequirement():
     _MSG_SETTER_NOTALlOWED = "The value is only allowed to be set upon initializing the instance."
     ATTR_SECTION = "Requirement"
+    # Persons in these roles are not assigned to the duty. E.g. for Tosho, the assignable persons are
+    # either those in Tosho Committee or general, therefore removing the members of other committees.
+    EXCLUDED_ROLES_PER_DUTY = {
+        Roles_Definition.TOSHO_COMMITEE: (Roles_Definition.HOKEN_COMMITEE, Roles_Definition.SAFETY_COMMITEE),
+        Roles_Definition.HOKEN_COMMITEE: (Roles_Definition.SAFETY_COMMITEE, Roles_Definition.TOSHO_COMMITEE),
+        Roles_Definition.SAFETY_COMMITEE: (Roles_Definition.HOKEN_COMMITEE, Roles_Definition.TOSHO_COMMITEE),
+    }
+    # Responsibilities assigned on each date of the duty, in the order they are filled.
+    RESPONSIBILITIES_PER_DUTY = {
+        Roles_Definition.TOSHO_COMMITEE: (ResponsibilityLevel.GENERAL, ResponsibilityLevel.COMMITTEE, ResponsibilityLevel.LEADER),
+        # For Hoken and Safety, there's only leader or general guardians.
+        Roles_Definition.HOKEN_COMMITEE: (ResponsibilityLevel.GENERAL, ResponsibilityLevel.LEADER),
+        Roles_Definition.SAFETY_COMMITEE: (ResponsibilityLevel.GENERAL, ResponsibilityLevel.LEADER),
+    }
 
     def __init__(self,
                  dates: List[WorkDate],
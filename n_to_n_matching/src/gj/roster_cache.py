@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+import marshal
+import os
+import struct
+import tempfile
+from typing import Dict, List, Optional
+
+from gj.spreadsheet_access import GjPersonRecord
+from gj.util import GjUtil
+
+
+class GjRosterCache:
+    """
+    @summary: Keeps the rows parsed out of a family master workbook (`GjPersonRecord`), so that running the app again
+      on the same workbook doesn't need to open it with openpyxl.
+      An entry is used only when all of these are the same as when it was stored: path, size, mtime and content hash
+      of the workbook, sheet name, and the title row/column spec the caller passed. Otherwise it's parsed and stored again.
+
+      File format (little endian):
+        - 4 bytes: `MAGIC`
+        - uint16: `VERSION`. Bump it whenever `GjPersonRecord` or the layout below changes.
+        - uint32: length of the key
+        - key: UTF-8 JSON of the dict made by `_key`
+        - payload: `marshal` of the list of record tuples
+    """
+    MAGIC = b"GJRC"
+    VERSION = 2
+    _HEADER = struct.Struct("<4sHI")
+    SUFFIX = ".gjroster"
+    DIRNAME_DEFAULT = ".gjls_cache"
+
+    def __init__(self, cache_dir: str=None, logger_obj: logging.Logger=None):
+        """
+        @param cache_dir: Where cache files are written. If None, a directory `DIRNAME_DEFAULT` next to each workbook.
+        """
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self._cache_dir = cache_dir
+
+    @staticmethod
+    def _schema(title_row: Optional[int], row_spec: Optional[Dict[int, str]]) -> List:
+        # Lists rather than tuples, so that it compares equal after the JSON round trip.
+        return [title_row, [list(item) for item in sorted(row_spec.items())] if row_spec else None]
+
+    @staticmethod
+    def content_hash(path: str) -> str:
+        _hash = hashlib.blake2b(digest_size=20)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                _hash.update(chunk)
+        return _hash.hexdigest()
+
+    def _key(self, path_xls: str, sheet_name: str, title_row: Optional[int], row_spec: Optional[Dict[int, str]]) -> Dict:
+        _stat = os.stat(path_xls)
+        return {
+            "path": os.path.abspath(path_xls),
+            "size": _stat.st_size,
+            "mtime_ns": _stat.st_mtime_ns,
+            "blake2b": self.content_hash(path_xls),
+            "sheet": sheet_name,
+            "schema": self._schema(title_row, row_spec),
+            # `marshal` format may differ between Python versions.
+            "marshal": marshal.version,
+        }
+
+    def path_cache(self, path_xls: str, sheet_name: str, title_row: Optional[int], row_spec: Optional[Dict[int, str]]) -> str:
+        """
+        @return: Path of the cache file. One file per workbook, sheet and schema, so that entries don't evict each other.
+        """
+        _path_xls = os.path.abspath(path_xls)
+        _id = hashlib.blake2b(json.dumps([_path_xls, sheet_name, self._schema(title_row, row_spec)]).encode(),
+                              digest_size=10).hexdigest()
+        _dir = self._cache_dir or os.path.join(os.path.dirname(_path_xls), self.DIRNAME_DEFAULT)
+        return os.path.join(_dir, f"{os.path.basename(_path_xls)}.{_id}{self.SUFFIX}")
+
+    def load(self, path_xls: str, sheet_name: str, title_row: int=None, row_spec: Dict[int, str]=None) -> Optional[List[GjPersonRecord]]:
+        """
+        @return: None when there's no valid entry.
+        """
+        _path_cache = self.path_cache(path_xls, sheet_name, title_row, row_spec)
+        try:
+            with open(_path_cache, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            self._logger.info(f"No roster cache for '{path_xls}' ({sheet_name=}).")
+            return None
+        try:
+            magic, version, _len_key = self._HEADER.unpack_from(data)
+            if (magic != self.MAGIC) or (version != self.VERSION):
+                self._logger.info(f"Roster cache '{_path_cache}' is of another format ({magic=}, {version=}). Ignoring.")
+                return None
+            _offset = self._HEADER.size
+            key_stored = json.loads(data[_offset:_offset + _len_key].decode())
+            if key_stored != self._key(path_xls, sheet_name, title_row, row_spec):
+                self._logger.info(f"Roster cache '{_path_cache}' is stale. Ignoring.")
+                return None
+            records = [GjPersonRecord(*fields) for fields in marshal.loads(data[_offset + _len_key:])]
+        except (struct.error, ValueError, EOFError, TypeError) as e:
+            self._logger.warning(f"Roster cache '{_path_cache}' is broken. Ignoring. {str(e)}")
+            return None
+        self._logger.info(f"{len(records)} rows loaded from the roster cache '{_path_cache}'.")
+        return records
+
+    def store(self, records: List[GjPersonRecord], path_xls: str, sheet_name: str, title_row: int=None, row_spec: Dict[int, str]=None):
+        """
+        @summary: Nothing is stored, with a warning, when a value in `records` is not of a type `marshal` supports (e.g. datetime).
+        """
+        _path_cache = self.path_cache(path_xls, sheet_name, title_row, row_spec)
+        try:
+            payload = marshal.dumps([tuple(record) for record in records])
+        except ValueError as e:
+            self._logger.warning(f"Rows of '{path_xls}' cannot be cached. {str(e)}")
+            return
+        key = json.dumps(self._key(path_xls, sheet_name, title_row, row_spec)).encode()
+        os.makedirs(os.path.dirname(_path_cache), exist_ok=True)
+        # Written into a temporary file first, so that another run never reads a half-written cache.
+        fd, _path_tmp = tempfile.mkstemp(dir=os.path.dirname(_path_cache), suffix=self.SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._HEADER.pack(self.MAGIC, self.VERSION, len(key)))
+                f.write(key)
+                f.write(payload)
+            os.replace(_path_tmp, _path_cache)
+        except BaseException:
+            os.unlink(_path_tmp)
+            raise
+        self._logger.info(f"{len(records)} rows stored in the roster cache '{_path_cache}'.")
@@ -15,16 +15,67 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+import contextlib
+import csv
+import json
 import openpyxl as pyxl
-from openpyxl.cell.cell import Cell as pyxl_Cell
-from typing import Dict, List
+import os
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import unicodedata
 
 from gj.grade_class import GjGrade, GradeUtil
+from gj.household import GjHouseholdIndex
 from gj.responsibility import Responsibility, ResponsibilityLevel
 from gj.role import Role, Roles_Definition
 from gj.util import GjUtil
 from n_to_n_matching.person_player import PersonBank, PersonPlayer
-from n_to_n_matching.spreadsheet_access import SpreadsheetCell, SpreadsheetRow
+from n_to_n_matching.spreadsheet_access import SpreadsheetRow, Table
+
+# `_SingleSheetReader` relies on these, which are not public API of openpyxl. It's tested with the range in pyproject.toml,
+# and without them the workbook is opened by `openpyxl.load_workbook` instead (see `GjToubanAccess.open_sheet_readonly`).
+try:
+    from openpyxl.reader.excel import ExcelReader
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+    _HAS_READER_INTERNALS = True
+except ImportError:
+    ExcelReader = ReadOnlyWorksheet = object
+    _HAS_READER_INTERNALS = False
+
+
+class _UnsizedReadOnlyWorksheet(ReadOnlyWorksheet):
+    """
+    @summary: Read-only worksheet that doesn't take the dimension of the sheet from the file.
+      The recorded dimension is not always accurate, in which case rows would be cut at a wrong max column.
+      Also, when the file has none (e.g. written in write-only mode), finding it costs a read through the whole sheet.
+      Rows are instead read as long as they are in the file.
+      Depends on openpyxl internals.
+    """
+    def _get_size(self):
+        self.reset_dimensions()
+
+
+class _SingleSheetReader(ExcelReader):
+    """
+    @summary: Read-only, data-only reader that sets up only one sheet of the workbook.
+      `openpyxl.load_workbook(read_only=True)` still sets up every sheet, which means reading through
+      each sheet that has no dimension record, even though only the family master sheet is used.
+      Depends on openpyxl internals.
+    """
+    def __init__(self, path_xls, sheet_name):
+        super().__init__(path_xls, read_only=True, data_only=True)
+        self._sheet_name = sheet_name
+
+    def read_worksheets(self):
+        # Names local to a sheet refer to it by its index in the workbook, which doesn't hold with a single sheet set up.
+        # They're print settings etc. that are irrelevant for reading values.
+        self.parser.defined_names.definedName = [
+            defn for defn in self.parser.defined_names.definedName if defn.localSheetId is None]
+        for sheet, rel in self.parser.find_sheets():
+            if (sheet.name == self._sheet_name) and (rel.target in self.valid_files) and ("chartsheet" not in rel.Type):
+                ws = _UnsizedReadOnlyWorksheet(self.wb, sheet.name, rel.target, self.shared_strings)
+                ws.sheet_state = sheet.state
+                self.wb._sheets.append(ws)
+                return
 
 
 class GjRowEntity:
@@ -98,82 +149,53 @@ class GjRowEntity:
         27: COLTITLE_EMAIL_REGISTERED,      # "クラス登録メール"
     }
 
+    # Text of each column title as written in the title row of the master sheet.
+    # "\u3000" (full-width space) in "氏\u3000名" is as in the actual sheet.
+    COL_TITLE_TEXTS = {
+        COLTITLE_ID_IN_SHEET: "No",
+        COLTITLE_GRADE_CLASS: "学年組",
+        COLTITLE_STUDENT_NAME: "氏\u3000名",
+        COLTITLE_GUARDIAN_NAME: "保護者名",
+        COLTITLE_PHONE_EMERGENCY: "当番用TEL",
+        COLTITLE_EMAIL_EMERGENCY: "当番用メール",
+        COLTITLE_SIBLING_2_CLASS: "兄姉２",
+        COLTITLE_SIBLING_2_PERSONNAME: "兄姉氏名",
+        COLTITLE_SIBLING_3_CLASS: "兄姉３",
+        COLTITLE_SIBLING_3_PERSONNAME: "兄姉氏名",
+        COLTITLE_SIBLING_4_CLASS: "兄姉４",
+        COLTITLE_DATE_ASSIGNED_TOSHO: "図書",
+        COLTITLE_DATE_ASSIGNED_HOKEN: "保健",
+        COLTITLE_DATE_ASSIGNED_PATROL: "パトロール",
+        COLTITLE_COMMENT: "備考",
+        COLTITLE_TRANSFERED_DATE: "編入",
+        COLTITLE_TERMINATE_DATE: "退学",
+        COLTITLE_EXEMPTED_BY: "免除対象",
+        COLTITLE_SELECTED_AS: "選出",
+        COLTITLE_PHONENUM_REGISTERED: "事務局登録TEL",
+        COLTITLE_EMAIL_REGISTERED: "クラス登録メール",
+    }
+
     def __init__(self, row: SpreadsheetRow, row_spec=COL_TITLE_IDS_20250503, logger_obj=None):
+        """
+        @param row_spec: Either a dict of column number to `COLTITLE_*`, or `GjColumnIndex` already compiled from one.
+        """
         if type(row) != SpreadsheetRow:
             raise ValueError(f"'row' object must be the type of SpreadsheetRow. Instead, {type(row)} was passed.")
         self._logger = GjUtil.get_logger(__name__, logger_obj)
-        if not row:
-            self._logger.warning(f"'row' object is empty. Finishing creating an object without filling with the values.")
-            pass
-        else:
-            self._raw_row = row
-
         self._is_title_row = True if row.is_title_row else False
-        self._row_spec = row_spec
-        self._gj_row = self.parse_xls_row(row, self._row_spec)
-    
-    def parse_xls_row(self, row: SpreadsheetRow, col_title_definition=COL_TITLE_IDS_20250503) -> List[SpreadsheetCell]:
-        """
-        @description: Evaluate each cell from the row object, find a cell that matches the column ID, then sets the cell's value.
-        @type row: SpreadsheetRow
-        @type col_title_definition: dict
-        @return: row object filled with the values in the corresponding column index.
-        """
-        ss_row = []
-        for cell in row.cells:
-            #if (cell.column == 3) and (not ss_cell.value):
-                # TODO Specifying columnd=3 by hardcoding is too adhoc.
-                #self._logger.debug(f"At {cell.row=}, Grade-Class is empty. Skipping this row.")
-                #return None
-
-            if (cell.row % 7 == 0) and (cell.row < 255) and (cell.value):  # This number is very adhoc
-                self._logger.debug(f"{cell.row=}-{cell.column=}, {cell.value=}")
-            cell_title = ""
-            try:
-                cell_title = col_title_definition[cell.column]
-            except KeyError as e:
-                self._logger.debug(f"Skipping this column. {cell.column=} is either not used in the input file, or its definition not present in title definition `col_title_definition`.")                
-            # TODO Roles need special treatment; In the spreadsheet, roles are distributed in multiple columns and value of the cells in each col
-            #   are meant to be the date the person is assigned to each role. While this design makes sense from spreadsheet user's usecase,
-            #   it doesn't provide convenience for this tool's usecases.
-            #   To mitigate, add a special cell to the row object that conveys the type of role.
-            ss_cell = SpreadsheetCell(cell_obj=cell, title_val=cell_title)
-            # TODO Looks like the usage of this ss_row list assumes the order of elements are fixed, however,
-            # the current implementation doesn't guarantee the order. Needs a better impl.
-
-            #try:
-                #self._logger.debug(f"{ss_cell=}")  ## 20250503 This logger call fails
-            #except AttributeError as e:
-            #    self._logger.error(f"Error happened. Continuing though.\n\tError content: {str(e)}")
-
-            ss_row.append(ss_cell)
-        return ss_row
-
-    def _get_key_byval(self, dct: Dict[int, str], value: str) -> List[int]:
-        """
-        @summary Return the corresponding key(s) from the dict that has the given `value`.
-        @see https://stackoverflow.com/a/49353279/577001
-        """
-        return [key for key in dct if (dct[key] == value)]
-
-    def _get_value_from_gj_row(self, col_id_str: str) -> str:
-        """
-        @param col_id_str: The title of the column in the given spreadsheet.
-          Internally look up the row ID database that must already be passed upon initializing the class.
-        """
-        col_ids = self._get_key_byval(self._row_spec, col_id_str)
-        if 1 < len(col_ids):
-            raise ValueError(f"In the usecase here, '{col_id_str=}' is supposed to be 1 or 0.")
-        col_id = col_ids[0]
-        for cell in self._raw_row.cells:  # type(cell) == openpyxl.cell.cell.Cell
-            self._logger.debug(f"{cell.column=}, {col_id=}")
-            if cell.column == col_id:
-                self._logger.debug(f"{cell.column=} == {col_id=}. {cell.value=}")
-                return cell.value
+        self._row_id = row.row_id
+        self._values = row.values
+        self._columns = row_spec if isinstance(row_spec, GjColumnIndex) else GjColumnIndex.compile(row_spec)
+
+    def _get_value_from_gj_row(self, col_id_str: str):
+        """
+        @param col_id_str: `COLTITLE_*` of the column.
+        """
+        return self._columns.value(self._values, col_id_str)
 
     @property
     def row_id(self):
-        return self._raw_row.row_id
+        return self._row_id
 
     @property
     def exempted_on(self):
@@ -203,6 +225,216 @@ class GjRowEntity:
         return self._get_value_from_gj_row(self.COLTITLE_EMAIL_EMERGENCY)
 
 
+class GjPersonRecord(NamedTuple):
+    """
+    @summary: Fields of a family row that a `PersonPlayer` is made of, as plain values so that it can be cached as is.
+    """
+    row_id: int
+    id: int
+    name: str
+    email: str
+    phone: str
+    grade_class: str
+    exempted_on: str
+    guardian_name: str = None
+    # Grade/class of the siblings in the sibling columns, e.g. ("小2－3", "小5－1").
+    siblings: Tuple[str, ...] = ()
+
+
+class GjExemptionIndex:
+    """
+    @summary: Inverted index from the value of the exemption column ("免除対象", e.g. "図書委員") to the rows having it,
+      made in the same pass as the rows are ingested, so that e.g. the committee members of any duty are looked up
+      in O(matches) instead of scanning the whole column again.
+      Every `Roles_Definition` value is a key even if no row has it; values not in `Roles_Definition` are kept as well.
+    """
+    def __init__(self):
+        self._row_ids: Dict[str, List[int]] = {role.value: [] for role in Roles_Definition if role != Roles_Definition.UNDEFINED}
+        self._person_ids: Dict[str, List[int]] = {key: [] for key in self._row_ids}
+
+    def add(self, exempted_on: str, row_id: int=None, person_id: int=None):
+        """
+        @summary: Rows and persons are added separately, as the rows of a household are collapsed into a person
+          in between (`GjToubanAccess.persons_from_records`).
+        @param exempted_on: Rows with None or "" are not indexed.
+        """
+        if not exempted_on:
+            return
+        if row_id is not None:
+            self._row_ids.setdefault(exempted_on, []).append(row_id)
+        if person_id is not None:
+            self._person_ids.setdefault(exempted_on, []).append(person_id)
+
+    def _key(self, exempted_on) -> str:
+        key = exempted_on.value if isinstance(exempted_on, Roles_Definition) else exempted_on
+        if key not in self._row_ids:
+            raise ValueError(f"'{exempted_on}' is neither a `Roles_Definition` value nor found in the exemption column. Available: {list(self._row_ids)}")
+        return key
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._row_ids)
+
+    def row_ids(self, exempted_on) -> List[int]:
+        """
+        @param exempted_on: `Roles_Definition` or its value.
+        @raise ValueError: When `exempted_on` is unknown.
+        """
+        return self._row_ids[self._key(exempted_on)]
+
+    def person_ids(self, exempted_on) -> List[int]:
+        """
+        @see: `row_ids`
+        """
+        return self._person_ids.get(self._key(exempted_on), [])
+
+
+class GjColumnIndex:
+    """
+    @summary: Column spec (e.g. `GjRowEntity.COL_TITLE_IDS_20250503`) compiled into `COLTITLE_*` -> 0-based position,
+      so that reading a field from a row of values is a tuple index.
+      Use `compile`, which returns the same object for the same spec.
+    """
+    _compiled: Dict[Tuple[Tuple[int, str], ...], "GjColumnIndex"] = {}
+
+    def __init__(self, row_spec: Dict[int, str]):
+        """
+        @param row_spec: Column number (1-based, as in openpyxl) to `COLTITLE_*`.
+        @raise ValueError: When the same title is assigned to more than one column.
+        """
+        self._positions: Dict[str, int] = {}
+        for col_id, title in row_spec.items():
+            if title in self._positions:
+                raise ValueError(f"Column title '{title}' is defined at more than one column in {row_spec=}.")
+            self._positions[title] = col_id - 1
+
+    @classmethod
+    def compile(cls, row_spec: Dict[int, str]) -> "GjColumnIndex":
+        _key = tuple(sorted(row_spec.items()))
+        index = cls._compiled.get(_key)
+        if not index:
+            index = cls._compiled[_key] = cls(row_spec)
+        return index
+
+    @property
+    def positions(self) -> Dict[str, int]:
+        return self._positions
+
+    def position(self, title: str) -> int:
+        """
+        @raise ValueError: When `title` is not in the spec.
+        """
+        try:
+            return self._positions[title]
+        except KeyError:
+            raise ValueError(f"Column title '{title}' is not defined in the column spec. Defined: {list(self._positions)}")
+
+    def value(self, values: Tuple, title: str):
+        """
+        @param values: A row of values, from the 1st column. Trailing empty cells may be omitted.
+        @return: None if the cell is empty or beyond the end of `values`, or if the spec doesn't have `title`
+          (e.g. a detected spec of a sheet without an optional column).
+        """
+        _pos = self._positions.get(title)
+        if (_pos is None) or (len(values) <= _pos):
+            return None
+        return values[_pos]
+
+
+class GjHeaderDetector:
+    """
+    @summary: Builds the column spec (column number -> `GjRowEntity.COLTITLE_*`) from the Japanese titles in the title row,
+      and finds the title row itself, so that callers don't need to know which layout a workbook is in.
+      The spec is cached by the fingerprint of the title row, so the same layout is only detected once per process.
+    """
+    # The title row is looked for up to this row.
+    MAX_TITLE_ROW = 10
+    # Ingest cannot go without these.
+    REQUIRED_TITLES = (GjRowEntity.COLTITLE_STUDENT_NAME, GjRowEntity.COLTITLE_GRADE_CLASS, GjRowEntity.COLTITLE_EXEMPTED_BY)
+    # The name of each sibling has the same title "兄姉氏名", so which sibling it is depends on the class column right before it.
+    _SIBLING_NAME_AFTER = {
+        GjRowEntity.COLTITLE_SIBLING_2_CLASS: GjRowEntity.COLTITLE_SIBLING_2_PERSONNAME,
+        GjRowEntity.COLTITLE_SIBLING_3_CLASS: GjRowEntity.COLTITLE_SIBLING_3_PERSONNAME,
+    }
+    _TEXT_SIBLING_NAME = GjRowEntity.COL_TITLE_TEXTS[GjRowEntity.COLTITLE_SIBLING_2_PERSONNAME]
+    _specs_detected: Dict[Tuple[str, ...], Dict[int, str]] = {}
+    _titles_by_text: Dict[str, str] = {}
+
+    @staticmethod
+    def normalize(text) -> str:
+        """
+        @summary: NFKC (e.g. "２" -> "2", full-width alphabets -> half-width), and without any whitespace incl. "\u3000".
+        """
+        if text is None:
+            return ""
+        return "".join(unicodedata.normalize("NFKC", str(text)).split())
+
+    @classmethod
+    def fingerprint(cls, values: Tuple) -> Tuple[str, ...]:
+        _normalized = [cls.normalize(value) for value in values]
+        while _normalized and not _normalized[-1]:
+            _normalized.pop()
+        return tuple(_normalized)
+
+    @classmethod
+    def _title_by_text(cls, text: str) -> Optional[str]:
+        if not cls._titles_by_text:
+            cls._titles_by_text = {cls.normalize(text): title for title, text in GjRowEntity.COL_TITLE_TEXTS.items()
+                                   if title not in cls._SIBLING_NAME_AFTER.values()}
+        return cls._titles_by_text.get(text)
+
+    @classmethod
+    def row_spec(cls, values: Tuple) -> Dict[int, str]:
+        """
+        @param values: Values of the title row. Either the titles in the master sheet or `GjRowEntity.COLTITLE_*`.
+        @return: Column number (1-based) -> `GjRowEntity.COLTITLE_*`. When a title appears more than once (e.g. "事務局登録TEL"),
+          the last one is taken. Unknown titles are not included.
+        @raise ValueError: When any of `REQUIRED_TITLES` is missing.
+        """
+        _fingerprint = cls.fingerprint(values)
+        if _fingerprint in cls._specs_detected:
+            return cls._specs_detected[_fingerprint]
+
+        cols_per_title = {}
+        _title_prev = None
+        for col_id, text in enumerate(_fingerprint, start=1):
+            if text == cls.normalize(cls._TEXT_SIBLING_NAME):
+                title = cls._SIBLING_NAME_AFTER.get(_title_prev)
+            else:
+                # `COLTITLE_*` itself is accepted too, e.g. as the keys of JSON.
+                title = text if text in GjRowEntity.COL_TITLE_TEXTS else cls._title_by_text(text)
+            if title:
+                cols_per_title[title] = col_id
+            _title_prev = title
+        _missing = [title for title in cls.REQUIRED_TITLES if title not in cols_per_title]
+        if _missing:
+            raise ValueError(f"Titles of {_missing} not found in the title row {values}.")
+        spec = {col_id: title for title, col_id in sorted(cols_per_title.items(), key=lambda item: item[1])}
+        cls._specs_detected[_fingerprint] = spec
+        return spec
+
+    @classmethod
+    def find_title_row(cls, rows: Iterable[SpreadsheetRow], title_row: int=None) -> Tuple[SpreadsheetRow, Dict[int, str]]:
+        """
+        @summary: Consumes `rows` up to the title row, so that the rest of `rows` are the ones after the title.
+        @param title_row: If passed, only this row is evaluated.
+        @return: The title row and the column spec built from it.
+        @raise ValueError: When no title row is found up to `MAX_TITLE_ROW`, or `title_row` doesn't have the required titles.
+        """
+        _max_title_row = title_row or cls.MAX_TITLE_ROW
+        for row in rows:
+            if _max_title_row < row.row_id:
+                break
+            if title_row and (row.row_id != title_row):
+                continue
+            try:
+                return row, cls.row_spec(row.values)
+            except ValueError:
+                if title_row:
+                    raise
+        raise ValueError(f"No title row with {cls.REQUIRED_TITLES} found up to row {_max_title_row}.")
+
+
 class GjToubanAccess:
     """
     @todo: Spreadsheet format is tied to .xls as of 2024/08 but no guarantee to stick with it in the future (so better keep that in mind when making design decisions).
@@ -211,12 +443,48 @@ class GjToubanAccess:
     _MASTERSHEET_2024 = "2024当番マスター"
     # ID of the column in a spreadsheet that shows the responsibilitys that the exemption rule is to eb applied for certain assignment.
     COL_ROW_EXEMPT = "X"
-    NAME_TOSHOIIN = "図書委員"
-    LIST_AVAILABLE_TARGET = [NAME_TOSHOIIN]
-
-    def __init__(self, logger_obj=None):
+    NAME_TOSHOIIN = Roles_Definition.TOSHO_COMMITEE.value
+    LIST_AVAILABLE_TARGET = [role.value for role in Roles_Definition if role != Roles_Definition.UNDEFINED]
+    # Header of the `Table` the family rows are read into on request (`read_table`), whichever the layout of the source is.
+    # The ingest itself streams the rows into `GjPersonRecord`s, see `records_from_rows`.
+    # No column is typed: every column of the master sheet, incl. "No", can be empty.
+    TABLE_HEADER = tuple(GjRowEntity.COL_TITLE_TEXTS)
+    # If False, the workbook is always read by the public API of openpyxl. See `open_sheet_readonly`.
+    SINGLE_SHEET_READER = True
+    # Columns a `GjPersonRecord` is made of, in the order `_records` takes.
+    COLTITLES_RECORD = (GjRowEntity.COLTITLE_ID_IN_SHEET, GjRowEntity.COLTITLE_STUDENT_NAME, GjRowEntity.COLTITLE_EMAIL_EMERGENCY,
+                        GjRowEntity.COLTITLE_PHONE_EMERGENCY, GjRowEntity.COLTITLE_GRADE_CLASS, GjRowEntity.COLTITLE_EXEMPTED_BY,
+                        GjRowEntity.COLTITLE_GUARDIAN_NAME)
+
+    # Sibling columns, in the order of `GjPersonRecord.siblings`.
+    COLTITLES_SIBLING_CLASS = (GjRowEntity.COLTITLE_SIBLING_2_CLASS, GjRowEntity.COLTITLE_SIBLING_3_CLASS, GjRowEntity.COLTITLE_SIBLING_4_CLASS)
+
+    def __init__(self, logger_obj=None, collapse_households: bool=True):
+        """
+        @param collapse_households: If True, rows of the same household (see `GjHouseholdIndex`) are made a single person.
+        """
         self._logger = GjUtil.get_logger(__name__, logger_obj)
         self._touban_master_sheet = None
+        # None until the first ingest.
+        self._exemption_index = None
+        self._collapse_households = collapse_households
+        self._household_index = GjHouseholdIndex(self._logger)
+
+    @property
+    def exemption_index(self) -> Optional[GjExemptionIndex]:
+        """
+        @return: Index of every row read in the last ingest, incl. the rows collapsed into another, and of the persons made.
+          None before any ingest.
+          With `gj.multi_roster.GjMultiRosterIngest`, row IDs of different sources are mixed, but person IDs are not.
+        """
+        return self._exemption_index
+
+    @property
+    def household_index(self) -> GjHouseholdIndex:
+        """
+        @return: Households of the persons made in the last ingest, incl. the rows collapsed. Also set to the `PersonBank`.
+        """
+        return self._household_index
 
     @staticmethod
     def get_a_sheet_by_name(workbook, sheet_name):
@@ -230,16 +498,6 @@ class GjToubanAccess:
                 return sheet
         raise LookupError(f"Requested sheet '{sheet_name}' not found in the given workbook obj.")
 
-    def get_a_spread_sheet(self, path_xls, sheet_name=_MASTERSHEET_2024):
-        # 'data_only=True' is needed in order to read a value from each cell, not the macro formula.
-        # See https://stackoverflow.com/a/35624928/577001
-        wb = pyxl.load_workbook(path_xls, data_only=True)
-        sheet = self.get_a_sheet_by_name(wb, sheet_name)
-        if not sheet:
-            raise ValueError("In the workbook '{}', no sheet found that has the name '{}'".format(
-                wb.title, sheet_name))
-        return sheet
-
     @staticmethod
     def get_a_sheet(workbook, suffix_master_file):
         """
@@ -251,50 +509,194 @@ class GjToubanAccess:
             if sheet.title.endswith(suffix_master_file):
                 return sheet
 
-    @staticmethod
-    def first_empty_row(sheet: pyxl.worksheet.worksheet) -> int:
+    def open_sheet_readonly(self, path_xls, sheet_name):
         """
-        @description: Find the first empty row in the given sheet.
+        @summary: Opens the workbook read-only and data-only, with only `sheet_name` set up if `SINGLE_SHEET_READER`
+          and openpyxl is of a version `_SingleSheetReader` works with. Otherwise, or if it fails in any way
+          (it depends on openpyxl internals, so a change there may surface as any error), by the public
+          `openpyxl.load_workbook(read_only=True)`, which sets up every sheet.
+          Either way the dimension recorded in the file is not relied on for the sheet (`reset_dimensions`).
+        @return: The workbook, and the sheet. Close the workbook when done, as in read-only mode the file stays open until then.
+        @raise LookupError: When `sheet_name` is not in the workbook.
         """
-        # Iterate through each row in the sheet and check if all cells are None    
-        for row_num, row in enumerate(sheet.iter_rows(min_row=1, max_row=sheet.max_row), start=1):
-            if all(cell.value is None for cell in row):
-                return row_num
-        return sheet.max_row + 1 # If no empty row is found, return the next row number
-
-    def get_touban_master_sheet(self, path_xls, sheet_name=_MASTERSHEET_2024):
-        if not path_xls:
-            raise ValueError("Either/Both args 'path_xls' and/or 'sheet_struct' is empty.")
-        sheet = self.get_a_spread_sheet(path_xls, sheet_name)
-        return sheet
+        wb = None
+        if self.SINGLE_SHEET_READER and _HAS_READER_INTERNALS:
+            try:
+                reader = _SingleSheetReader(path_xls, sheet_name)
+                reader.read()
+                wb = reader.wb
+            except Exception as e:
+                self._logger.warning(f"Reading only the sheet '{sheet_name}' failed with openpyxl {pyxl.__version__}. "
+                                     f"Reading the workbook as a whole instead. {e!r}")
+        if wb is None:
+            # 'data_only=True' is needed in order to read a value from each cell, not the macro formula.
+            # See https://stackoverflow.com/a/35624928/577001
+            wb = pyxl.load_workbook(path_xls, read_only=True, data_only=True)
+        if sheet_name not in wb.sheetnames:
+            wb.close()
+            raise LookupError(f"Requested sheet '{sheet_name}' not found in the workbook '{path_xls}'.")
+        sheet = wb[sheet_name]
+        # Public API, so that the dimension isn't relied on even if `_UnsizedReadOnlyWorksheet` no longer takes effect.
+        sheet.reset_dimensions()
+        return wb, sheet
+
+    def iter_sheet_rows(self, path_xls, sheet_name=_MASTERSHEET_2024, min_row=1, allow_empty_until=0) -> Iterator[SpreadsheetRow]:
+        """
+        @summary: Streams the rows of a single sheet as values, in a single pass, up to the row before the first empty row.
+          The workbook is opened in read-only mode, so neither the other sheets nor cell objects are loaded,
+          and memory usage does not grow with the size of the workbook.
+          The workbook is closed when the iteration ends, or when the generator is closed.
+        @param min_row: Rows before this are not yielded, and not evaluated for emptiness either.
+        @param allow_empty_until: Empty rows up to this row are yielded instead of ending the stream,
+          e.g. for the rows above the title row to be looked at.
+        @raise LookupError: When `sheet_name` is not in the workbook.
+        """
+        wb, sheet = self.open_sheet_readonly(path_xls, sheet_name)
+        try:
+            for row_id, values in enumerate(sheet.iter_rows(min_row=min_row, values_only=True), start=min_row):
+                if (allow_empty_until < row_id) and all(value is None for value in values):
+                    self._logger.info(f"Row {row_id} is empty. Rows after it are not read.")
+                    return
+                yield SpreadsheetRow(values, row_id)
+        finally:
+            # In read-only mode the file stays open until the workbook is closed.
+            wb.close()
 
     def get_candidates(self, sheet, key_target):
         """
-        @param key_target: E.g. NAME_TOSHOIIN
+        @summary: Looks up `exemption_index` of the last ingest, so that no column is scanned again.
+        @param sheet: The worksheet that the last ingest read, e.g. by `gj_xls_to_personobj`, opened by the caller
+          (e.g. `openpyxl.load_workbook(path, data_only=True)`). Only the cells matched are accessed.
+        @param key_target: Any of `LIST_AVAILABLE_TARGET`, e.g. NAME_TOSHOIIN, or `Roles_Definition`.
         @rtype: 1) [[cell]], 2) [int]
+        @raise RuntimeError: When nothing has been ingested yet.
         """
+        if isinstance(key_target, Roles_Definition):
+            key_target = key_target.value
         if key_target not in self.LIST_AVAILABLE_TARGET:
             raise ValueError("The passed key_target='{}' is not present in the available targets '{}'.".format(
                 key_target, self.LIST_AVAILABLE_TARGET))
-        
-        rows_matched = []
+        if self._exemption_index is None:
+            raise RuntimeError("No exemption index. Ingest the sheet first, e.g. by `gj_xls_to_personobj`.")
+
         # ID of the rows that meet the search criteria
-        row_ids = []
-        for cell in sheet[self.COL_ROW_EXEMPT]:
-            if cell.value == key_target:
-                row_ids.append(cell.row)  # 'row' is not intuitive way to get row number but it works.
-        self._logger.debug(f"row_ids: {row_ids}")    
-        # Haven't found openpyxl API way of knowing the row number,
-        # so maually figuring here...
-        for row_id in row_ids:
-            row = sheet[row_id]
-            # Verify the row ID matches with what we want.
-            if row[0].row == row_id:  # Again, 'row' returning row ID is unintuitive, but this is the way..
-                rows_matched.append(sheet[row_id])
+        row_ids = self._exemption_index.row_ids(key_target)
+        self._logger.debug(f"row_ids: {row_ids}")
+        rows_matched = [sheet[row_id] for row_id in row_ids]
         self._logger.debug(f"Rows matched: {rows_matched}")
         return rows_matched, row_ids
 
-    def gj_xls_to_personobj(self, path_to_xls: str, sheet_name: str, title_row=3, row_spec=GjRowEntity.COL_TITLE_IDS_20250503) -> PersonBank:
+    def _person_rows(self, rows: Iterator[SpreadsheetRow], title_row: int=None, row_spec=None) -> Iterator[Tuple[SpreadsheetRow, Dict[int, str]]]:
+        """
+        @summary: Out of the rows of a sheet (xlsx, CSV etc.), streams the rows after the title row up to the first empty row,
+          together with the column spec.
+          The title row and/or the column spec are detected from the sheet (`GjHeaderDetector`) unless passed.
+        @param rows: Rows from the top of the sheet, or from right after `title_row` when both `title_row` and `row_spec` are passed.
+        """
+        if title_row and row_spec:
+            rows = (row for row in rows if title_row < row.row_id)
+        else:
+            row_title, _row_spec_detected = GjHeaderDetector.find_title_row(rows, title_row)
+            self._logger.info(f"Title row: {row_title.row_id}, columns detected: {_row_spec_detected}")
+            row_spec = row_spec or _row_spec_detected
+        for row in rows:
+            if all(value is None for value in row.values):
+                self._logger.info(f"Row {row.row_id} is empty. Rows after it are not read.")
+                return
+            yield row, row_spec
+
+    @staticmethod
+    def _picked(person_rows: Iterable[Tuple[SpreadsheetRow, Dict[int, str]]], titles: Tuple[str, ...]) -> Iterator[Tuple]:
+        """
+        @param person_rows: As `_person_rows` yields.
+        @return: (row ID, values of `titles`) per row. None for a column the layout doesn't have.
+        """
+        # Position in the row of each of `titles`, per column spec. Rows of a file normally share one spec.
+        _positions_per_spec = {}
+        for row, row_spec in person_rows:
+            _spec_positions = _positions_per_spec.get(id(row_spec))
+            if _spec_positions is None:
+                _positions = GjColumnIndex.compile(row_spec).positions
+                # The spec is kept along, so that its id isn't reused while this runs.
+                _spec_positions = _positions_per_spec[id(row_spec)] = (row_spec, [_positions.get(title) for title in titles])
+            values = row.values
+            _num_values = len(values)
+            yield (row.row_id, *(values[pos] if (pos is not None) and (pos < _num_values) else None for pos in _spec_positions[1]))
+
+    def table_from_rows(self, person_rows: Iterable[Tuple[SpreadsheetRow, Dict[int, str]]]) -> Table:
+        """
+        @summary: Family rows into a `Table` whose header is `TABLE_HEADER`, i.e. the columns of every layout line up by `COLTITLE_*`.
+          Columns the layout doesn't have are None.
+          The table holds every row, so unlike `records_from_rows` memory grows with the file. For when all the rows are
+          looked at column-wise, e.g. `read_table`.
+        @param person_rows: As `_person_rows` yields.
+        """
+        table = Table(self.TABLE_HEADER)
+        for row_id, *values in self._picked(person_rows, self.TABLE_HEADER):
+            table.append(values, row_id)
+        return table
+
+    def records_from_rows(self, person_rows: Iterable[Tuple[SpreadsheetRow, Dict[int, str]]]) -> Iterator[GjPersonRecord]:
+        """
+        @summary: Maps each family row to `GjPersonRecord` as the rows are streamed, reading only the columns needed.
+          Rows without the name of the student are skipped.
+        @param person_rows: As `_person_rows` yields.
+        """
+        return self._records(self._picked(person_rows, self.COLTITLES_RECORD + self.COLTITLES_SIBLING_CLASS))
+
+    def records_from_table(self, table: Table) -> Iterator[GjPersonRecord]:
+        """
+        @summary: Same as `records_from_rows` for the rows of `table` (made by `table_from_rows`).
+        """
+        return self._records(zip(table.row_ids, *(table.column(title) for title in self.COLTITLES_RECORD + self.COLTITLES_SIBLING_CLASS)))
+
+    @staticmethod
+    def family_id(id_in_sheet, row_count: int) -> Optional[int]:
+        """
+        @summary: ID of a family row. The ID in the sheet, or `row_count` (the count of the row from the title row) when the cell is empty.
+        @return: None when the cell is neither empty nor a whole number, e.g. "A-12".
+        """
+        if not id_in_sheet:
+            return row_count
+        try:
+            # Covers "12" as well as 12.0, which a number cell may be read as.
+            _id = float(id_in_sheet)
+        except (TypeError, ValueError):
+            return None
+        return int(_id) if _id.is_integer() else None
+
+    def _records(self, rows: Iterable[Tuple]) -> Iterator[GjPersonRecord]:
+        """
+        @param rows: (row ID, values of `COLTITLES_RECORD`, values of `COLTITLES_SIBLING_CLASS`) per row.
+        """
+        # Each row should obtain the ID number from a cell in each row in the spreadsheet,
+        # but how reliably maintained the ID in the spreadsheet is unknown. So here
+        # maintaining ID as well. This is just a backup.
+        for _row_count, (row_id, id_in_sheet, name, email, phone, grade_class, exempted_on, guardian_name, *siblings) in enumerate(
+                rows, start=1):
+            if not name:
+                self._logger.warning(f"Student name empty at {_row_count=}. Likely empty row. Skipping.")
+                continue
+            _family_id_in_sheet = self.family_id(id_in_sheet, _row_count)
+            self._logger.debug(f"{_family_id_in_sheet=}")
+            if _family_id_in_sheet is None:
+                self._logger.error(f"Row #{row_id}. Skipping as the ID '{id_in_sheet}' is not a number.")
+                continue
+            if not grade_class:
+                self._logger.warning(f"Grade/Class is empty at {_row_count=}.")
+            yield GjPersonRecord(
+                row_id=row_id,
+                id=_family_id_in_sheet,
+                name=name,
+                email=email,
+                phone=phone,
+                grade_class=grade_class,
+                exempted_on=exempted_on,
+                guardian_name=guardian_name,
+                siblings=tuple(str(sibling) for sibling in siblings if sibling))
+
+    def gj_xls_to_personobj(self, path_to_xls: str, sheet_name: str, title_row: int=None, row_spec: Dict[int, str]=None,
+                            cache=None) -> PersonBank:
         """
         @description Convert GJLS' .xls specific format to the format this package can handle.
 
@@ -304,78 +706,226 @@ class GjToubanAccess:
 
         @param title_row: The row where the values represent the type of the info that the cells under each column carries.
           As of 20240827, this title row must be a single row (i.e. Cases where titles are written in multiple rows are not yet supported).
+          If None, the title row is detected by its titles, up to `GjHeaderDetector.MAX_TITLE_ROW`.
+        @param row_spec: E.g. `GjRowEntity.COL_TITLE_IDS_20250503`. If None, the columns are detected from the titles in the title row.
+        @param cache: `gj.roster_cache.GjRosterCache`. If passed, the rows parsed last time are reused as long as
+          neither the file nor the args changed, and the workbook isn't opened at all.
+        @raise ValueError: When the title row or a required column is not found.
         """
-        persons = []
-        # Read .xls file into a Python objects
-        rows_xls_obj = self.get_touban_master_sheet(path_to_xls, sheet_name=sheet_name)
-        # Each row should obtain the ID number from a cell in each row in the spreadsheet,
-        # but how reliably maintained the ID in the spreadsheet is unknown. So here
-        # maintaining ID as well. This is just a backup.
-        _row_count = 0
-        # Parse each row object, create 'PersonPlayer' object per each person.        
+        if cache:
+            records = self.xls_records_cached(path_to_xls, sheet_name, cache, title_row=title_row, row_spec=row_spec)
+        else:
+            # Persons are made as the rows are streamed.
+            records = self.iter_xls_records(path_to_xls, sheet_name, title_row=title_row, row_spec=row_spec)
+        return self.persons_from_records(records, path_to_xls)
 
-        _max_row_id = self.first_empty_row(rows_xls_obj)
-        self._logger.info(f"{rows_xls_obj.max_row=}, {_max_row_id}")
-        for row_pyxl in rows_xls_obj:
-            if _max_row_id < _row_count:
-                break
-            # If the row is title, set title flag.
-            is_title_row = True if row_pyxl[0].row == title_row else False
+    def _xls_person_rows(self, path_to_xls: str, sheet_name: str, title_row: int=None, row_spec: Dict[int, str]=None):
+        """
+        @return: `_person_rows` of the sheet, streamed from the workbook. Close it for the workbook to be closed before the end.
+        """
+        # Rows before the title row do not carry person info, so with the title row known the streaming starts after it.
+        # Otherwise the rows above are read to find it, and empty ones among them must not end the stream.
+        _title_known = bool(title_row and row_spec)
+        rows = self.iter_sheet_rows(
+            path_to_xls, sheet_name=sheet_name,
+            min_row=title_row + 1 if _title_known else 1,
+            allow_empty_until=0 if _title_known else (title_row or GjHeaderDetector.MAX_TITLE_ROW))
+        return contextlib.closing(rows), self._person_rows(rows, title_row, row_spec)
+
+    def iter_xls_records(self, path_to_xls: str, sheet_name: str, title_row: int=None, row_spec: Dict[int, str]=None) -> Iterator[GjPersonRecord]:
+        """
+        @summary: Streams the family rows of the sheet as `GjPersonRecord`. The workbook is closed once the generator is exhausted or closed.
+        @see: `gj_xls_to_personobj` for the args.
+        """
+        closing, person_rows = self._xls_person_rows(path_to_xls, sheet_name, title_row=title_row, row_spec=row_spec)
+        with closing:
+            yield from self.records_from_rows(person_rows)
 
-            # If the row is earlier thatn title row, do not look for person info.
-            if row_pyxl[0].row <= title_row:
-                continue
+    def xls_table(self, path_to_xls: str, sheet_name: str, title_row: int=None, row_spec: Dict[int, str]=None) -> Table:
+        """
+        @summary: The family rows of the sheet as a `Table` (see `table_from_rows`). The workbook is streamed and closed when done.
+        @see: `gj_xls_to_personobj` for the args.
+        """
+        closing, person_rows = self._xls_person_rows(path_to_xls, sheet_name, title_row=title_row, row_spec=row_spec)
+        with closing:
+            return self.table_from_rows(person_rows)
 
-            row = GjRowEntity(SpreadsheetRow(row_pyxl, is_title_row), row_spec, self._logger)
-            _row_count += 1
-            # Identify GJ role(s), and deduce the responsibility from the role(s).
-            a_role = Role(row.exempted_on)
-            _responsibility = None
-            try:
-                # TODO Assign role in addition to responsibility, for Tosho, Patrol.
-                #_responsibility_id = self.match_responsibility(a_role)
-                _responsibility = GjUtil.corresponding_responsibility(a_role)
-            except ValueError as e:
-                self._logger.error(f"Column #{row.row_id}. Skipping as an unknown error occurred. {str(e)}")
-                continue
+    def xls_records_cached(self, path_to_xls: str, sheet_name: str, cache, title_row: int=None, row_spec: Dict[int, str]=None) -> List[GjPersonRecord]:
+        """
+        @summary: Records of `iter_xls_records` through `cache` (`gj.roster_cache.GjRosterCache`): read from it if valid, otherwise parsed and stored.
+        """
+        records = cache.load(path_to_xls, sheet_name, title_row, row_spec)
+        if records is None:
+            records = list(self.iter_xls_records(path_to_xls, sheet_name, title_row=title_row, row_spec=row_spec))
+            cache.store(records, path_to_xls, sheet_name, title_row, row_spec)
+        return records
 
-            if row.id_in_sheet:
-               _family_id_in_sheet = int(row.id_in_sheet)
-            else:
-                _family_id_in_sheet = _row_count
-            self._logger.debug(f"{_family_id_in_sheet=}")
+    @staticmethod
+    def _value_or_none(value: str):
+        return value if value != "" else None
 
-            _student_fullname = ""
+    def iter_csv_rows(self, path_csv: str, delimiter: str=None, encoding: str="utf-8-sig") -> Iterator[SpreadsheetRow]:
+        """
+        @summary: Streams the rows of a CSV/TSV file as `SpreadsheetRow`, with empty cells as None as in an .xlsx.
+        @param delimiter: If None, tab for a ".tsv" file, otherwise comma.
+        @param encoding: Default takes care of the BOM that Excel puts on a CSV. A CSV saved by Excel in Japanese locale may need "cp932".
+        """
+        if not delimiter:
+            delimiter = "\t" if path_csv.lower().endswith(".tsv") else ","
+        with open(path_csv, newline="", encoding=encoding) as f:
+            for row_id, values in enumerate(csv.reader(f, delimiter=delimiter), start=1):
+                yield SpreadsheetRow(tuple(map(self._value_or_none, values)), row_id)
+
+    def gj_csv_to_personobj(self, path_csv: str, title_row: int=None, row_spec: Dict[int, str]=None,
+                            delimiter: str=None, encoding: str="utf-8-sig") -> PersonBank:
+        """
+        @summary: Same as `gj_xls_to_personobj` for the family master exported as CSV/TSV (the columns and the rows above the title
+          as in the .xlsx). Rows are streamed, so only the persons made are kept in memory.
+        @raise ValueError: When the title row or a required column is not found.
+        """
+        rows = self.iter_csv_rows(path_csv, delimiter=delimiter, encoding=encoding)
+        return self.persons_from_records(self.records_from_rows(self._person_rows(rows, title_row, row_spec)), path_csv)
+
+    def csv_table(self, path_csv: str, title_row: int=None, row_spec: Dict[int, str]=None,
+                  delimiter: str=None, encoding: str="utf-8-sig") -> Table:
+        """
+        @summary: The family rows of a CSV/TSV as a `Table` (see `table_from_rows`).
+        @see: `gj_csv_to_personobj` for the args.
+        """
+        rows = self.iter_csv_rows(path_csv, delimiter=delimiter, encoding=encoding)
+        return self.table_from_rows(self._person_rows(rows, title_row, row_spec))
+
+    def iter_jsonl_rows(self, path_jsonl: str, encoding: str="utf-8") -> Iterator[Tuple[SpreadsheetRow, Dict[int, str]]]:
+        """
+        @summary: Streams a JSON Lines file, where each line is an object per family, as `SpreadsheetRow` and its column spec.
+          The keys are either `GjRowEntity.COLTITLE_*` or the titles in the master sheet (e.g. "学年組"). Empty lines are skipped.
+        @raise ValueError: When a line is not a JSON object, or the keys miss a required column.
+        """
+        # Lines in a file normally share the same keys, so the column spec is made once per set of keys.
+        _specs_per_keys: Dict[Tuple[str, ...], Dict[int, str]] = {}
+        with open(path_jsonl, encoding=encoding) as f:
+            for line_num, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                obj = json.loads(line)
+                if not isinstance(obj, dict):
+                    raise ValueError(f"Line {line_num} of '{path_jsonl}' is not a JSON object.")
+                _keys = tuple(obj)
+                spec = _specs_per_keys.get(_keys)
+                if spec is None:
+                    spec = _specs_per_keys[_keys] = GjHeaderDetector.row_spec(_keys)
+                yield SpreadsheetRow(tuple(self._value_or_none(value) for value in obj.values()), line_num), spec
+
+    def gj_jsonl_to_personobj(self, path_jsonl: str, encoding: str="utf-8") -> PersonBank:
+        """
+        @see: `iter_jsonl_rows` for the format.
+        """
+        return self.persons_from_records(self.records_from_rows(self.iter_jsonl_rows(path_jsonl, encoding=encoding)), path_jsonl)
+
+    @staticmethod
+    def _ext(path: str) -> str:
+        return os.path.splitext(path)[1].lower()
+
+    def gj_file_to_personobj(self, path: str, sheet_name: str=None, cache=None) -> PersonBank:
+        """
+        @summary: Picks the reader by the file extension: ".csv"/".tsv", ".jsonl", otherwise .xlsx.
+        @param sheet_name: Only for .xlsx.
+        @param cache: Only for .xlsx. See `gj_xls_to_personobj`.
+        """
+        _ext = self._ext(path)
+        if _ext in (".csv", ".tsv"):
+            return self.gj_csv_to_personobj(path)
+        if _ext == ".jsonl":
+            return self.gj_jsonl_to_personobj(path)
+        return self.gj_xls_to_personobj(path, sheet_name=sheet_name, cache=cache)
+
+    def read_records(self, path: str, sheet_name: str=None, cache=None) -> List[GjPersonRecord]:
+        """
+        @summary: All the family rows of a file of any format `gj_file_to_personobj` takes, as `GjPersonRecord`,
+          without making persons. E.g. to parse in another process, as records pickle much lighter than persons.
+        @param cache: Only for .xlsx. See `gj_xls_to_personobj`.
+        """
+        _ext = self._ext(path)
+        if _ext in (".csv", ".tsv"):
+            return list(self.records_from_rows(self._person_rows(self.iter_csv_rows(path))))
+        if _ext == ".jsonl":
+            return list(self.records_from_rows(self.iter_jsonl_rows(path)))
+        if cache:
+            return self.xls_records_cached(path, sheet_name, cache)
+        return list(self.iter_xls_records(path, sheet_name))
+
+    def read_table(self, path: str, sheet_name: str=None) -> Table:
+        """
+        @summary: The family rows of a file of any format `gj_file_to_personobj` takes, as a `Table` (see `table_from_rows`).
+          The whole file is held in memory, whereas `gj_file_to_personobj` and `read_records` stream it.
+        @param sheet_name: Only for .xlsx.
+        """
+        _ext = self._ext(path)
+        if _ext in (".csv", ".tsv"):
+            return self.csv_table(path)
+        if _ext == ".jsonl":
+            return self.table_from_rows(self.iter_jsonl_rows(path))
+        return self.xls_table(path, sheet_name)
+
+    def person_from_record(self, record: GjPersonRecord) -> PersonPlayer:
+        """
+        @raise ValueError: When the value in the exemption column doesn't correspond to any responsibility.
+        """
+        # Identify GJ role(s), and deduce the responsibility from the role(s).
+        a_role = Role(record.exempted_on)
+        # TODO Assign role in addition to responsibility, for Tosho, Patrol.
+        #_responsibility_id = self.match_responsibility(a_role)
+        # TODO Not fully sure if 'exempted_on' is the correct selection.
+        _responsibility = GjUtil.corresponding_responsibility(a_role)
+        return PersonPlayer(
+            id=record.id,
+            name=record.name,
+            email_addr=record.email,
+            phone_num=record.phone,
+            grade_class=GradeUtil.find_grade(record.grade_class),  # For Grade/Class there's a designated Python class so match the input to one.
+            # A date exempting any of the children exempts the family. Grades not matching any `GjGrade` can't be exempted.
+            sibling_grades=[grade for grade in map(GradeUtil.find_grade, record.siblings) if grade is not None],
+            roles=[a_role],
+            # 2024/08 'children_ids' attribute was originally created without the knowledge of how students/guardians are 
+            # grouped into a family info. Now that it's more known, 'children_ids' doesn't seem to be needed, hence
+            # setting 'None' here
+            children_ids=None,
+            responsibilities=[_responsibility],
+        )
+
+    def _index_rows(self, records: Iterable[GjPersonRecord]) -> Iterator[GjPersonRecord]:
+        """
+        @summary: Adds each row to `exemption_index` as it passes, i.e. before a row is collapsed into another.
+        """
+        for record in records:
+            self._exemption_index.add(record.exempted_on, row_id=record.row_id)
+            yield record
+
+    def persons_from_records(self, records: Iterable[GjPersonRecord], path_to_xls: str="") -> PersonBank:
+        """
+        @summary: Also makes `exemption_index` of the rows and the persons made, and `household_index`.
+        @raise RuntimeError: When no person is made out of `records`.
+        """
+        persons = []
+        # Indexed in the same pass, as `records` may be a stream.
+        self._exemption_index = GjExemptionIndex()
+        self._household_index = GjHouseholdIndex(self._logger)
+        records = self._index_rows(records)
+        if self._collapse_households:
+            records = self._household_index.collapse(records)
+        for record in records:
+            if not self._collapse_households:
+                self._household_index.add(record.id, record.guardian_name, record.email, record.phone)
             try:
-                _student_fullname = row.person_name
+                persons.append(self.person_from_record(record))
             except ValueError as e:
-                self._logger.warning(f"{_student_fullname=} empty at {_row_count=}. Likely empty row. Skipping.")
+                self._logger.error(f"Column #{record.row_id}. Skipping as an unknown error occurred. {str(e)}")
                 continue
-  
-            # TODO Not fully sure if 'exempted_on' is the correct selection.
-            #responsibility = GjUtil.gen_responsibility(row.exempted_on)
-            if not row.grade_class:
-                self._logger.warning(f"Grade/Class is empty at {_row_count=}.")
-            self._logger.debug(f"Grade: {row.grade_class}")
-            person = PersonPlayer(
-                id =_family_id_in_sheet,
-                name =_student_fullname,
-                email_addr = row.email_emergency,
-                phone_num = row.phone_emergency,
-                grade_class = GradeUtil.find_grade(row.grade_class),  # For Grade/Class there's a designated Python class so match the input to one.
-                roles=[a_role],
-                # 2024/08 'children_ids' attribute was originally created without the knowledge of how students/guardians are 
-                # grouped into a family info. Now that it's more known, 'children_ids' doesn't seem to be needed, hence
-                # setting 'None' here
-                children_ids = None,
-                responsibilities=[_responsibility],
-            )
-            self._logger.debug(f"person ID: {person.id}, name: {person.name}")
-            persons.append(person)
+            self._exemption_index.add(record.exempted_on, person_id=record.id)
         self._logger.debug(f"Persons: {persons}, size of persons: {len(persons)}")
         if 0 == len(persons):
             raise RuntimeError(f"No person found, or at least not detected, from the gievn spreadsheet ({path_to_xls=}).")
-        return PersonBank(persons)
+        return PersonBank(persons, households=self._household_index)
 
     @abstractmethod
     def match_responsibility(self, a_role_id: Roles_Definition=""):
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import io
+import json
+import logging
+import sys
+from typing import Dict, List, NamedTuple, Optional, TextIO
+
+from gj.requirements import Consts
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from gj.util import GjUtil
+from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
+from n_to_n_matching.workdate_player import WorkDate
+
+
+class GjPersonSummary(NamedTuple):
+    person_id: int
+    name: str
+    num_leader: int
+    num_committee: int
+    num_general: int
+    date_first: Optional[datetime.date]
+    date_last: Optional[datetime.date]
+    # Max number of dates for the responsibility of the person (`Consts.ATTR_MAX_STINT_OPPORTUNITIES`). None if unknown.
+    max_allowed: Optional[int]
+
+    @property
+    def num_total(self) -> int:
+        return self.num_leader + self.num_committee + self.num_general
+
+    @property
+    def overbooked(self) -> bool:
+        return (self.max_allowed is not None) and (self.max_allowed < self.num_total)
+
+
+class GjSummaryReport:
+    """
+    @summary: Per-date and per-person summary of a solution. Each person's counts by responsibility, the first and the last date
+      and whether the person is assigned more than the allowance are computed in a single pass over the assignee lists of the dates,
+      and the text is written out at once.
+    """
+    HEADING = "Result"
+    HEADING_PERSONS = "Persons"
+    HEADING_DATES_LGTM = "Dates filled"
+    HEADING_DATES_FAILED = "Dates not-filled"
+
+    def __init__(self, solution: GjVolunteerMatching, logger_obj: logging.Logger=None):
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self._solution = solution
+        self._persons = None
+
+    @staticmethod
+    def _max_allowed(person, max_allowance: Dict) -> Optional[int]:
+        if not (max_allowance and person.responsibilities):
+            return None
+        _allowance = max_allowance.get(person.responsibilities[0].id)
+        return _allowance.get(Consts.ATTR_MAX_STINT_OPPORTUNITIES) if _allowance else None
+
+    @property
+    def persons(self) -> Dict[int, GjPersonSummary]:
+        """
+        @return: Person ID -> the summary, for every person in the bank of the solution (in its order) and any other person assigned.
+        """
+        if self._persons is None:
+            # Person ID -> [person, #leader, #committee, #general, first date, last date]
+            _counts = {}
+            _bank = self._solution.person_bank
+            for person in (_bank.persons.values() if _bank else ()):
+                _counts[person.id] = [person, 0, 0, 0, None, None]
+            for date_wd in self._solution.dates_lgtm:
+                _date = date_wd.date
+                for idx_count, persons in ((1, date_wd.assignees_leader), (2, date_wd.assignees_committee), (3, date_wd.assignees_noncommittee)):
+                    for person in persons:
+                        _count = _counts.get(person.id)
+                        if _count is None:
+                            _count = _counts[person.id] = [person, 0, 0, 0, None, None]
+                        _count[idx_count] += 1
+                        if (_count[4] is None) or (_date < _count[4]):
+                            _count[4] = _date
+                        if (_count[5] is None) or (_count[5] < _date):
+                            _count[5] = _date
+            _max_allowance = self._solution.max_allowance
+            self._persons = {
+                person_id: GjPersonSummary(person_id, person.name, num_leader, num_committee, num_general, date_first, date_last,
+                                           self._max_allowed(person, _max_allowance))
+                for person_id, (person, num_leader, num_committee, num_general, date_first, date_last) in _counts.items()}
+        return self._persons
+
+    @property
+    def persons_overbooked(self) -> List[GjPersonSummary]:
+        return [summary for summary in self.persons.values() if summary.overbooked]
+
+    def write_text(self, stream: TextIO=None):
+        """
+        @param stream: If None, `sys.stdout`.
+        """
+        buf = io.StringIO()
+        buf.write(f"{self.HEADING:*^40}\n")
+        buf.write(f"Max allowance: {self._solution.max_allowance}\n")
+        buf.write(f"{self.HEADING_PERSONS:-^40}\n")
+        for s in self.persons.values():
+            buf.write(f"P-ID {s.person_id}, #assigned date: {s.num_total} (leader {s.num_leader}, committee {s.num_committee}, "
+                      f"general {s.num_general}), first: {s.date_first}, last: {s.date_last}{', OVERBOOKED' if s.overbooked else ''}\n")
+        buf.write(f"{self.HEADING_DATES_LGTM:O^40}\n")
+        for date_wd in self._solution.dates_lgtm:
+            buf.write(f"{date_wd.name}\n\tLeader: {date_wd.assignees_leader}\n\t Commitee assignee: {date_wd.assignees_committee}\n\t"
+                      f" General assignee: {date_wd.assignees_noncommittee}\n")
+        buf.write(f"{self.HEADING_DATES_FAILED:x^40}\n")
+        for date_wd in self._solution.dates_failed:
+            buf.write(f"{date_wd.date}\n\tLeader: {date_wd.assignees_leader}\n\t Commitee assignee: {date_wd.assignees_committee}\n\t"
+                      f" General assignee: {date_wd.assignees_noncommittee}\n")
+        (stream or sys.stdout).write(buf.getvalue())
+
+    def to_dict(self) -> Dict:
+        """
+        @return: Machine-readable form of what `write_text` writes, of JSON types only.
+        """
+        def _date_dict(date_wd: WorkDate) -> Dict:
+            return {WorkDate.ATTR_DATE: str(date_wd.date),
+                    WorkDate.ATTR_LIST_ASSIGNED_LEADER: [person.id for person in date_wd.assignees_leader],
+                    WorkDate.ATTR_LIST_ASSIGNED_COMMITTEE: [person.id for person in date_wd.assignees_committee],
+                    WorkDate.ATTR_LIST_ASSIGNED_GENERAL: [person.id for person in date_wd.assignees_noncommittee]}
+
+        _max_allowance = self._solution.max_allowance or {}
+        return {
+            "max_allowance": {RespLvl(resp).name: allowance for resp, allowance in _max_allowance.items()},
+            "persons": [dict(summary._asdict(),
+                             date_first=summary.date_first and summary.date_first.isoformat(),
+                             date_last=summary.date_last and summary.date_last.isoformat(),
+                             num_total=summary.num_total,
+                             overbooked=summary.overbooked) for summary in self.persons.values()],
+            "dates_lgtm": [_date_dict(date_wd) for date_wd in self._solution.dates_lgtm],
+            "dates_failed": [_date_dict(date_wd) for date_wd in self._solution.dates_failed],
+        }
+
+    def write_json(self, stream: TextIO=None):
+        """
+        @param stream: If None, `sys.stdout`.
+        """
+        (stream or sys.stdout).write(json.dumps(self.to_dict(), ensure_ascii=False, indent=2) + "\n")
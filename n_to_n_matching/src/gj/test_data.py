@@ -18,6 +18,7 @@
 
 import itertools 
 import numpy as np
+import os
 import pytest
 
 from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
@@ -29,6 +30,9 @@ from n_to_n_matching.util import Util
 #from n_to_n_matching.test_main import fixture_dates_0, fixture_dates_1, fixture_persons_1
 from n_to_n_matching.workdate_player import DateRequirement, WorkDate
 
+# Directory of the YAML input of the fixtures, i.e. `n_to_n_matching/test`.
+base_url = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "test")
+
 
 @pytest.fixture
 def input_guardians_yaml():
@@ -36,7 +40,6 @@ def input_guardians_yaml():
 
 @pytest.fixture
 def input_dates_yaml():
-    base_url = "tbd"
     return Util.read_yaml_to_dict(base_url, "test_volunteer-dates.yaml")
 
 @pytest.fixture
@@ -82,7 +85,6 @@ def input_guardians_yaml():
 
 @pytest.fixture
 def input_dates_yaml():
-    base_url = "tbd"
     return Util.read_yaml_to_dict(base_url, "test_volunteer-dates.yaml")
 
 @pytest.fixture
@@ -128,16 +128,20 @@ So if that .xlsx file is an input data for your appliaction, check to see if the
         return assign_count, assigned_leader, assigned_committee, assigned_noncommittee
 
     @staticmethod
-    def total_persons_available(persons: PersonBank, logger=None) -> Tuple[int, int, int]:
+    def total_persons_available(persons: PersonBank, logger=None, per_household: bool=False) -> Tuple[int, int, int]:
         """
         @summary: Returns the number in the requirement. Note this method only handles the static info,
           NOT reflecting the current state of instances.
+        @param per_household: If True, the number of households (`PersonBank.households`) instead of persons, i.e. persons
+          of the same household with the same responsibility count as one.
         @note: Total #leaders is not returned, as that number could be equal to #committee. Application later should
           make a judgement to pull someone of committee persons and assigns the leader role.
         """
         if not logger:
             logger = GjUtil.get_logger()
-        avaialable_leader, avaialable_committee, avaialable_general, exempted = 0, 0, 0, 0
+        # Each person is its own household unless `per_household`.
+        _household_id = persons.households.household_id if (per_household and persons.households) else (lambda person_id: person_id)
+        avaialable_committee, avaialable_general, exempted = set(), set(), set()
 
         for person_id, person in persons.persons.items():            
             resp_ids = [rid.id for rid in person.responsibilities if rid]
@@ -146,15 +150,15 @@ So if that .xlsx file is an input data for your appliaction, check to see if the
                 # As of 202408 the logic to assign 'leader' is unclear (this needs to be asked for the domain expert).
                 # TODO For now all 'committee' member gets 1 leader value, which won't work for sure
                 # once https://github.com/kinu-garage/nton_matching/issues/22 is addressed, hence this is temporary.
-                avaialable_committee += 1
+                avaialable_committee.add(_household_id(person_id))
             elif RespLvl.GENERAL.value in resp_ids:
-                avaialable_general += 1
+                avaialable_general.add(_household_id(person_id))
             elif RespLvl.TOUBAN_EXEMPT.value in resp_ids:
-                exempted += 1
+                exempted.add(_household_id(person_id))
             else:
                 logger.error(f"Illegal person responsibility-id found. responsibilities: {Responsibility.str_responsibilities(person.responsibilities)}, {resp_ids=}. \
 Ignoring {person_id=}, Person: {person}.")
-        return avaialable_committee, avaialable_general, exempted
+        return len(avaialable_committee), len(avaialable_general), len(exempted)
 
     @staticmethod
     def total_slots_required(dates: List[WorkDate]) -> Tuple[int, int, int]:
@@ -355,6 +359,22 @@ assigned_dates: '{assigned_dates}', _stint_already_assigned: '{_stint_already_as
         logger.debug(f"needed_player: {needed_player}, available_player: {available_player}\nmax_stint: {max_stint}, available_extra: {available_extra}, unlucky: {unlucky}")
         return max_stint, available_extra, unlucky
 
+    @staticmethod
+    def max_stint_per_household(dates: List[WorkDate], workers: PersonBank, logger=None) -> Dict[RespLvl, int]:
+        """
+        @summary: Same max stint as `max_allowed_days_per_person` calculates per person, but per household (`PersonBank.households`),
+          for when the persons of a household share the load. With households of several persons, it's more than per person.
+        @return: Responsibility -> max stint per household. 0 for a responsibility no slot needs.
+        @raise ValueError: If no household with a responsibility is given in `workers` while `dates` need it.
+        """
+        needed_leader, needed_committee, needed_general = GjUtil.total_slots_required(dates)
+        available_committee, available_general, _ = GjUtil.total_persons_available(workers, logger, per_household=True)
+        if ((needed_leader or needed_committee) and not available_committee) or (needed_general and not available_general):
+            raise ValueError(f"No household to take the slots: {needed_leader=}, {needed_committee=}, {available_committee=}, {needed_general=}, {available_general=}")
+        return {RespLvl.LEADER: GjUtil.calc_stint(needed_leader, available_committee, logger)[0],
+                RespLvl.COMMITTEE: GjUtil.calc_stint(needed_committee, available_committee, logger)[0],
+                RespLvl.GENERAL: GjUtil.calc_stint(needed_general, available_general, logger)[0]}
+
     def max_allowed_days_per_person(dates: List[WorkDate], workers: PersonBank, logger=None) -> PersonBank:
         """
         @summary:  Returning 2 sets of info for 3 kinds of responsibilitys (leader, committee, generals):
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import Enum
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from gj.grade_class import GradeUtil
+from gj.requirements import Consts, DateRequirement
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from gj.role import Roles_Definition
+from gj.util import GjUtil
+from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
+from n_to_n_matching.person_player import PersonBank, PersonPlayer
+from n_to_n_matching.workdate_player import WorkDate
+
+
+class GjViolationType(Enum):
+    SLOT_COUNT = "slot_count"  # Number of assignees differs from `req_num_*`.
+    SPACING = "spacing"  # 2 dates of a person within `interval_assigneddates_*`.
+    EXEMPTED_GRADE = "exempted_grade"  # The grade of the person is exempted on the date.
+    EXCLUDED_ROLE = "excluded_role"  # The role of the person is excluded from the duty. See `DateRequirement.EXCLUDED_ROLES_PER_DUTY`.
+    TOUBAN_EXEMPT = "touban_exempt"  # The person is exempted from any duty.
+    DUPLICATE_PERSON = "duplicate_person"  # The same person more than once on a date.
+
+
+class GjViolation(NamedTuple):
+    type: GjViolationType
+    # "yyyy-mm-dd"
+    date: str
+    person_id: Optional[int]
+    responsibility: Optional[RespLvl]
+    detail: str
+
+
+class GjSolutionValidator:
+    """
+    @summary: Checks a finished solution against its requirement in O(total assignments), and returns the violations as data,
+      so that it can run after every solve.
+    """
+    _ASSIGNEE_SLOTS = ((RespLvl.LEADER, "assignees_leader", "req_num_leader"),
+                       (RespLvl.COMMITTEE, "assignees_committee", "req_num_assignee_committee"),
+                       (RespLvl.GENERAL, "assignees_noncommittee", "req_num_assignee_noncommittee"))
+    # Per duty, the responsibilities that also take a leader slot, as no person is a leader in the input data.
+    LEADER_SUBSTITUTES = {
+        Roles_Definition.SAFETY_COMMITEE: (RespLvl.COMMITTEE,),
+        Roles_Definition.TOSHO_COMMITEE: (RespLvl.COMMITTEE,),
+        Roles_Definition.HOKEN_COMMITEE: (RespLvl.GENERAL,),
+    }
+
+    def __init__(self, requirements: DateRequirement=None, logger_obj: logging.Logger=None):
+        """
+        @param requirements: If None, `reqs` of the solution validated.
+        """
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self._requirements = requirements
+
+    @staticmethod
+    def intervals(requirements: DateRequirement) -> Dict[RespLvl, int]:
+        return {RespLvl.LEADER: requirements.interval_assigneddates_leader,
+                RespLvl.COMMITTEE: requirements.interval_assigneddates_commitee,
+                RespLvl.GENERAL: requirements.interval_assigneddates_general}
+
+    @classmethod
+    def slots(cls, date_wd: WorkDate, type_duty: Roles_Definition=None) -> List[Tuple[RespLvl, List[PersonPlayer], int]]:
+        """
+        @param type_duty: If given, only the slots of `DateRequirement.RESPONSIBILITIES_PER_DUTY` of the duty.
+        @return: (responsibility, assignees, number required) of each slot of the date.
+        """
+        _responsibilities = DateRequirement.RESPONSIBILITIES_PER_DUTY.get(type_duty)
+        return [(resp, getattr(date_wd, attr_assignees), getattr(date_wd, attr_required))
+                for resp, attr_assignees, attr_required in cls._ASSIGNEE_SLOTS
+                if (not _responsibilities) or (resp in _responsibilities)]
+
+    def validate(self, solution: GjVolunteerMatching) -> List[GjViolation]:
+        """
+        @return: Empty if the solution is valid. Otherwise in the order of the dates of `solution` (`dates_lgtm` then `dates_failed`),
+          with the spacing violations last.
+        """
+        requirements = self._requirements or solution.reqs
+        _excluded_roles = {role.value for role in DateRequirement.EXCLUDED_ROLES_PER_DUTY.get(requirements.type_duty, ())}
+        violations = []
+        # Person ID -> [(date, responsibility)], to check the spacing after all the dates are read.
+        _dates_per_person = {}
+        _dates_failed = list(solution.dates_failed or [])
+        # `dates_lgtm` also has the dates that got only some of the slots filled.
+        for date_wd in list(solution.dates_lgtm) + _dates_failed:
+            _name = date_wd.name
+            _ids_on_date = set()
+            for resp, assignees, required in self.slots(date_wd, requirements.type_duty):
+                if len(assignees) != required:
+                    violations.append(GjViolation(GjViolationType.SLOT_COUNT, _name, None, resp, f"{len(assignees)} assigned, {required} required."))
+                for person in assignees:
+                    if person.id in _ids_on_date:
+                        violations.append(GjViolation(GjViolationType.DUPLICATE_PERSON, _name, person.id, resp, "Assigned more than once on the date."))
+                    else:
+                        _ids_on_date.add(person.id)
+                        _dates_per_person.setdefault(person.id, []).append((date_wd.date, resp))
+                    if any(responsibility.id == RespLvl.TOUBAN_EXEMPT for responsibility in person.responsibilities):
+                        violations.append(GjViolation(GjViolationType.TOUBAN_EXEMPT, _name, person.id, resp, "Exempted from any duty."))
+                    _roles_excluded = [role.id for role in person.roles if role.id in _excluded_roles]
+                    if _roles_excluded:
+                        violations.append(GjViolation(GjViolationType.EXCLUDED_ROLE, _name, person.id, resp,
+                                                      f"Role(s) {_roles_excluded} excluded from {requirements.type_duty}."))
+                    if date_wd.exempt_conditions and GradeUtil.included_any_grade(person.grade_classes, date_wd.exempt_conditions, logger=self._logger):
+                        violations.append(GjViolation(GjViolationType.EXEMPTED_GRADE, _name, person.id, resp,
+                                                      f"Grade(s) {person.grade_classes} are exempted ({date_wd.exempt_conditions})."))
+
+        _intervals = self.intervals(requirements)
+        for person_id, dates in _dates_per_person.items():
+            if len(dates) < 2:
+                continue
+            dates.sort(key=lambda date_resp: date_resp[0])
+            for (date_prev, _), (date_next, resp) in zip(dates, dates[1:]):
+                # Same condition as `GjVolunteerAllocationGame.can_assign` rejects with `ReasonCode.TOO_SOON`.
+                _gap = (date_next - date_prev).days
+                if _gap <= _intervals[resp]:
+                    violations.append(GjViolation(GjViolationType.SPACING, date_next.isoformat(), person_id, resp,
+                                                  f"{_gap} days after {date_prev}, more than {_intervals[resp]} required."))
+        if violations:
+            self._logger.warning(f"{len(violations)} violations found in the solution.")
+        return violations
+
+    @classmethod
+    def eligible_responsibilities(cls, responsibility: RespLvl, type_duty: Roles_Definition) -> Tuple[RespLvl, ...]:
+        """
+        @summary: Responsibilities of the persons who can take the slot of `responsibility` of the duty,
+          as `GjUtil.find_free_workers_per_responsibility` picks. See `LEADER_SUBSTITUTES`.
+        """
+        if responsibility == RespLvl.LEADER:
+            return (RespLvl.LEADER,) + cls.LEADER_SUBSTITUTES.get(type_duty, ())
+        return (responsibility,)
+
+    @classmethod
+    def eligible(cls, person: PersonPlayer, responsibility: RespLvl, type_duty: Roles_Definition) -> bool:
+        """
+        @summary: Whether `person` can take the slot of `responsibility` of the duty, as `GjUtil.find_free_workers_per_responsibility` picks.
+        """
+        _eligible = cls.eligible_responsibilities(responsibility, type_duty)
+        return any(resp_of_person.id in _eligible for resp_of_person in person.responsibilities)
+
+    def blocking_pairs(self, solution: GjVolunteerMatching, person_bank: PersonBank=None) -> List[Tuple[WorkDate, PersonPlayer, RespLvl]]:
+        """
+        @summary: A slot left unfilled on a date of `dates_failed`, and a person who could still take it: eligible, not exempted,
+          under the max stint of the responsibility, and apart enough from the dates the person is assigned on.
+          Costs O(unfilled slots * persons) on top of a pass over the assignments.
+        @param person_bank: If None, `solution.person_bank`.
+        """
+        requirements = self._requirements or solution.reqs
+        person_bank = person_bank or solution.person_bank
+        _dates_failed = list(solution.dates_failed or [])
+        if not (_dates_failed and person_bank):
+            return []
+        _excluded_roles = {role.value for role in DateRequirement.EXCLUDED_ROLES_PER_DUTY.get(requirements.type_duty, ())}
+        _intervals = self.intervals(requirements)
+        _max_allowance = person_bank.max_allowance or solution.max_allowance or {}
+        _dates_per_person = {}
+        for date_wd in list(solution.dates_lgtm) + _dates_failed:
+            for _, assignees, _ in self.slots(date_wd):
+                for person in assignees:
+                    _dates_per_person.setdefault(person.id, []).append(date_wd.date)
+
+        pairs = []
+        for date_wd in _dates_failed:
+            _ids_on_date = {person.id for _, assignees, _ in self.slots(date_wd) for person in assignees}
+            for resp, assignees, required in self.slots(date_wd, requirements.type_duty):
+                if required <= len(assignees):
+                    continue
+                _allowance = _max_allowance.get(resp)
+                _max_stint = _allowance.get(Consts.ATTR_MAX_STINT_OPPORTUNITIES) if _allowance else None
+                for person in person_bank.persons.values():
+                    _dates = _dates_per_person.get(person.id, [])
+                    if ((person.id in _ids_on_date)
+                            or (not self.eligible(person, resp, requirements.type_duty))
+                            or any(role.id in _excluded_roles for role in person.roles)
+                            or ((_max_stint is not None) and (_max_stint <= len(_dates)))
+                            or any(abs((date_wd.date - _date).days) <= _intervals[resp] for _date in _dates)
+                            or (date_wd.exempt_conditions and GradeUtil.included_any_grade(person.grade_classes, date_wd.exempt_conditions, logger=self._logger))):
+                        continue
+                    pairs.append((date_wd, person, resp))
+        return pairs
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import logging
+import os
+from typing import Dict, Iterable, List, NamedTuple
+
+import openpyxl as pyxl
+
+from gj.exporters import GjExporter
+from gj.role import Roles_Definition
+from gj.spreadsheet_access import GjColumnIndex, GjHeaderDetector, GjRowEntity, GjToubanAccess
+from gj.util import GjUtil
+from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
+from n_to_n_matching.person_player import PersonBank
+
+
+class GjWritebackReport(NamedTuple):
+    path: str
+    # Family rows whose cell(s) got a date added.
+    num_rows_updated: int
+    # Persons in the solutions without a row in the sheet.
+    ids_not_found: List[int]
+
+
+class GjAssignmentWriteback:
+    """
+    @summary: Writes the dates of solutions into the `date_assigned_*` columns of the family master, which otherwise are filled
+      by hand out of the distributable.
+
+      The source workbook is streamed row by row in read-only mode and the result is written in write-only mode into another file,
+      so neither workbook is held in memory as a whole. Each family row only looks up its ID in a map made out of the solutions beforehand.
+      Values (and formulas) of every sheet are copied as they are, but cell styles, column widths, merged cells etc. are not.
+
+      A row collapsed into the household of another at ingest (`GjHouseholdIndex.collapse`) gets the dates of that household,
+      so every row of the household is updated.
+    """
+    DUTY_COLUMNS = {
+        Roles_Definition.TOSHO_COMMITEE: GjRowEntity.COLTITLE_DATE_ASSIGNED_TOSHO,
+        Roles_Definition.HOKEN_COMMITEE: GjRowEntity.COLTITLE_DATE_ASSIGNED_HOKEN,
+        Roles_Definition.SAFETY_COMMITEE: GjRowEntity.COLTITLE_DATE_ASSIGNED_PATROL,
+    }
+    SEPARATOR = ", "
+
+    def __init__(self, separator: str=SEPARATOR, logger_obj: logging.Logger=None):
+        """
+        @param separator: Between the dates in a cell.
+        """
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self._separator = separator
+
+    @classmethod
+    def dates_by_id(cls, solutions: Iterable[GjVolunteerMatching]) -> Dict[int, Dict[str, List[str]]]:
+        """
+        @return: Person ID -> `COLTITLE_DATE_ASSIGNED_*` -> "yyyy-mm-dd" of the dates assigned, in the order of the dates.
+        @raise ValueError: When the duty of a solution doesn't have a column in `DUTY_COLUMNS`.
+        """
+        _dates = {}
+        for solution in solutions:
+            _duty = solution.reqs.type_duty
+            if _duty not in cls.DUTY_COLUMNS:
+                raise ValueError(f"No column to write the dates of '{_duty}' in. Available: {list(cls.DUTY_COLUMNS)}")
+            _title = cls.DUTY_COLUMNS[_duty]
+            for assignment in GjExporter.iter_assignments(solution):
+                _dates.setdefault(assignment.person.id, {}).setdefault(_title, []).append(assignment.date.name)
+        return {person_id: {title: sorted(set(dates)) for title, dates in per_title.items()} for person_id, per_title in _dates.items()}
+
+    def _merged(self, value, dates: List[str]) -> str:
+        # Dates already in the cell, e.g. written by hand or by an earlier run, aren't repeated.
+        if value in (None, ""):
+            _existing = []
+        elif isinstance(value, (datetime.date, datetime.datetime)):
+            # A single date entered by hand, which Excel stores as a date.
+            _existing = [value.strftime("%Y-%m-%d")]
+        else:
+            _existing = [text.strip() for text in str(value).split(self._separator.strip() or None) if text.strip()]
+        return self._separator.join(_existing + [_date for _date in dates if _date not in _existing])
+
+    @staticmethod
+    def _open_readonly(path_src: str, data_only: bool) -> pyxl.Workbook:
+        wb = pyxl.load_workbook(path_src, read_only=True, data_only=data_only)
+        # The dimension recorded in the file is not always accurate, in which case rows would be cut at a wrong max column.
+        # See `GjToubanAccess.open_sheet_readonly`.
+        for sheet in wb.worksheets:
+            sheet.reset_dimensions()
+        return wb
+
+    def write(self, path_src: str, sheet_name: str, path_dst: str, solutions: Iterable[GjVolunteerMatching], title_row: int=None,
+              person_bank: PersonBank=None) -> GjWritebackReport:
+        """
+        @param sheet_name: Of the family master in `path_src`. The other sheets are copied as they are.
+        @param path_dst: .xlsx to write. Must be other than `path_src`. Overwritten if it exists.
+        @param title_row: If None, detected by `GjHeaderDetector`.
+        @param person_bank: Made at ingest of `path_src`. Its `households` maps a row whose ID is not a person in it to the person
+          of its household. If None, `person_bank` of the first solution that has one.
+        @raise ValueError: When `path_dst` is `path_src`, or the sheet doesn't have the column of a duty in `solutions`.
+        @raise LookupError: When `sheet_name` is not in the workbook.
+        """
+        if os.path.abspath(path_src) == os.path.abspath(path_dst):
+            raise ValueError(f"The source is read while the result is written, so they must be different files. Given '{path_src}'")
+        solutions = list(solutions)
+        dates_by_id = self.dates_by_id(solutions)
+        if person_bank is None:
+            person_bank = next((solution.person_bank for solution in solutions if getattr(solution, "person_bank", None) is not None), None)
+        _households = person_bank.households if person_bank else None
+        _titles_written = {title for per_title in dates_by_id.values() for title in per_title}
+        ids_found = set()
+        _num_rows_updated = 0
+
+        # Formulas are copied as formulas, while the IDs, titles etc. are read from the values cached in the file (e.g. "=B4+1").
+        wb_src = self._open_readonly(path_src, data_only=False)
+        wb_values = self._open_readonly(path_src, data_only=True)
+        try:
+            if sheet_name not in wb_src.sheetnames:
+                raise LookupError(f"Requested sheet '{sheet_name}' not found in the workbook '{path_src}'.")
+            wb_dst = pyxl.Workbook(write_only=True)
+            for sheet_src in wb_src.worksheets:
+                sheet_dst = wb_dst.create_sheet(sheet_src.title)
+                if sheet_src.title != sheet_name:
+                    for formulas in sheet_src.iter_rows(values_only=True):
+                        sheet_dst.append(formulas)
+                    continue
+                _rows = zip(sheet_src.iter_rows(values_only=True), wb_values[sheet_name].iter_rows(values_only=True))
+
+                # Up to the title row, rows are copied as they are.
+                _positions = None
+                _max_title_row = title_row or GjHeaderDetector.MAX_TITLE_ROW
+                for row_id, (formulas, values) in enumerate(_rows, start=1):
+                    sheet_dst.append(formulas)
+                    if title_row and (row_id != title_row):
+                        continue
+                    try:
+                        _positions = GjColumnIndex.compile(GjHeaderDetector.row_spec(values)).positions
+                        break
+                    except ValueError:
+                        if title_row or (_max_title_row <= row_id):
+                            raise
+                if _positions is None:
+                    raise ValueError(f"No title row found up to row {_max_title_row} of '{sheet_name}'.")
+                _missing = _titles_written - set(_positions)
+                if _missing:
+                    raise ValueError(f"Columns {sorted(_missing)} are not in the sheet '{sheet_name}' of '{path_src}'.")
+                _pos_id = _positions.get(GjRowEntity.COLTITLE_ID_IN_SHEET)
+                _pos_max = max([_positions[title] for title in _titles_written], default=-1)
+
+                # Family rows are up to the first empty row. A family is identified as `GjToubanAccess.records_from_rows` does.
+                _in_family_rows = True
+                for _row_count, (formulas, values) in enumerate(_rows, start=1):
+                    _in_family_rows = _in_family_rows and not all(value is None for value in values)
+                    if not _in_family_rows:
+                        sheet_dst.append(formulas)
+                        continue
+                    _id_in_sheet = values[_pos_id] if (_pos_id is not None) and (_pos_id < len(values)) else None
+                    person_id = GjToubanAccess.family_id(_id_in_sheet, _row_count)
+                    if person_id is None:
+                        self._logger.warning(f"Family row {_row_count} of '{sheet_name}' is copied as it is, as the ID '{_id_in_sheet}' is not a number.")
+                        sheet_dst.append(formulas)
+                        continue
+                    if _households and (person_id not in person_bank.persons):
+                        person_id = _households.household_id(person_id)
+                    dates = dates_by_id.get(person_id)
+                    if dates:
+                        formulas = list(formulas) + [None] * (_pos_max + 1 - len(formulas))
+                        for title, _dates in dates.items():
+                            _pos = _positions[title]
+                            formulas[_pos] = self._merged(values[_pos] if _pos < len(values) else None, _dates)
+                        ids_found.add(person_id)
+                        _num_rows_updated += 1
+                    sheet_dst.append(formulas)
+            wb_dst.save(path_dst)
+        finally:
+            # In read-only mode the file stays open until the workbook is closed.
+            wb_src.close()
+            wb_values.close()
+
+        ids_not_found = sorted(set(dates_by_id) - ids_found)
+        if ids_not_found:
+            self._logger.warning(f"No row in '{sheet_name}' for the person IDs {ids_not_found}. Their dates are not written.")
+        self._logger.info(f"Dates written into {_num_rows_updated} rows, saved as '{path_dst}'.")
+        return GjWritebackReport(path_dst, _num_rows_updated, ids_not_found)
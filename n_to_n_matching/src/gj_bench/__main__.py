@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import logging
+
+from gj.role import Roles_ID
+from gj_bench.master_sheet import SyntheticMasterSheet
+from gj_bench.runner import GjBenchmark
+
+DESC_TOOL = "Benchmark of ingest, solve and output of `gjls_match` on synthetic rosters."
+
+
+def stdin():
+    parser = argparse.ArgumentParser(description=DESC_TOOL)
+    parser.add_argument("-n", "--sizes", type=int, nargs="+", default=list(GjBenchmark.DEFAULT_SIZES),
+                        help="Number of families of each roster. As of this writing solve time grows with families x dates^2, so the larger sizes take long.")
+    parser.add_argument("-w", "--weeks", type=int, default=26, help="Number of weekly dates, 1 to 52.")
+    parser.add_argument("-t", "--type_role", type=Roles_ID, choices=list(Roles_ID), nargs="+",
+                        default=list(GjBenchmark.DUTY_PER_ROLE))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-x", "--xlsx_layout", choices=list(SyntheticMasterSheet.LAYOUTS), default=SyntheticMasterSheet.LAYOUT_20250503,
+                        help="Layout of the synthetic master sheet to measure .xlsx ingest with.")
+    parser.add_argument("--no_xlsx", help="Skip .xlsx ingest.", action="store_true")
+    parser.add_argument("-o", "--output", help="Path of the result .json file. Not written if omitted.")
+    parser.add_argument("--no_memory", help="Skip tracemalloc, which slows down every stage.", action="store_true")
+    return parser.parse_args()
+
+def main():
+    _args = stdin()
+    # The app logs (incl. warnings on overbooking) per person and per date, which would otherwise dominate the timings.
+    logging.disable(logging.WARNING)
+    bench = GjBenchmark(sizes=_args.sizes, num_weeks=_args.weeks, roles=_args.type_role,
+                        seed=_args.seed, trace_memory=not _args.no_memory,
+                        xlsx_layout=None if _args.no_xlsx else _args.xlsx_layout)
+    report = bench.run()
+    print(GjBenchmark.format_table(report))
+    if _args.output:
+        GjBenchmark.write_json(report, _args.output)
+
+if __name__ == "__main__":
+    main()
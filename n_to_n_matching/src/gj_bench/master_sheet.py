@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import logging
+from typing import Dict, Iterable, List
+
+import openpyxl as pyxl
+
+from gj.spreadsheet_access import GjRowEntity, GjToubanAccess
+from gj.util import GjUtil
+from gj_bench.synthetic import SyntheticFamily
+
+GRE = GjRowEntity
+
+
+class SyntheticMasterSheet:
+    """
+    @summary: Writes synthetic families into a workbook in the layout of the family master sheet
+      (`GjRowEntity.COL_TITLE_IDS_20250503` or `COL_TITLE_IDS_202407`), so that `GjToubanAccess.gj_xls_to_personobj`
+      can be benchmarked at sizes that real sheets don't have.
+      Rows are streamed with openpyxl's write-only mode so memory stays flat regardless of the number of rows.
+    """
+    LAYOUT_20250503 = "20250503"
+    LAYOUT_202407 = "202407"
+    LAYOUTS = {
+        LAYOUT_20250503: GjRowEntity.COL_TITLE_IDS_20250503,
+        LAYOUT_202407: GjRowEntity.COL_TITLE_IDS_202407,
+    }
+    TITLE_ROW = 3
+    SHEET_NAME = GjToubanAccess._MASTERSHEET_2024
+    _NOTE_ROW_1 = "合成データ（実在の家庭の情報は含まれない）"
+
+    def __init__(self, row_spec: Dict[int, str]=GjRowEntity.COL_TITLE_IDS_20250503, logger_obj: logging.Logger=None):
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self._row_spec = row_spec
+        self._num_cols = max(row_spec)
+        # 0-based position in the row per column title.
+        self._pos = {title: col - 1 for col, title in row_spec.items()}
+
+    def title_row(self) -> List[str]:
+        """
+        @summary: Title texts in the positions defined by the row spec. The name of the 4th sibling has no title ID,
+          but is written next to its class as in the actual sheet when that column is not taken.
+        """
+        row = [None] * self._num_cols
+        for title, pos in self._pos.items():
+            row[pos] = GRE.COL_TITLE_TEXTS[title]
+        _pos_sibling4_name = self._pos[GRE.COLTITLE_SIBLING_4_CLASS] + 1
+        if (_pos_sibling4_name + 1) not in self._row_spec:
+            row[_pos_sibling4_name] = GRE.COL_TITLE_TEXTS[GRE.COLTITLE_SIBLING_3_PERSONNAME]
+        return row
+
+    def family_row(self, family: SyntheticFamily) -> List:
+        row = [None] * self._num_cols
+        pos = self._pos
+
+        def _datetime(date: datetime.date):
+            # The actual sheet holds datetime, which is what openpyxl reads back for a date cell.
+            return datetime.datetime.combine(date, datetime.time()) if date else None
+
+        row[pos[GRE.COLTITLE_ID_IN_SHEET]] = family.id
+        row[pos[GRE.COLTITLE_GRADE_CLASS]] = family.grade_class.value
+        row[pos[GRE.COLTITLE_STUDENT_NAME]] = family.student_name
+        row[pos[GRE.COLTITLE_GUARDIAN_NAME]] = family.guardian_name
+        row[pos[GRE.COLTITLE_PHONE_EMERGENCY]] = family.phone
+        row[pos[GRE.COLTITLE_EMAIL_EMERGENCY]] = family.email
+        _sibling_cols = (GRE.COLTITLE_SIBLING_2_CLASS, GRE.COLTITLE_SIBLING_3_CLASS, GRE.COLTITLE_SIBLING_4_CLASS)
+        for title, (grade, name) in zip(_sibling_cols, family.siblings):
+            row[pos[title]] = grade.value
+            row[pos[title] + 1] = name
+        row[pos[GRE.COLTITLE_DATE_ASSIGNED_TOSHO]] = _datetime(family.date_assigned_tosho)
+        row[pos[GRE.COLTITLE_DATE_ASSIGNED_HOKEN]] = _datetime(family.date_assigned_hoken)
+        row[pos[GRE.COLTITLE_DATE_ASSIGNED_PATROL]] = _datetime(family.date_assigned_patrol)
+        row[pos[GRE.COLTITLE_EXEMPTED_BY]] = family.role.value if family.role else None
+        row[pos[GRE.COLTITLE_PHONENUM_REGISTERED]] = family.phone
+        row[pos[GRE.COLTITLE_EMAIL_REGISTERED]] = family.email
+        return row
+
+    def write(self, path: str, families: Iterable[SyntheticFamily], sheet_name: str=SHEET_NAME) -> int:
+        """
+        @param families: Consumed one by one, e.g. `SyntheticRoster.iter_families`, so the whole roster never needs to be in memory.
+        @return: Number of the family rows written.
+        """
+        wb = pyxl.Workbook(write_only=True)
+        sheet = wb.create_sheet(sheet_name)
+        # Rows above the title carry notes in the actual sheet. They must not be empty, as the ingest
+        # stops at the first empty row (`GjToubanAccess.iter_sheet_rows`).
+        sheet.append([None, self._NOTE_ROW_1])
+        sheet.append([None, sheet_name])
+        sheet.append(self.title_row())
+        _count = 0
+        for family in families:
+            sheet.append(self.family_row(family))
+            _count += 1
+        wb.save(path)
+        self._logger.info(f"{_count} families written to {path}, sheet '{sheet_name}'.")
+        return _count
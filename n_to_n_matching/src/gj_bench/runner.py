@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+import logging
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from gj.printing import GjDocx
+from gj.role import Roles_Definition, Roles_ID
+from gj.roster_cache import GjRosterCache
+from gj.spreadsheet_access import GjToubanAccess2024
+from gj_bench.master_sheet import SyntheticMasterSheet
+from gj_bench.synthetic import SyntheticCalendar, SyntheticRoster
+from gj.util import GjUtil
+from gj.validator import GjSolutionValidator
+from n_to_n_matching.match_game import GjVolunteerAllocationGame
+from n_to_n_matching.person_player import PersonBank
+
+
+class GjBenchmark:
+    """
+    @summary: Times and measures the peak memory of each stage of the app (ingest, `solve()` per duty and its validation, `.docx` output)
+      on synthetic rosters of different sizes, so that the numbers can be compared between commits.
+    """
+    DEFAULT_SIZES = (100, 1000, 10000, 100000)
+    DUTY_PER_ROLE = {
+        Roles_ID.TOSHO: Roles_Definition.TOSHO_COMMITEE,
+        Roles_ID.HOKEN: Roles_Definition.HOKEN_COMMITEE,
+        Roles_ID.ANZEN: Roles_Definition.SAFETY_COMMITEE,
+    }
+    STAGE_INGEST = "ingest"
+    STAGE_INGEST_XLSX = "ingest_xlsx"
+    STAGE_INGEST_XLSX_CACHED = "ingest_cached"
+    STAGE_SOLVE = "solve"
+    STAGE_VALIDATE = "validate"
+    STAGE_DOCX = "docx"
+
+    def __init__(self,
+                 sizes=DEFAULT_SIZES,
+                 num_weeks: int=26,
+                 roles: List[Roles_ID]=list(DUTY_PER_ROLE),
+                 seed: int=0,
+                 trace_memory: bool=True,
+                 xlsx_layout: str=SyntheticMasterSheet.LAYOUT_20250503,
+                 logger_obj: logging.Logger=None):
+        """
+        @param xlsx_layout: Key of `SyntheticMasterSheet.LAYOUTS`, of the workbook that the "ingest_xlsx" stage reads.
+          If None, the stage is skipped.
+        @param trace_memory: When True, `tracemalloc` is on during every stage, which slows down each stage.
+          Timings are only comparable between results with the same value of this (recorded in the result's "meta").
+        """
+        self._logger = GjUtil.get_logger(__name__, logger_obj)
+        self._sizes = sizes
+        self._num_weeks = num_weeks
+        self._roles = roles
+        self._seed = seed
+        self._trace_memory = trace_memory
+        self._xlsx_layout = xlsx_layout
+        self._roster = SyntheticRoster(seed)
+        self._calendar = SyntheticCalendar(seed)
+
+    def _measure(self, func: Callable) -> Tuple[object, Dict[str, float]]:
+        """
+        @return: Return value of `func` and {"seconds", "peak_mib"}. "peak_mib" is the peak of what's allocated
+          on top of what was already allocated before `func`, and None without `trace_memory`.
+        """
+        _peak_mib = None
+        if self._trace_memory:
+            tracemalloc.reset_peak()
+            _current_before = tracemalloc.get_traced_memory()[0]
+        _start = time.perf_counter()
+        ret = func()
+        _seconds = time.perf_counter() - _start
+        if self._trace_memory:
+            _peak_mib = (tracemalloc.get_traced_memory()[1] - _current_before) / 2**20
+        return ret, {"seconds": _seconds, "peak_mib": _peak_mib}
+
+    def _ingest(self, records: List[dict]) -> PersonBank:
+        return PersonBank(GjVolunteerAllocationGame.create_from_dict_persons(records))
+
+    def run_size(self, num_families: int, output_dir: str) -> List[Dict]:
+        """
+        @summary: Runs every stage for a roster of `num_families`.
+          Solving changes the persons' state, so the roster is ingested again for each role.
+        """
+        results = []
+        records = self._roster.person_records(num_families)
+
+        def _add(stage, measured, role=None):
+            result = {"families": num_families, "stage": stage, "role": role, **measured}
+            self._logger.info(f"{result=}")
+            results.append(result)
+
+        _, measured = self._measure(lambda: self._ingest(records))
+        _add(self.STAGE_INGEST, measured)
+        if self._xlsx_layout:
+            # Writing the workbook is not part of the app, so it's not measured.
+            _row_spec = SyntheticMasterSheet.LAYOUTS[self._xlsx_layout]
+            _path_xlsx = os.path.join(output_dir, f"master_{num_families}.xlsx")
+            SyntheticMasterSheet(_row_spec, self._logger).write(_path_xlsx, self._roster.iter_families(num_families))
+            _, measured = self._measure(lambda: GjToubanAccess2024(self._logger).gj_xls_to_personobj(
+                _path_xlsx, SyntheticMasterSheet.SHEET_NAME, title_row=SyntheticMasterSheet.TITLE_ROW, row_spec=_row_spec))
+            _add(self.STAGE_INGEST_XLSX, measured)
+            # Same workbook again, from a warm roster cache.
+            _roster_cache = GjRosterCache(output_dir, self._logger)
+            _ingest_cached = lambda: GjToubanAccess2024(self._logger).gj_xls_to_personobj(
+                _path_xlsx, SyntheticMasterSheet.SHEET_NAME, title_row=SyntheticMasterSheet.TITLE_ROW, row_spec=_row_spec,
+                cache=_roster_cache)
+            _ingest_cached()
+            _, measured = self._measure(_ingest_cached)
+            _add(self.STAGE_INGEST_XLSX_CACHED, measured)
+        for role in self._roles:
+            person_bank = self._ingest(records)
+            dates_input = self._calendar.dates_prefs(self._num_weeks, duty_type=self.DUTY_PER_ROLE[role])
+            game = GjVolunteerAllocationGame.create_from_dictionaries_2(dates_input, person_bank, role=role.value)
+            solution, measured = self._measure(game.solve)
+            _add(self.STAGE_SOLVE, measured, role.value)
+
+            violations, measured = self._measure(lambda: GjSolutionValidator(logger_obj=self._logger).validate(solution))
+            _add(self.STAGE_VALIDATE, {**measured, "violations": len(violations)}, role.value)
+
+            _, measured = self._measure(lambda: GjDocx(output_dir).print_distributable(
+                solution=solution, requirements=solution.reqs, heading1=f"benchmark {num_families=} {role.value}"))
+            _add(self.STAGE_DOCX, measured, role.value)
+        return results
+
+    @staticmethod
+    def _git_commit() -> str:
+        try:
+            return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                                  cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def run(self) -> Dict:
+        """
+        @return: {"meta": {...}, "results": [{"families", "stage", "role", "seconds", "peak_mib"}]}
+        """
+        meta = {
+            "git_commit": self._git_commit(),
+            "python": platform.python_version(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "seed": self._seed,
+            "num_weeks": self._num_weeks,
+            "trace_memory": self._trace_memory,
+            "xlsx_layout": self._xlsx_layout,
+        }
+        results = []
+        if self._trace_memory:
+            tracemalloc.start()
+        try:
+            with tempfile.TemporaryDirectory() as output_dir:
+                for num_families in self._sizes:
+                    results.extend(self.run_size(num_families, output_dir))
+        finally:
+            if self._trace_memory:
+                tracemalloc.stop()
+        return {"meta": meta, "results": results}
+
+    @staticmethod
+    def write_json(report: Dict, path: str):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    @staticmethod
+    def format_table(report: Dict) -> str:
+        _lines = [f"{'families':>10} {'stage':<12} {'role':<6}{'seconds':>10}{'peak [MiB]':>12}"]
+        for r in report["results"]:
+            _peak = f"{r['peak_mib']:>12.1f}" if r["peak_mib"] is not None else f"{'-':>12}"
+            _lines.append(f"{r['families']:>10} {r['stage']:<12} {r['role'] or '':<6}{r['seconds']:>10.3f}{_peak}")
+        return "\n".join(_lines)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import random
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from gj.grade_class import GjGrade, GjGradeGroup
+from gj.requirements import DateRequirement
+from gj.role import Role, Roles_Definition
+from n_to_n_matching.person_player import PersonPlayer
+from n_to_n_matching.workdate_player import WorkDate
+
+
+class SyntheticFamily(NamedTuple):
+    """
+    @summary: A single row of a synthetic family master. No real family data is involved.
+    """
+    id: int
+    grade_class: GjGrade
+    student_name: str
+    guardian_name: str
+    phone: str
+    email: str
+    siblings: Tuple[Tuple[GjGrade, str], ...]  # (grade-class, name) of each sibling, up to 3.
+    role: Optional[Roles_Definition]  # None for a general guardian.
+    date_assigned_tosho: Optional[datetime.date]  # Assignments done previously in the school year.
+    date_assigned_hoken: Optional[datetime.date]
+    date_assigned_patrol: Optional[datetime.date]
+
+
+class SyntheticRoster:
+    """
+    @summary: Seeded generator of family masters of arbitrary size, for benchmarking.
+      The same `seed` and `num_families` always give the same roster.
+    """
+    # Relative number of students per class. Kindergarten and elementary classes are larger than the upper ones.
+    GRADE_WEIGHTS: Dict[GjGrade, int] = {
+        grade: (18 if grade.name.startswith("KINDER") else
+                15 if grade.name.startswith("ELEM") else
+                10 if grade.name.startswith("MIDD") else 6)
+        for grade in GjGrade}
+    # Ratio of the families per role. The rest are general guardians.
+    # `Roles_Definition.HOKEN_COMMITEE` is left out as `GjUtil.corresponding_responsibility` does not accept it yet,
+    # i.e. such a family would be skipped upon ingest.
+    ROLE_RATIOS: Dict[Roles_Definition, float] = {
+        Roles_Definition.TOSHO_COMMITEE: 0.04,
+        Roles_Definition.SAFETY_COMMITEE: 0.04,
+        Roles_Definition.GAKYU_COMMITEE: 0.06,
+        Roles_Definition.GYOJI_COMMITEE: 0.03,
+        Roles_Definition.UNDOKAI_COMMITEE: 0.03,
+        Roles_Definition.UNEI_COMMITEE: 0.01,
+        Roles_Definition.TOUBAN_COMMITEE: 0.01,
+        Roles_Definition.PHOTO_CLUE: 0.01,
+    }
+    RATIO_SIBLINGS = (0.30, 0.08, 0.01)  # Ratio of the families with 2nd, 3rd, 4th child.
+    RATIO_PREV_ASSIGNED = 0.1
+
+    def __init__(self, seed: int=0):
+        self._seed = seed
+
+    def iter_families(self, num_families: int, date_prev_assigned: datetime.date=datetime.date(2025, 4, 12)) -> Iterator[SyntheticFamily]:
+        """
+        @param date_prev_assigned: Earliest date that appears in the previous-assignment columns.
+        """
+        rand = random.Random(self._seed)
+        _grades = list(self.GRADE_WEIGHTS)
+        _grade_weights = list(self.GRADE_WEIGHTS.values())
+        _roles = list(self.ROLE_RATIOS) + [None]
+        _role_weights = list(self.ROLE_RATIOS.values()) + [1 - sum(self.ROLE_RATIOS.values())]
+
+        def _prev_date():
+            if rand.random() < self.RATIO_PREV_ASSIGNED:
+                return date_prev_assigned + datetime.timedelta(weeks=rand.randrange(8))
+            return None
+
+        for family_id in range(1, num_families + 1):
+            siblings = []
+            for ratio in self.RATIO_SIBLINGS:
+                if rand.random() >= ratio:
+                    break
+                siblings.append((rand.choices(_grades, _grade_weights)[0], f"兄姉{family_id:06d}-{len(siblings) + 2}"))
+            yield SyntheticFamily(
+                id=family_id,
+                grade_class=rand.choices(_grades, _grade_weights)[0],
+                student_name=f"生徒{family_id:06d}",
+                guardian_name=f"保護者{family_id:06d}",
+                phone=f"({rand.randrange(200, 1000)}){rand.randrange(100, 1000)}-{rand.randrange(10000):04d}",
+                # Rosters of different seeds must not look like the same households (see `gj.household.GjHouseholdIndex`).
+                email=f"family{self._seed}-{family_id:06d}@example.com",
+                siblings=tuple(siblings),
+                role=rand.choices(_roles, _role_weights)[0],
+                date_assigned_tosho=_prev_date(),
+                date_assigned_hoken=_prev_date(),
+                date_assigned_patrol=_prev_date())
+
+    def person_records(self, num_families: int) -> List[dict]:
+        """
+        @return: Input for `GjVolunteerAllocationGame.create_from_dict_persons`.
+        """
+        return [{
+            PersonPlayer.ATTR_ID: family.id,
+            PersonPlayer.ATTR_NAME: family.student_name,
+            PersonPlayer.ATTR_PHONE: family.phone,
+            PersonPlayer.ATTR_EMAIL: family.email,
+            PersonPlayer.ATTR_CHILDREN: None,
+            PersonPlayer.ATTR_GRADE_CLASS: family.grade_class.value,
+            # `Role` holds the string as in the master sheet, which is what `GjUtil.corresponding_responsibility` expects.
+            PersonPlayer.ATTR_ROLE_ID: Role(family.role.value if family.role else None),
+            } for family in self.iter_families(num_families)]
+
+
+class SyntheticCalendar:
+    """
+    @summary: Seeded generator of weekly duty calendars, in the format `GjVolunteerAllocationGame.create_from_dict_dates` takes.
+    """
+    EXEMPTABLE_GRADE_GROUPS = [
+        GjGradeGroup.KINDER_YOCHIEN, GjGradeGroup.ELEM_SHOU_LOWER, GjGradeGroup.ELEM_SHOU_UPPER,
+        GjGradeGroup.ELEM_SHOU, GjGradeGroup.MIDD_HIGH_CHUKOU]
+
+    def __init__(self, seed: int=0):
+        self._seed = seed
+
+    @staticmethod
+    def requirement(duty_type: Roles_Definition) -> dict:
+        """
+        @summary: Same requirement as what `gjls_match` uses for each duty as of 2025/05.
+        """
+        return {
+            WorkDate.ATTR_DUTY_TYPE: duty_type,
+            WorkDate.REQ_INTERVAL_ASSIGNEDDATES_LEADER: 3*7,
+            WorkDate.REQ_INTERVAL_ASSIGNEDDATES_COMMITTE: 3*7,
+            WorkDate.REQ_INTERVAL_ASSIGNEDDATES_GENERAL: 5*7,
+            WorkDate.ATTR_NUM_LEADER: 1,
+            WorkDate.ATTR_NUM_COMMITTEE: 2,
+            WorkDate.ATTR_NUM_GENERAL: 3 if duty_type == Roles_Definition.SAFETY_COMMITEE else 1,
+        }
+
+    def dates_prefs(self,
+                    num_weeks: int,
+                    duty_type: Roles_Definition=Roles_Definition.TOSHO_COMMITEE,
+                    date_start: datetime.date=datetime.date(2025, 4, 12),
+                    ratio_grade_exempted: float=0.1) -> dict:
+        """
+        @param num_weeks: 1 to 52. A date per week, on the same weekday as `date_start`.
+        @param ratio_grade_exempted: Ratio of the dates where a grade group is exempted (e.g. parents' meeting day).
+        """
+        if not (1 <= num_weeks <= 52):
+            raise ValueError(f"{num_weeks=} must be in between 1 and 52.")
+        rand = random.Random(self._seed)
+        dates = []
+        for week in range(num_weeks):
+            date = {WorkDate.ATTR_DATE: (date_start + datetime.timedelta(weeks=week)).isoformat()}
+            if rand.random() < ratio_grade_exempted:
+                date[WorkDate.ATTR_EXEMPT_GRADE] = rand.choice(self.EXEMPTABLE_GRADE_GROUPS)
+            dates.append(date)
+        return {DateRequirement.ATTR_SECTION: self.requirement(duty_type),
+                WorkDate.ATTR_SECTION: dates}
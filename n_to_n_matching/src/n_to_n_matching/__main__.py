@@ -1,7 +1,14 @@
 import argparse
+import datetime
+import os
 import sys
 
+from gj.packets import GjPacketGenerator, GjPacketRenderer
+from gj.printing import GjPdf
 from gj.role import Roles_ID
+from gj.roster_cache import GjRosterCache
+from gj.writeback import GjAssignmentWriteback
+from n_to_n_matching.profiler import NULL_PROFILER, SolveProfiler
 from n_to_n_matching.test_main import test_2, test_3
 
 DESC_TOOL = """'gjls_match' command HELP TBD."""
@@ -19,7 +26,7 @@ def stdin():
     parser = argparse.ArgumentParser(description=DESC_TOOL)
     parser.add_argument("-t", '--type_role', type=Roles_ID, choices=list(Roles_ID), nargs="+",
                         default=[Roles_ID.TOSHO])
-    parser.add_argument("-i", "--input_master_file", help="Path (relative or absolute) of the file of the list of famillies. File format: .xlsx is the only supported format for v0.2.",
+    parser.add_argument("-i", "--input_master_file", help="Path (relative or absolute) of the file of the list of famillies. File format: .xlsx, or .csv/.tsv/.jsonl of the same columns.",
                         default=_test_path_xlsx, action="store_true")
     parser.add_argument("-d", "--debug", help="Disabled by default.", action="store_true")
     parser.add_argument("-o", "--path_output", help="Path (relative or absolute) to the directory where output files will be generated", 
@@ -28,6 +35,21 @@ def stdin():
                         action="store_true")
     parser.add_argument("-s", "--master_sheet", help="Name of the sheet in the input file", 
                         default=_SHEET_NAME, action="store_true")
+    parser.add_argument("--cache", help="Reuse the rows parsed from the master file as long as the file is unchanged. Disabled by default.",
+                        action="store_true")
+    parser.add_argument("--cache_dir", help=f"Directory of the cache files for '--cache'. Default is '{GjRosterCache.DIRNAME_DEFAULT}' next to the master file.")
+    parser.add_argument("--profile", help="Record wall time per phase and write a pstats file and a Chrome trace-event JSON to the output directory. Disabled by default.",
+                        action="store_true")
+    parser.add_argument("--pdf", help="Also print the tables of all roles into a single PDF in the output directory. Disabled by default.",
+                        action="store_true")
+    parser.add_argument("--pdf_font", help="TrueType font (.ttf/.ttc) to embed in the PDFs. Default is a CJK font built into reportlab, not embedded.")
+    parser.add_argument("--export", help="Also export the assignments of each role into these formats. 'ics' writes a calendar per person into a directory.",
+                        nargs="+", choices=["csv", "json", "ics"], default=[])
+    parser.add_argument("--packets", help="Also make a notice per family of its dates across all the roles, in this format, into a directory in the output directory.",
+                        choices=GjPacketRenderer.FORMATS)
+    parser.add_argument("--compress", help="Allocate the dates to groups of interchangeable families first, then to the families. Much faster for a large master file. Disabled by default.",
+                        action="store_true")
+    parser.add_argument("--writeback", help="Path of a .xlsx to write a copy of the master file (.xlsx) into, with the dates of all the roles added to the columns of the assigned dates.")
     args = parser.parse_args()
     return args
     
@@ -36,13 +58,33 @@ def main():
     print("Python sys.path: {}".format(sys.path))
     _args = stdin()
     roles = _args.type_role
+    # The same master file is read for each role, so with the cache it's parsed only once.
+    roster_cache = GjRosterCache(_args.cache_dir) if (_args.cache or _args.cache_dir) else None
+    pdf_sections = [] if _args.pdf else None
+    solutions = []
     for role_obj in roles:
         role = role_obj.value
         print(f"011 {role_obj=}, {role=}")
         if (role == Roles_ID.ANZEN.value) or (role == Roles_ID.HOKEN.value) or (role == Roles_ID.TOSHO.value):
-            test_3(_args.input_master_file, sheet_name=_args.master_sheet, output_path=_args.path_output, role=role)
+            profiler = SolveProfiler() if _args.profile else NULL_PROFILER
+            profiler.start()
+            solution = test_3(_args.input_master_file, sheet_name=_args.master_sheet, output_path=_args.path_output, role=role, profiler=profiler,
+                              roster_cache=roster_cache, pdf_sections=pdf_sections, export_formats=_args.export, compress=_args.compress)
+            solutions.append(solution)
+            if _args.profile:
+                _timestamp = datetime.datetime.strftime(datetime.datetime.now(), '%Y-%m-%d-%H-%M-%S')
+                profiler.dump(_args.path_output, f"{_timestamp}_GJLS_{role}_profile")
         else:
             raise RuntimeError("No eligible role passed.")
+    _timestamp = datetime.datetime.strftime(datetime.datetime.now(), '%Y-%m-%d-%H-%M-%S')
+    if pdf_sections:
+        GjPdf(_args.path_output, font_path=_args.pdf_font).print_distributables(
+            pdf_sections, file_name=f"{_timestamp}_GJLS_{'_'.join(role_obj.value for role_obj in roles)}.pdf",
+            path_input_file=_args.input_master_file)
+    if _args.packets:
+        GjPacketGenerator(os.path.join(_args.path_output, f"{_timestamp}_GJLS_packets"), _args.packets, font_path=_args.pdf_font).generate(solutions)
+    if _args.writeback:
+        GjAssignmentWriteback().write(_args.input_master_file, _args.master_sheet, _args.writeback, solutions)
     #test_2()
 
 if __name__ == "__main__":
@@ -14,12 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
 import logging
-from typing import List
+from typing import List, Tuple
 
 from matching import ManyToManyMatching
 
 from gj.requirements import DateRequirement
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from n_to_n_matching.person_player import PersonPlayer
 from n_to_n_matching.util import Util
 from n_to_n_matching.workdate_player import WorkDate
 
@@ -59,6 +62,9 @@ class GjVolunteerMatching(ManyToManyMatching):
         self._dates_lgtm = dates_lgtm
         self._dates_failed = dates_failed
         self._max_allowance = max_allowance
+        # Built on the first lookup. See `reset_indexes`.
+        self._index_dates = None
+        self._index_persons = None
 
     def add_item(self, new_match):
         self._dataframe.append(new_match)
@@ -99,6 +105,56 @@ class GjVolunteerMatching(ManyToManyMatching):
     def max_allowance(self, val):
         self._max_allowance = val
 
+    @staticmethod
+    def _assignee_lists(date_wd: WorkDate) -> Tuple[Tuple[RespLvl, List[PersonPlayer]], ...]:
+        return ((RespLvl.LEADER, date_wd.assignees_leader),
+                (RespLvl.COMMITTEE, date_wd.assignees_committee),
+                (RespLvl.GENERAL, date_wd.assignees_noncommittee))
+
+    def _build_indexes(self):
+        self._index_dates = {}
+        self._index_persons = {}
+        # Failed dates can still have some assignees.
+        for date_wd in list(self._dates_lgtm) + list(self._dates_failed or []):
+            # The lists held by `WorkDate` are referred to, not copied.
+            self._index_dates[date_wd.name] = dict(self._assignee_lists(date_wd))
+            for responsibility, persons in self._assignee_lists(date_wd):
+                for person in persons:
+                    self._index_persons.setdefault(person.id, []).append((date_wd, responsibility))
+
+    def reset_indexes(self):
+        """
+        @summary: Has the indexes of `assignees` and `person_assignments` built again on the next lookup,
+          e.g. after a person is added to or removed from a date.
+        """
+        self._index_dates = self._index_persons = None
+
+    def assignees(self, date, responsibility: RespLvl) -> List[PersonPlayer]:
+        """
+        @summary: O(1) after the first lookup, which indexes all the dates (both `dates_lgtm` and `dates_failed`).
+        @param date: "yyyy-mm-dd" or `datetime.date`.
+        @return: The list of the `WorkDate` itself, i.e. not a copy, so it must not be modified through this.
+        @raise LookupError: When `date` is not in the solution.
+        """
+        if self._index_dates is None:
+            self._build_indexes()
+        _name = date.isoformat() if isinstance(date, datetime.date) else date
+        try:
+            return self._index_dates[_name][responsibility]
+        except KeyError:
+            if _name in self._index_dates:
+                raise LookupError(f"No assignees for responsibility '{responsibility}'. Available: {list(self._index_dates[_name])}")
+            raise LookupError(f"Date '{date}' is not in the solution.")
+
+    def person_assignments(self, person_id: int) -> List[Tuple[WorkDate, RespLvl]]:
+        """
+        @summary: O(1) after the first lookup, which indexes all the dates (both `dates_lgtm` and `dates_failed`).
+        @return: The dates `person_id` is assigned on and as what, in the order of the dates in the solution. Empty if none.
+        """
+        if self._index_persons is None:
+            self._build_indexes()
+        return self._index_persons.get(person_id, [])
+
     @staticmethod
     def dates_list_to_dict(list_dates: List[WorkDate]):
         """
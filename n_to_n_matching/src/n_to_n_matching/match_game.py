@@ -14,23 +14,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import Counter
 import copy
 import logging
 import random
 from typing import Dict, List, Tuple
 
 from matching import BaseGame
-from matching.exceptions import PlayerExcludedWarning
+from matching.exceptions import MatchingError, PlayerExcludedWarning
 
+from gj.equivalence import GjClassAllocation
 from gj.grade_class import GjGrade, GjGradeGroup, GradeUtil
+from gj.household import GjHouseholdLoad
+from gj.recurrence import GjDateRecord, GjRecurrence
 from gj.responsibility import Responsibility, ResponsibilityLevel
-from gj.requirements import DateRequirement
+from gj.requirements import DateRequirement, ReasonCode
 from gj.role import Roles_Definition, Roles_ID
+from gj.summary_report import GjSummaryReport
 from gj.util import GjUtil
+from gj.validator import GjSolutionValidator
 from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
 from n_to_n_matching.person_player import (AssignedDate,
                                            PersonBank,
                                            PersonPlayer)
+from n_to_n_matching.profiler import NULL_PROFILER, SolveProfiler
 from n_to_n_matching.workdate_player import WorkDate
 
 
@@ -48,6 +55,10 @@ class GjVolunteerAllocationGame(BaseGame):
         self._dates = dates
         self._person_bank = persons
         self._reqs = requirements
+        self._profiler = NULL_PROFILER
+        self._matching = None
+        # Set by `match` only when a household has more than one person.
+        self._household_load = None
         self._check_inputs()
 
         if not logger_obj:
@@ -55,27 +66,15 @@ class GjVolunteerAllocationGame(BaseGame):
         self._logger = GjUtil.get_logger(__name__, logger_obj)
 
     @classmethod
-    def print_tabular_stdout(cls, solution: GjVolunteerMatching):
-        _heading = "Result"
-        _heading_dates_lgtm = "Dates filled"
-        _heading_dates_failed = "Dates not-filled"
-        print(f"{_heading:*^40}")  # TODO Using `print`..?
-        print(f"Max allowance: {solution.max_allowance}")
-
-        for person_id, person_obj in solution.person_bank.persons.items():
-            num_assigned_dates, num_assigned_leader, num_assigned_committee, num_assigned_noncommittee = GjUtil.get_assigned_dates(
-                person_id, solution.dates_lgtm)
-            #print(f"P-ID {person_id}, responsibility: {Responsibility.str_responsibilities(person_obj.responsibilities)}, #assigned date: {num_assigned_dates}")
-        print(f"{_heading_dates_lgtm:O^40}")
-        for date, date_detail in solution.items():
-            print(f"{date}\n\tLeader: {date_detail[WorkDate.ATTR_LIST_ASSIGNED_LEADER]}\n\t",
-                  f"Commitee assignee: {date_detail[WorkDate.ATTR_LIST_ASSIGNED_COMMITTEE]}\n\t",
-                  f"General assignee: {date_detail[WorkDate.ATTR_LIST_ASSIGNED_GENERAL]}")
-        print(f"{_heading_dates_failed:x^40}")
-        for date in solution.dates_failed:
-            print(f"{date.date}\n\tLeader: {date.assignees_leader}\n\t",
-                  f"Commitee assignee: {date.assignees_committee}\n\t",
-                  f"General assignee: {date.assignees_noncommittee}")
+    def print_tabular_stdout(cls, solution: GjVolunteerMatching, as_json: bool=False):
+        """
+        @param as_json: If True, `GjSummaryReport.to_dict` as JSON instead of the text.
+        """
+        report = GjSummaryReport(solution)
+        if as_json:
+            report.write_json()
+        else:
+            report.write_text()
 
     def _check_inputs(self):
         """
@@ -129,6 +128,48 @@ class GjVolunteerAllocationGame(BaseGame):
         self._logger.info(f"{dates_attention =}\n{dates_lgtm =}")
         return dates_attention, dates_lgtm
 
+    @staticmethod
+    def can_assign(
+        date_wd: WorkDate,
+        person: PersonPlayer,
+        responsibility: ResponsibilityLevel,
+        req_space_days: int) -> ReasonCode:
+        """
+        @summary: Evaluates whether `person` can take the slot of `responsibility` on `date_wd`, without
+          changing any state. Meant to be called for every candidate in the assignment loop, so this
+          method neither raises nor formats any message.
+        @type responsibility: A specific element in `RespLvl`
+        @return: `ReasonCode.OK` if assignable, otherwise the reason why not.
+        """
+        _last_assigned_date = person.last_assigned_date
+        # If the previous assigned date is closer than what's in the requirement, this person cannot be assigned.
+        if _last_assigned_date and ((date_wd.date - _last_assigned_date.date).days <= req_space_days):
+            return ReasonCode.TOO_SOON
+
+        _enough_leaders, _enough_committee, _enough_noncommittee = date_wd.eval_enough_assignees_all()
+        if _enough_leaders and _enough_committee and _enough_noncommittee:
+            return ReasonCode.DATE_FILLED
+        elif (not _enough_leaders) and (responsibility == ResponsibilityLevel.LEADER.value):
+            return ReasonCode.OK
+        elif (not _enough_committee) and (responsibility == ResponsibilityLevel.COMMITTEE.value):
+            return ReasonCode.OK
+        elif (not _enough_noncommittee) and (responsibility == ResponsibilityLevel.GENERAL.value):
+            return ReasonCode.OK
+        return ReasonCode.SLOT_FILLED
+
+    @staticmethod
+    def assign_unchecked(
+        date_wd: WorkDate,
+        person: PersonPlayer,
+        responsibility: ResponsibilityLevel):
+        """
+        @summary: Assigns `person` to the slot of `responsibility` on `date_wd` without any screening.
+          The caller must have confirmed that `can_assign` returns `ReasonCode.OK` for the same args.
+        @type responsibility: A specific element in `RespLvl`
+        """
+        date_wd.assign_responsibility(responsibility, person)
+        person.assign_myself(AssignedDate(date_wd.date, responsibility))
+
     def assign_responsibility(
         self,
         date_wd: WorkDate,
@@ -137,48 +178,31 @@ class GjVolunteerAllocationGame(BaseGame):
         req_space_days: int,
         requirements: DateRequirement=None):
         """
+        @summary: Checked version of `assign_unchecked`, for callers outside of the assignment loop.
         @type responsibility: A specific element in `RespLvl`
         @todo Rename appropriately esp. there are other methods that have similar names.
+        @raise TypeError: When `person` or `date_wd` is not of the expected type.
         @raise ValueError:
           - Case-a. When the requirement is not met (e.g. too soon for `person` to be assigned since her/his last assignment).
-          - Case-b. (TODO needs figured out this case, which is also clarified in the inline comment section of the corresponding line.)
+          - Case-b. When the slot for `responsibility` on `date_wd` is already filled.
+          Nothing is raised when all the slots of `date_wd` are already filled; the call is a no-op then.
         """
         # BEGIN: Init screening
-        if not requirements:
-            self._logger.warning("Requirement was not passed. Using default.")
-            requirements = DateRequirement()        
         if (not isinstance(person, PersonPlayer)) or (not isinstance(date_wd, WorkDate)):
-            raise TypeError(f"One of the args' type is incompatible. person: '{type(person)}', date_wd: '{type(WorkDate)}'")
-        # If the previous assigned date is closer than what's in the requirement, this person cannot be assigned.
+            raise TypeError(f"One of the args' type is incompatible. person: '{type(person)}', date_wd: '{type(date_wd)}'")
         # END: Init screening
 
-        # If `person.last_assigned_date` is None, it's set to the same date as `date_wd`
-        # (so the `days_interval` will be 0).
-        _last_assigned_date = person.last_assigned_date if person.last_assigned_date else None
-        days_interval = (date_wd.date - _last_assigned_date.date).days if _last_assigned_date else 9999  # Setting arbitrarily impossibly large interval
-        self._logger.debug(f"**Assigning responsibility** {person.id=}: {person.last_assigned_date=}, {date_wd.date=}, {responsibility=}, {req_space_days=}, {days_interval=}")
-        if days_interval <= req_space_days:
-            raise ValueError(f"""
-                             Can't assign the person (ID={self.responsibility_id}) on {date_assigned} as this person must wait for {req_space_days} days
-                              since the last assignment on {_last_assigned_date}.""")
-
-        _enough_leaders, _enough_committee, _enough_noncommittee = date_wd.eval_enough_assignees_all()
-        if all([_enough_leaders, _enough_committee, _enough_noncommittee]):
+        reason = self.can_assign(date_wd, person, responsibility, req_space_days)
+        if reason == ReasonCode.DATE_FILLED:
             return  # TODO Think of better return value to communicate the result
-        elif (not _enough_leaders) and (responsibility == ResponsibilityLevel.LEADER.value):
-            date_wd.assignee_leader(person)
-        elif (not _enough_committee) and (responsibility == ResponsibilityLevel.COMMITTEE.value):
-            date_wd.assignee_committee(person)
-        elif (not _enough_noncommittee) and (responsibility == ResponsibilityLevel.GENERAL.value):
-            date_wd.assignee_noncommittee(person)
-        else:
+        elif reason == ReasonCode.TOO_SOON:
+            raise ValueError(f"Can't assign the person (ID={person.id}) on {date_wd.date} as this person must wait for {req_space_days} days \
+since the last assignment on {person.last_assigned_date.date}.")
+        elif reason == ReasonCode.SLOT_FILLED:
             raise ValueError(f"Not assigning '{person}' ID={person.id} as the needs didn't match the responsibilities.  \
-Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_ids(person.roles)}. {_enough_leaders=}, {_enough_committee=}, {_enough_noncommittee=}")
+Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_ids(person.roles)}. {date_wd.eval_enough_assignees_all()=}")
 
-        date_assigned = AssignedDate(date_wd.date, responsibility)
-        person.assign_myself(date_assigned)
-
-        self._log_dates("116 Memory addr of date.assignees_leader: {}".format(id(date_wd.assignees_leader)))
+        self.assign_unchecked(date_wd, person, responsibility)
 
     def _assign_day_per_responsibility(self,
             date: WorkDate,
@@ -212,20 +236,35 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
             _persons = copy.deepcopy(_fullybooked_ppl)
 
         _persons_randomized = sorted(_persons, key=lambda x: random.random())
+        if self._household_load:
+            # Households with fewer dates first. The sort is stable, so it's still random among the same number.
+            _persons_randomized.sort(key=lambda person: self._household_load.num_dates(person.id))
+        # Rejections are only counted here; formatting a message per rejected candidate is too costly in this loop.
+        _rejected = Counter()
         for person in _persons_randomized:
             # Check if there's any exemption condition for the `person` e.g. certain grade-class is exempted on this day (parents' meeting day).
-            self._logger.debug(f"173 {person=}, {person.grade_class=} {date.exempt_conditions=} on {date=}.")
-            if date.exempt_conditions and (GradeUtil.included_grade(person.grade_class, date.exempt_conditions)):
-                self._logger.debug(f"172 Skipping {person.id =} due to the exemption rule: {date.exempt_conditions=} on {date=}.")
+            if date.exempt_conditions and (GradeUtil.included_any_grade(person.grade_classes, date.exempt_conditions)):
+                _rejected["EXEMPTED_GRADE"] += 1
                 continue
 
-            try:
-                # TODO 20250305 Should call `assign_responsibility` per each resplvl
-                self.assign_responsibility(date, person, responsibility_id, req_space_days, requirements)
-            except ValueError as e:
-                self._logger.debug(f"Skipping {person.id =} for this role, continuing.")
-                self._logger.debug(f"Error received: {str(e)}.")
+            if self._household_load:
+                if self._household_load.too_soon(person.id, date.date, req_space_days):
+                    _rejected["HOUSEHOLD_TOO_SOON"] += 1
+                    continue
+                if self._household_load.full(person.id, responsibility_id, overbook):
+                    _rejected["HOUSEHOLD_FULL"] += 1
+                    continue
+
+            # TODO 20250305 Should call `assign_responsibility` per each resplvl
+            reason = self.can_assign(date, person, responsibility_id, req_space_days)
+            if reason != ReasonCode.OK:
+                _rejected[reason.name] += 1
                 continue
+            self.assign_unchecked(date, person, responsibility_id)
+            if self._household_load:
+                self._household_load.add(person.id, date.date)
+        if _rejected and self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"172 {date.name=}, {responsibility_id=}: candidates skipped per reason {dict(_rejected)}")
         return date
 
     def _extract_roles(self, person_bank: PersonBank, exempted_roles: List[Roles_Definition]) -> PersonBank:
@@ -240,7 +279,7 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
                     self._logger.debug(f"177 Skipping {pobj=} as their role {pobj.roles=} does't match the requirement.")
                     continue
                 _extracted_persons.append(pobj)
-            _person_bank_with_extracted_persons = PersonBank(_extracted_persons, person_bank.max_allowance)
+            _person_bank_with_extracted_persons = PersonBank(_extracted_persons, person_bank.max_allowance, person_bank.households)
             return _person_bank_with_extracted_persons
 
     def _assign_day(self,
@@ -252,25 +291,13 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
         @summry: Assigning a person on a single day, for which ALL the responsibilities required.
           TBD Clarify if the all required slots per responsibility for the day are filled by this or not.
         """
-        req_responsibilities = []  # TODO This is a candidate to be moved to the requirement file
-
         self._logger.debug(f"180{requirements.type_duty=}, {Roles_Definition.TOSHO_COMMITEE=}")
-        if requirements.type_duty == Roles_Definition.TOSHO_COMMITEE:
-            ### BEGIN: Very adhoc, NEEDS better design ###
-            # For Tosho, the assignable persons are either those in Tosho Committee or general
-            # Therefore, removing the members of other committees.
-            person_bank = self._extract_roles(person_bank, [Roles_Definition.HOKEN_COMMITEE, Roles_Definition.SAFETY_COMMITEE])
-            ### END: Very adhoc, NEEDS better design ###
-            req_responsibilities = [ResponsibilityLevel.GENERAL, ResponsibilityLevel.COMMITTEE, ResponsibilityLevel.LEADER]
-        elif requirements.type_duty == Roles_Definition.HOKEN_COMMITEE:
-            self._logger.debug(f"181 Hoken selected")
-            person_bank = self._extract_roles(person_bank, [Roles_Definition.SAFETY_COMMITEE, Roles_Definition.TOSHO_COMMITEE])
-            req_responsibilities = [ResponsibilityLevel.GENERAL, ResponsibilityLevel.LEADER]  # For Hoken, there's only leader or general guardians.
-        elif requirements.type_duty == Roles_Definition.SAFETY_COMMITEE:
-            person_bank = self._extract_roles(person_bank, [Roles_Definition.HOKEN_COMMITEE, Roles_Definition.TOSHO_COMMITEE])
-            req_responsibilities = [ResponsibilityLevel.GENERAL, ResponsibilityLevel.LEADER]  # For Hoken, there's only leader or general guardians.
-        else:
+        if requirements.type_duty not in DateRequirement.EXCLUDED_ROLES_PER_DUTY:
             raise ValueError(f"{requirements.type_duty=} were not identified. Returning.")
+        ### BEGIN: Very adhoc, NEEDS better design ###
+        person_bank = self._extract_roles(person_bank, list(DateRequirement.EXCLUDED_ROLES_PER_DUTY[requirements.type_duty]))
+        ### END: Very adhoc, NEEDS better design ###
+        req_responsibilities = DateRequirement.RESPONSIBILITIES_PER_DUTY[requirements.type_duty]
 
         for resp in req_responsibilities:
             # Maybe a bit unintuitive but passing a value via enum subclass is a valid way to access
@@ -317,7 +344,8 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
         # use `ATTR_UNLUCKY_PERSON_NUMS` persons.
         _enough_leaders, _enough_committee, _enough_noncommittee = date.eval_enough_assignees_all()
         if not all([_enough_leaders, _enough_committee, _enough_noncommittee]):
-            date = self._assign_day(date, person_bank, requirements, overbook=True)
+            with self._profiler.phase("overbook", date.name):
+                date = self._assign_day(date, person_bank, requirements, overbook=True)
 
     def _log_date_content(self, date, msg_prefix=""):
         self._logger.debug(f"{msg_prefix} Date={date.date} assignees stored. Leader: {date.assignees_leader}, Committee: {date.assignees_committee}, Non-commitee: {date.assignees_noncommittee}")
@@ -327,9 +355,12 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
             dates: List[WorkDate],
             person_bank: PersonBank,
             requirements: DateRequirement=None,
-            optimal="") -> Tuple[List[WorkDate], List[WorkDate], DateRequirement]:
+            optimal="",
+            compress: bool=False) -> Tuple[List[WorkDate], List[WorkDate], DateRequirement]:
         """
         @param optimal: Unused for now, kept just to make it consistent with `matching` pkg.
+        @param compress: If True, the dates are allocated to classes of interchangeable persons and then to the persons
+          by `GjClassAllocation`, instead of person by person. Much faster for a large roster.
         @return 
         @raise ValueError: If the given `dates` already filled with assignees.
         """
@@ -358,33 +389,68 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
             raise ValueError("The input `dates` have all slots filled already, which typically means you're good.")
         ## Ok, there are some dates that need assignees.
         ## Determine the maximum #days each person can be assigned to.
-        person_bank = GjUtil.max_allowed_days_per_person(dates, person_bank)
+        with self._profiler.phase("max_allowed_days_per_person"):
+            person_bank = GjUtil.max_allowed_days_per_person(dates, person_bank)
+        ## Persons of the same household share their load, when the ingest didn't collapse them.
+        self._household_load = GjHouseholdLoad.of(person_bank, dates, self._logger)
         # END: Initial screening
 
         # Assign personnels per date
-        for date in dates_need_attention:
-            self._log_date_content(date, msg_prefix="BEFORE assigning:")
-            _assignednum_before = date.get_current_assignednum()
-            self.assign_person(date, person_bank, requirements)
-            _assignednum_after = date.get_current_assignednum()
-            if (_assignednum_before < _assignednum_after):
-                dates_lgtm.append(date)
-            #dates_need_attention.remove(date)
-            self._log_date_content(date, msg_prefix="AFTER assigning a day:")
-            self._logger.info(f"AFTER assigning a day: All dates_need_attention={dates_need_attention}\n\tdates_lgtm={dates_lgtm}")
+        if compress:
+            _assignednums_before = [date.get_current_assignednum() for date in dates_need_attention]
+            with self._profiler.phase("class_allocation"):
+                GjClassAllocation(self._logger).assign(dates_need_attention, person_bank, requirements, dates_period=dates,
+                                                       household_load=self._household_load)
+            dates_lgtm.extend(date for date, _assignednum_before in zip(dates_need_attention, _assignednums_before)
+                              if _assignednum_before < date.get_current_assignednum())
+        else:
+            for date in dates_need_attention:
+                self._log_date_content(date, msg_prefix="BEFORE assigning:")
+                _assignednum_before = date.get_current_assignednum()
+                with self._profiler.phase("assign_date", date.name):
+                    self.assign_person(date, person_bank, requirements)
+                _assignednum_after = date.get_current_assignednum()
+                if (_assignednum_before < _assignednum_after):
+                    dates_lgtm.append(date)
+                #dates_need_attention.remove(date)
+                self._log_date_content(date, msg_prefix="AFTER assigning a day:")
+                self._logger.info(f"AFTER assigning a day: All dates_need_attention={dates_need_attention}\n\tdates_lgtm={dates_lgtm}")
         rest_dates_need_attention = list(set(dates_need_attention).difference(dates_lgtm))
         return dates_lgtm, rest_dates_need_attention, requirements
 
-    def solve(self, optimal="") -> GjVolunteerMatching:
+    @property
+    def profiler(self):
+        """
+        @return: `SolveProfiler` used by the last `solve(profile=...)` call, or the no-op `NULL_PROFILER`.
+        """
+        return self._profiler
+
+    def solve(self, optimal="", profile=None, compress: bool=False) -> GjVolunteerMatching:
         """
         @description: 
+        @param compress: See `match`.
+        @param profile: `SolveProfiler` to record the phases into, or True to create one (accessible via `profiler` afterwards).
+          If the passed profiler is already running (e.g. started by the caller to cover ingest as well),
+          it is left running when this method returns.
+          When falsy (default), nothing is recorded.
         """
         if not self._logger:
             # Not ideal workaround of __init__ being bypassed...
             logger_obj = GjUtil.get_logger()
             self._logger = GjUtil.get_logger(__name__, logger_obj)
 
-        dates_lgtm, dates_failed, reqs = self.match(self._dates, self._person_bank, self._reqs, optimal)
+        if not profile:
+            self._profiler = NULL_PROFILER
+        else:
+            self._profiler = profile if isinstance(profile, SolveProfiler) else SolveProfiler(self._logger)
+        _started_here = not self._profiler.running
+        self._profiler.start()
+        try:
+            with self._profiler.phase("solve"):
+                dates_lgtm, dates_failed, reqs = self.match(self._dates, self._person_bank, self._reqs, optimal, compress)
+        finally:
+            if _started_here:
+                self._profiler.stop()
         self._matching = GjVolunteerMatching(
             reqs=reqs,
             dates_lgtm=dates_lgtm,
@@ -404,6 +470,9 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
         """
         @summary: Input data converter from text-based (dictionary in .yaml) format to Python format.
           Only required attribute in each element in `dates_prefs` is `date` (i.e. other attributes are optional).
+          Instead of, or in addition to, listing the dates, they can be given as a rule in the section
+          `GjRecurrence.ATTR_SECTION` (see `gj.recurrence.GjRecurrence`). Every date of a recurrence is made a `WorkDate`,
+          sorted by date, as the solver assigns to and reads back from each of them.
         @type dates_prefs: [{}]
         @param dates_prefs: e.g. 
             [
@@ -420,8 +489,8 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
         """
         if not logger_obj:
             logger_obj = GjUtil.get_logger()
-        if WorkDate.ATTR_SECTION not in dates_prefs:
-            raise ValueError(f"A required section '{WorkDate.ATTR_SECTION}' in the input file is missing.")
+        if (WorkDate.ATTR_SECTION not in dates_prefs) and (GjRecurrence.ATTR_SECTION not in dates_prefs):
+            raise ValueError(f"Either section '{WorkDate.ATTR_SECTION}' or '{GjRecurrence.ATTR_SECTION}' is required in the input file.")
 
         # TODO This is s*upid if clause. Should `Roles_ID` and `Roles_Definition` be attempted to be consolidated.
         if role == Roles_ID.ANZEN.value:
@@ -447,13 +516,19 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
         else:
             raise ValueError(f"Requirement is missing in the input data {dates_prefs=}.\n Without the requirement passed, the app cannot function as intended.")
 
-        _dates = [WorkDate(datestr=date[WorkDate.ATTR_DATE],
-                           school_off=date.get(WorkDate.ATTR_SCHOOL_OFF, False),
-                           req_num_leader=date.get(WorkDate.ATTR_NUM_LEADER, requirement.num_leaders),
-                           req_num_committee=date.get(WorkDate.ATTR_NUM_COMMITTEE, requirement.num_committee),
-                           req_num_noncommittee=date.get(WorkDate.ATTR_NUM_GENERAL, requirement.num_general),
-                           exempt_conditions=date.get(WorkDate.ATTR_EXEMPT_GRADE, None),
-                           ) for date in dates_prefs[WorkDate.ATTR_SECTION]]
+        _nums = (requirement.num_leaders, requirement.num_committee, requirement.num_general)
+        date_records = [GjDateRecord.from_dict(GjDateRecord.to_date(date[WorkDate.ATTR_DATE]), date, *_nums)
+                        for date in dates_prefs.get(WorkDate.ATTR_SECTION, [])]
+        if GjRecurrence.ATTR_SECTION in dates_prefs:
+            # Dates listed one by one take precedence over the ones of the same date expanded from the recurrence.
+            _records_by_date = {}
+            for recurrence in GjRecurrence.from_section(dates_prefs[GjRecurrence.ATTR_SECTION]):
+                _records_by_date.update((record.date, record) for record in recurrence.iter_records(*_nums))
+            _records_by_date.update((record.date, record) for record in date_records)
+            date_records = sorted(_records_by_date.values())
+        if not date_records:
+            raise ValueError(f"No date is given in the input data {dates_prefs=}.")
+        _dates = [record.to_workdate() for record in date_records]
         requirement.dates = _dates
         # Find the earliest date in the given dates in order for that date to be the beginning of the given period.
         _date_earliest = min(date.date for date in _dates)
@@ -467,7 +542,8 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
     def create_from_dict_persons(cls, person_prefs, clean=False) -> List[PersonPlayer]:
         """
         @summary: Input data converter from text-based (dictionary in .yaml) format to Python format.
-        @type personnel_prefs: [{ "id", "name", "phone", "email", "children": {"child_id"}, "responsibility_id" }]
+        @type personnel_prefs: [{ "id", "name", "phone", "email", "children": {"child_id"}, "responsibility_id", "grade_class" }]
+        @param person_prefs: "grade_class" is optional, and is the string in the master sheet e.g. "小1－1".
         @rtype: [PersonPlayer]
         """
         _persons = []
@@ -484,6 +560,7 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
                 name=p[PersonPlayer.ATTR_NAME],
                 email_addr = p[PersonPlayer.ATTR_EMAIL],
                 phone_num = p[PersonPlayer.ATTR_PHONE],
+                grade_class = GradeUtil.find_grade(p.get(PersonPlayer.ATTR_GRADE_CLASS)),
                 roles=[a_role],  # TODO 20241022 This 'role_id' may not be yet added in the input data. Added here just to pass a test.
                 children_ids = p[PersonPlayer.ATTR_CHILDREN],
                 responsibilities=[_responsibility]
@@ -523,14 +600,30 @@ Responsibilities: {GjUtil.str_ids(person.responsibilities)}, roles: {GjUtil.str_
         game = cls(_dates, persons_obj, _reqs, clean)
         return game
 
-    def check_stability(self):
+    def check_stability(self) -> bool:
         """
         @override
+        @summary: Stores in `blocking_pairs` the (date, person, responsibility) of every slot left unfilled that a person
+          could still take. See `GjSolutionValidator.blocking_pairs`.
+        @return: True if there's no such pair.
+        @raise RuntimeError: When called before `solve`.
         """
-        pass
+        if self._matching is None:
+            raise RuntimeError("No solution to check. Call `solve` first.")
+        self.blocking_pairs = GjSolutionValidator(logger_obj=self._logger).blocking_pairs(self._matching, self._person_bank)
+        return not self.blocking_pairs
 
-    def check_validity(self):
+    def check_validity(self) -> bool:
         """
         @override
+        @summary: Checks the solution against the requirement. See `GjSolutionValidator.validate`.
+        @return: True if the solution is valid.
+        @raise MatchingError: With the violations found.
+        @raise RuntimeError: When called before `solve`.
         """
-        pass
+        if self._matching is None:
+            raise RuntimeError("No solution to check. Call `solve` first.")
+        violations = GjSolutionValidator(logger_obj=self._logger).validate(self._matching)
+        if violations:
+            raise MatchingError(violations=violations)
+        return True
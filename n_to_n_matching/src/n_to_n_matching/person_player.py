@@ -32,6 +32,7 @@ class PersonPlayer(Player):
     ATTR_ID = "id"
     ATTR_CHILDREN = "children"
     ATTR_EMAIL = "email"
+    ATTR_GRADE_CLASS = "grade_class"
     ATTR_NAME = "name"
     ATTR_PHONE = "phone"
     ATTR_ROLE_ID = "role_id"
@@ -49,10 +50,13 @@ class PersonPlayer(Player):
                  children_ids=[],
                  roles: List[Role]=[Role()],
                  logger_obj: logging.Logger=None,
-                 assigned_dates: List[AssignedDate]=[]):
+                 assigned_dates: List[AssignedDate]=[],
+                 sibling_grades: List[str]=None):
         """
         @param responsibility_id: Any of `ResponsibilityLevel` enum item.
         @param role_id: -1 is equal to a role ID not being set. Roles are e.g gakyu/library/safety etc.
+        @param sibling_grades: Grade/class of the other children of the family, e.g. of the rows of the same household
+          collapsed into this person. Same type as `grade_class`.
         """
         super().__init__(name)  # For the rest of __init__, assigning `name` can be skipped because it's done in super class.
         if not isinstance(id, int):
@@ -68,6 +72,7 @@ class PersonPlayer(Player):
         self._email_addr = email_addr
         self._phone_num = phone_num
         self._grade_class = grade_class
+        self._sibling_grades = list(sibling_grades) if sibling_grades else []
         self._children_ids = children_ids
 
         self._last_assigned_date_general = None
@@ -96,6 +101,25 @@ class PersonPlayer(Player):
     def grade_class(self, val):
         raise AttributeError(self._ERRMSG_SHOULD_NOT_OVERWRITE.format("grade_class"))
 
+    @property
+    def sibling_grades(self) -> List[str]:
+        return self._sibling_grades
+
+    @property
+    def grade_classes(self) -> List[str]:
+        """
+        @return: `grade_class` followed by `sibling_grades`, e.g. to tell if the family is exempted on a date.
+        """
+        return [self._grade_class] + self._sibling_grades
+
+    @property
+    def email_addr(self) -> str:
+        return self._email_addr
+
+    @email_addr.setter
+    def email_addr(self, val):
+        raise AttributeError(self._ERRMSG_SHOULD_NOT_OVERWRITE.format("email_addr"))
+
     @property
     def phone_num(self) -> str:
         return self._phone_num
@@ -155,14 +179,13 @@ class PersonPlayer(Player):
         """
         _last_date = None
         if not responsibility:
-            last_dates = [self._last_assigned_date_general,
-                          self._last_assigned_date_committee,
-                          self._last_assigned_date_leader]
-            try:
-                _last_date = max(last_dates)
-            except TypeError as e:
-                # More than one entry in `last_dates` is not set yet.
-                _last_date = None
+            # Entries that are not set yet are None, and `AssignedDate` itself is not comparable,
+            # so compare by the `date` of the entries that are set.
+            for _assigned in (self._last_assigned_date_general,
+                              self._last_assigned_date_committee,
+                              self._last_assigned_date_leader):
+                if _assigned and ((not _last_date) or (_last_date.date < _assigned.date)):
+                    _last_date = _assigned
         else:
             if responsibility.id == RespLvl.COMMITTEE:
                 _last_date = self._last_assigned_date_committee
@@ -212,15 +235,17 @@ class PersonPlayer(Player):
 
 
 class PersonBank():
-    def __init__(self, persons, max_allowance=None):
+    def __init__(self, persons, max_allowance=None, households=None):
         """
         @type persons: [PersonPlayer]
         @param persons: Input list will be converted as a dict.
+        @type households: gj.household.GjHouseholdIndex
         """
         self._persons = {}
         for p in persons:
             self._persons[p.id] = p
         self._max_allowance = max_allowance
+        self._households = households
 
     @property
     def persons(self) -> Dict[int, PersonPlayer]:
@@ -250,3 +275,11 @@ class PersonBank():
         @type: dict format returned by `GjVolunteerAllocationGame.max_allowed_days_per_person`
         """
         self._max_allowance = val
+
+    @property
+    def households(self):
+        """
+        @rtype: gj.household.GjHouseholdIndex
+        @return: None if unknown, i.e. every person is a household of its own.
+        """
+        return self._households
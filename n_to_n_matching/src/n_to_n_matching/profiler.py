@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from n_to_n_matching.util import Util
+
+
+class NullProfiler:
+    """
+    @summary: Stand-in used when profiling is off. Every method is a no-op, and `phase` returns
+      the same pre-built context manager each time so that instrumented code pays close to nothing.
+    """
+    _NULL_CONTEXT = contextlib.nullcontext()
+
+    def phase(self, category: str, name: str="", **args):
+        return self._NULL_CONTEXT
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    @property
+    def running(self) -> bool:
+        return False
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class SolveProfiler(NullProfiler):
+    """
+    @summary: Records wall time and call counts per phase (e.g. ingest, each date's assignment, output)
+      while `cProfile` collects the function-level stats for the same period.
+      Results can be written as a pstats file and as a Chrome trace-event JSON
+      (open it with chrome://tracing or https://ui.perfetto.dev), where each phase is a span.
+    """
+    def __init__(self, logger_obj: logging.Logger=None):
+        self._logger = Util.get_logger(__name__, logger_obj)
+        self._cprofile = cProfile.Profile()
+        self._running = False
+        self._t0_ns = time.perf_counter_ns()
+        # Each element: (category, name, start_ns, end_ns, args)
+        self._events: List[Tuple[str, str, int, int, Dict]] = []
+        # category: [call count, total ns]
+        self._stats: Dict[str, List[int]] = {}
+
+    @contextlib.contextmanager
+    def phase(self, category: str, name: str="", **args):
+        """
+        @param category: Phase the span is aggregated by, e.g. "assign_date".
+        @param name: Label of the individual span, e.g. the date. `category` is used if empty.
+        @param args: Shown as the span's arguments in the trace.
+        """
+        _start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            _end_ns = time.perf_counter_ns()
+            self._events.append((category, name or category, _start_ns, _end_ns, args))
+            _stat = self._stats.setdefault(category, [0, 0])
+            _stat[0] += 1
+            _stat[1] += _end_ns - _start_ns
+
+    def start(self):
+        if not self._running:
+            self._cprofile.enable()
+            self._running = True
+
+    def stop(self):
+        if self._running:
+            self._cprofile.disable()
+            self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def stats(self) -> Dict[str, Tuple[int, float]]:
+        """
+        @return: {category: (call count, total wall time in seconds)}
+        """
+        return {cat: (count, total_ns / 1e9) for cat, (count, total_ns) in self._stats.items()}
+
+    def summary(self) -> str:
+        _lines = [f"{'phase':<32}{'calls':>8}{'total [ms]':>14}{'mean [ms]':>12}"]
+        for cat, (count, total_s) in self.stats.items():
+            _lines.append(f"{cat:<32}{count:>8}{total_s * 1e3:>14.2f}{total_s * 1e3 / count:>12.2f}")
+        return "\n".join(_lines)
+
+    def trace_events(self) -> List[Dict]:
+        """
+        @return: Complete ("X") events of the Chrome trace-event format, in microseconds since this profiler was created.
+        """
+        _pid = os.getpid()
+        _tid = threading.get_ident()
+        return [{"name": name,
+                 "cat": cat,
+                 "ph": "X",
+                 "ts": (start_ns - self._t0_ns) / 1e3,
+                 "dur": (end_ns - start_ns) / 1e3,
+                 "pid": _pid,
+                 "tid": _tid,
+                 "args": {key: str(val) for key, val in args.items()}}
+                for cat, name, start_ns, end_ns, args in self._events]
+
+    def dump(self, output_dir: str, prefix: str) -> Tuple[str, str]:
+        """
+        @summary: Writes `<prefix>.pstats` and `<prefix>_trace.json` into `output_dir`.
+          If still running, profiling is stopped first.
+        @return: Paths of the pstats file and of the trace file.
+        """
+        self.stop()
+        _path_pstats = os.path.join(output_dir, f"{prefix}.pstats")
+        _path_trace = os.path.join(output_dir, f"{prefix}_trace.json")
+        self._cprofile.dump_stats(_path_pstats)
+        with open(_path_trace, "w") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+        self._logger.info(f"Profile written to {_path_pstats} and {_path_trace}.\n{self.summary()}")
+        return _path_pstats, _path_trace
@@ -14,8 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from array import array
 from collections import OrderedDict
-from openpyxl.cell.cell import Cell as pyxl_Cell
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
 
 from n_to_n_matching.util import Util
 
@@ -31,6 +32,7 @@ class Cell:
         This comes with downside i.e. when the spreadhseet's structure gets updated later on so that the type of info stored in the cell
         _can_ change. As of 20240827 the implementation does not capture that usecase.
     @todo Move out of GJ realm. This class must be generic.
+    @deprecated: Use `Table`, which holds the values per column without an object per cell.
     """
     def __init__(self):
         self._row_id = -1
@@ -62,14 +64,15 @@ class Cell:
         self._value = value
 
     def init(self, row_id, col_id, val):
-        self.row_id(row_id)
-        self.col_id(col_id)
-        self.value(val)
+        self.row_id = row_id
+        self.col_id = col_id
+        self.value = val
 
 
 class Row:
     """
     @description: Represents a row in a spreadsheet, without relying on existing libraries that provides spreadsheet feature.
+    @deprecated: Use `Table` and its `TableRow`.
     """
     def __init__(self, row_id=-1, logger_obj=None):
         """
@@ -119,37 +122,28 @@ class Row:
         return self._cells_in_a_row[col_id].value
 
     def get_col_id(self, col_title):
-        for key, val in self._cells_in_a_row.items():
-            self._logger.info(f"k: {key}, v.col_id: {val.col_id}, v.row_id: {val.row_id}, title: {val.value}")
-            if val.value == col_title:
-                return val.col_id
+        for cell in self._cells_in_a_row.values():
+            if cell.value == col_title:
+                return cell.col_id
         return -1
 
 
-class SpreadsheetCell(pyxl_Cell):
-    __slots__ = ('_title_value')
-
-    def __init__(self, cell_obj, title_val=""):
-        super().__init__(cell_obj)
-        self._title_value = title_val
-
-
 class SpreadsheetRow():
-    def __init__(self, row: pyxl_Cell, is_title_row=False):
+    def __init__(self, values: Tuple, row_id: int, is_title_row=False):
         """
+        @param values: Values of the cells in the row, from the 1st column, e.g. as openpyxl's `iter_rows(values_only=True)` yields.
+           Trailing empty cells may be omitted.
+        @param row_id: 1-based row number in the sheet.
         @param is_title_row: Bool to show if the row represents title of the cells below each cell or not.
            This can only be set upon initialization, so no setter is defined.
         """
-        self._cells = row
+        self._values = values
+        self._row_id = row_id
         self._is_title_row = is_title_row
 
     @property
-    def cells(self) -> pyxl_Cell:
-        return self._cells
-
-    @cells.setter
-    def cells(self, value):
-        self._cells = value
+    def values(self) -> Tuple:
+        return self._values
 
     @property
     def is_title_row(self):
@@ -157,4 +151,169 @@ class SpreadsheetRow():
 
     @property
     def row_id(self):
-        return self._cells[0].row  # This impl may look rather adhoc and unstable, but AFAIK this is the official way to get a row ID in openpyxl.
+        return self._row_id
+
+    def value(self, col_id: int):
+        """
+        @param col_id: 1-based column number, as in openpyxl.
+        @return: None if the cell is empty or beyond the end of the row.
+        """
+        if col_id <= len(self._values):
+            return self._values[col_id - 1]
+        return None
+
+
+class TableRow:
+    """
+    @summary: View of a row of `Table`. Holds only the table and the position of the row, so making one copies no values.
+    """
+    __slots__ = ("_table", "_pos")
+
+    def __init__(self, table: "Table", pos: int):
+        self._table = table
+        self._pos = pos
+
+    @property
+    def row_id(self) -> int:
+        return self._table.row_ids[self._pos]
+
+    @property
+    def values(self) -> Tuple:
+        """
+        @return: Values of the row in the order of the header. Unlike the other accessors, this copies.
+        """
+        return tuple(column[self._pos] for column in self._table.columns)
+
+    def __getitem__(self, key: Union[str, int]):
+        """
+        @param key: Title in the header, or 0-based position of the column.
+        @raise ValueError: When the title is not in the header.
+        """
+        if isinstance(key, str):
+            key = self._table.position(key)
+        return self._table.columns[key][self._pos]
+
+    def get(self, title: str, default=None):
+        """
+        @return: `default` when `title` is not in the header or the cell is empty.
+        """
+        _pos = self._table.positions.get(title)
+        if _pos is None:
+            return default
+        value = self._table.columns[_pos][self._pos]
+        return default if value is None else value
+
+    def value(self, col_id: int):
+        """
+        @param col_id: 1-based column number, as `SpreadsheetRow.value`.
+        """
+        return self._table.columns[col_id - 1][self._pos]
+
+    def __repr__(self):
+        return f"TableRow({self.row_id}, {self.values})"
+
+
+class Table:
+    """
+    @summary: In-memory table held per column: the values per column, the row numbers as an integer array,
+      and the header as title -> position. Unlike `Row`/`Cell`, there's no object per cell, a column is read
+      without touching the others, and rows are accessed through `TableRow` views.
+      A column whose type is given (`typecodes`) is an `array.array` of that type. The others are lists of Python objects,
+      as e.g. text cells, or numeric cells that can be empty, don't fit an array.
+      Does not depend on any spreadsheet library; readers (openpyxl, csv etc.) append rows of values.
+
+      The GJ ingest (`gj.spreadsheet_access.GjToubanAccess`) doesn't build on this: it streams each row as a tuple of values
+      (`SpreadsheetRow`) into records, so that its memory doesn't grow with the file. A table is made only when asked for,
+      e.g. `GjToubanAccess.read_table`.
+    """
+    def __init__(self, header: Sequence[str], typecodes: Dict[str, str]=None):
+        """
+        @param header: Titles of the columns.
+        @param typecodes: Title -> typecode of `array.array` (e.g. "q", "d") of the columns whose values are all of that type.
+        @raise ValueError: When a title appears more than once, or a title in `typecodes` is not in `header`.
+        """
+        self._header = tuple(header)
+        self._positions: Dict[str, int] = {}
+        for pos, title in enumerate(self._header):
+            if title in self._positions:
+                raise ValueError(f"Column title '{title}' appears more than once in {header=}.")
+            self._positions[title] = pos
+        typecodes = typecodes or {}
+        _unknown = [title for title in typecodes if title not in self._positions]
+        if _unknown:
+            raise ValueError(f"Column titles {_unknown} in 'typecodes' are not in {header=}.")
+        self._columns: Tuple[Union[List, array], ...] = tuple(
+            array(typecodes[title]) if title in typecodes else [] for title in self._header)
+        self._row_ids = array("q")
+
+    @classmethod
+    def from_rows(cls, header: Sequence[str], rows: Iterable[Tuple[Sequence, int]], typecodes: Dict[str, str]=None) -> "Table":
+        """
+        @param rows: (values in the order of `header`, row number) per row. See `append`.
+        """
+        table = cls(header, typecodes)
+        for values, row_id in rows:
+            table.append(values, row_id)
+        return table
+
+    def append(self, values: Sequence, row_id: int=None):
+        """
+        @param values: In the order of the header. Missing trailing values are None, and values beyond the header are dropped.
+        @param row_id: Row number in the source, e.g. in the sheet. If None, 1 + the position of the row.
+        @raise TypeError: When a value of a typed column is not of its type, e.g. None. The table is left as before.
+        """
+        _num_values = len(values)
+        for pos, column in enumerate(self._columns):
+            try:
+                column.append(values[pos] if pos < _num_values else None)
+            except TypeError:
+                for column_appended in self._columns[:pos]:
+                    column_appended.pop()
+                raise
+        self._row_ids.append(len(self._row_ids) + 1 if row_id is None else row_id)
+
+    @property
+    def header(self) -> Tuple[str, ...]:
+        return self._header
+
+    @property
+    def positions(self) -> Dict[str, int]:
+        """
+        @return: Title -> 0-based position of the column.
+        """
+        return self._positions
+
+    @property
+    def columns(self) -> Tuple[Union[List, array], ...]:
+        return self._columns
+
+    @property
+    def row_ids(self) -> array:
+        return self._row_ids
+
+    def position(self, title: str) -> int:
+        """
+        @raise ValueError: When `title` is not in the header.
+        """
+        try:
+            return self._positions[title]
+        except KeyError:
+            raise ValueError(f"Column title '{title}' is not in the header {self._header}.")
+
+    def column(self, title: str) -> Union[List, array]:
+        """
+        @return: The values of the column as held by the table, i.e. not a copy.
+        @raise ValueError: When `title` is not in the header.
+        """
+        return self._columns[self.position(title)]
+
+    def __len__(self) -> int:
+        return len(self._row_ids)
+
+    def __getitem__(self, pos: int) -> TableRow:
+        if not (-len(self) <= pos < len(self)):
+            raise IndexError(f"Row position {pos} is out of the table of {len(self)} rows.")
+        return TableRow(self, pos % len(self))
+
+    def __iter__(self) -> Iterator[TableRow]:
+        return (TableRow(self, pos) for pos in range(len(self)))
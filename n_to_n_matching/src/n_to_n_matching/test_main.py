@@ -14,17 +14,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
+import os
 from typing import List
 
+from gj.exporters import GjCsvExporter, GjIcsExporter, GjJsonExporter
 from gj.grade_class import GjGradeGroup
-from gj.printing import GjDocx
+from gj.printing import GjDocx, GjPdfSection
 from gj.requirements import DateRequirement
 from gj.responsibility import ResponsibilityLevel
 from gj.role import Role, Roles_Definition, Roles_ID
-from gj.spreadsheet_access import GjRowEntity
+from gj.roster_cache import GjRosterCache
 from gj.spreadsheet_access import GjToubanAccess2024 as GTA
 from n_to_n_matching.match_game import GjVolunteerAllocationGame
 from n_to_n_matching.person_player import PersonPlayer
+from n_to_n_matching.profiler import NULL_PROFILER
 from n_to_n_matching.workdate_player import WorkDate
 
 
@@ -571,10 +575,22 @@ _MSG_AFTER_TABLE_TOSHO_20250503 = """
 2025年度 当番表作成委員 (保健・図書　連絡・配信係）XXXX   　touban-hoken_tosho@gjls.org
 　ジョージア日本語学校"""
 
-def test_3(path_touban_master_sheet, sheet_name, output_path="/cws/src/130s/nton_matching", role: Roles_ID=Roles_ID.TOSHO):
+_EXPORTERS = {"csv": GjCsvExporter, "json": GjJsonExporter, "ics": GjIcsExporter}
+
+def test_3(path_touban_master_sheet, sheet_name, output_path="/cws/src/130s/nton_matching", role: Roles_ID=Roles_ID.TOSHO, profiler=NULL_PROFILER,
+           roster_cache: GjRosterCache=None, pdf_sections: list=None, export_formats=(), compress: bool=False):
+    """
+    @param profiler: `n_to_n_matching.profiler.SolveProfiler` to record ingest, solve and output phases into.
+    @param roster_cache: If passed, the rows parsed from the master sheet are reused across runs.
+    @param pdf_sections: If passed, `gj.printing.GjPdfSection` of the solution is appended, to be printed by `gj.printing.GjPdf`.
+    @param export_formats: Any of "csv", "json", "ics" to also export the solution into. See `gj.exporters`.
+    @param compress: See `GjVolunteerAllocationGame.match`.
+    @rtype: GjVolunteerMatching
+    """
     touban_accessor = GTA()  # TODO What is this?
-    guardian_input = touban_accessor.gj_xls_to_personobj(
-        path_touban_master_sheet, sheet_name=sheet_name, row_spec=GjRowEntity.COL_TITLE_IDS_20250503)
+    with profiler.phase("ingest"):
+        # Title row and columns are detected from the titles in the sheet.
+        guardian_input = touban_accessor.gj_file_to_personobj(path_touban_master_sheet, sheet_name=sheet_name, cache=roster_cache)
     dates = fixture_dates_20250503_v2()
     _ROLE_CHOSEN = "(担当当番名)"
     if role == Roles_ID.TOSHO.value:
@@ -593,13 +609,22 @@ def test_3(path_touban_master_sheet, sheet_name, output_path="/cws/src/130s/nton
 
     print(f"064 {role=}")
     solution = GjVolunteerAllocationGame.create_from_dictionaries_2(
-        dates_input, guardian_input, role=role).solve()    
-    GjVolunteerAllocationGame.print_tabular_stdout(solution)
+        dates_input, guardian_input, role=role).solve(profile=profiler, compress=compress)
+    with profiler.phase("output"):
+        GjVolunteerAllocationGame.print_tabular_stdout(solution)
 
-    docx_gen = GjDocx(output_path)
-    docx_gen.print_distributable(
-        solution=solution,
-        requirements=solution.reqs,
-        heading1=f"202508-09当番予定表: {_ROLE_CHOSEN}",
-        paragraph_after_table=_paragraph_after_table,
-        path_input_file=path_touban_master_sheet)
+        _heading1 = f"202508-09当番予定表: {_ROLE_CHOSEN}"
+        docx_gen = GjDocx(output_path)
+        docx_gen.print_distributable(
+            solution=solution,
+            requirements=solution.reqs,
+            heading1=_heading1,
+            paragraph_after_table=_paragraph_after_table,
+            path_input_file=path_touban_master_sheet)
+        if pdf_sections is not None:
+            pdf_sections.append(GjPdfSection(solution, _heading1, paragraph_after_table=_paragraph_after_table))
+        _timestamp = datetime.datetime.strftime(datetime.datetime.now(), '%Y-%m-%d-%H-%M-%S')
+        for exporter in (_EXPORTERS[export_format]() for export_format in export_formats):
+            # Per-person .ics files go into a directory.
+            exporter.export(solution, os.path.join(output_path, exporter.output_name(f"{_timestamp}_GJLS_{solution.reqs.type_duty.name}")))
+    return solution
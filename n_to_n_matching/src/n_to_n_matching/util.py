@@ -14,13 +14,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import datetime
 import logging
-import urllib
+import os
+from typing import Dict, Tuple
+import urllib.parse
+import urllib.request
 import yaml
 
+# libyaml's loader parses several times faster than the pure-Python one, but is only there when PyYAML was built with libyaml.
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Util:
+    # Absolute path -> ((mtime_ns, size), parsed content). See `read_yaml_to_dict`.
+    _yaml_parsed: Dict[str, Tuple[Tuple[int, int], object]] = {}
     @staticmethod
     def get_logger(name_logger="", logger_obj: logging.Logger=None) -> logging.Logger:
         if not name_logger:
@@ -41,13 +50,26 @@ class Util:
     @staticmethod
     def read_yaml_to_dict(path_prefix, filename):
         """
-        @description: Read in the YAML data from the URL.
+        @description: Read in the YAML data from a local directory, or from a URL (e.g. "https://...", "file://...").
+          A local file is parsed once per process as long as its mtime and size stay the same; later calls get a copy
+          of what was parsed, so the callers can modify it freely.
+        @param path_prefix: Directory or URL that `filename` is in.
         @return: Python's dict object 
         """
-        url = "/".join((path_prefix, filename))
-        with urllib.request.urlopen(url) as response:
-            dictionary = yaml.safe_load(response.read())
-        return dictionary
+        # A scheme of a single letter is a drive letter on Windows, not a URL.
+        if 1 < len(urllib.parse.urlparse(str(path_prefix)).scheme):
+            url = "/".join((path_prefix, filename))
+            with urllib.request.urlopen(url) as response:
+                return yaml.load(response.read(), Loader=_YamlSafeLoader)
+
+        path = os.path.abspath(os.path.join(path_prefix, filename))
+        _stat = os.stat(path)
+        _version = (_stat.st_mtime_ns, _stat.st_size)
+        _cached = Util._yaml_parsed.get(path)
+        if (not _cached) or (_cached[0] != _version):
+            with open(path, "rb") as f:
+                _cached = Util._yaml_parsed[path] = (_version, yaml.load(f, Loader=_YamlSafeLoader))
+        return copy.deepcopy(_cached[1])
 
     @staticmethod
     def validate_date_str(date_text):
@@ -51,7 +51,7 @@ class WorkDate(Player):
     DEFAULT_PERDAY_GENERAL = 1
     
     def __init__(self,
-                 datestr,
+                 datestr=None,
                  school_off=False,
                  req_num_committee=2,
                  req_num_leader=1,
@@ -59,16 +59,25 @@ class WorkDate(Player):
                  assignee_leader: List[PersonPlayer]=None,
                  assignee_commitee: List[PersonPlayer]=None,
                  assignee_noncommitee: List[PersonPlayer]=None,
-                 exempt_conditions: List[GjGrade]=None):
+                 exempt_conditions: List[GjGrade]=None,
+                 date_obj: date=None):
         """
-        @param datestr: For now this needs to be "yyyy-mm-dd" format.
+        @param datestr: For now this needs to be "yyyy-mm-dd" format. Can be omitted when `date_obj` is passed.
         @type assignees: [PersonPlayer] TBD this no longer exists?
+        @param date_obj: The date already as `datetime.date` (e.g. expanded from `gj.recurrence.GjRecurrence`),
+          which saves validating and parsing `datestr`.
+        @raise ValueError: When neither `datestr` nor `date_obj` is passed.
         """
+        if date_obj is not None:
+            datestr = datestr or date_obj.isoformat()
+        elif not datestr:
+            raise ValueError("Either 'datestr' or 'date_obj' is required.")
         super().__init__(datestr)
         # type: datetime.date
         # For date information, this `_date_obj` instance (accessible via `date()`) should be prioritized, instead of `super.name`.
-        self._date_obj = None
-        self._date = self.name
+        self._date_obj = date_obj
+        if date_obj is None:
+            self._date = self.name
 
         self._school_off = school_off
         self._req_num_leader = req_num_leader
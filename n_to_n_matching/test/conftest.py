@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers shared by the test modules, imported as `from conftest import make_person`."""
+
+from types import SimpleNamespace
+
+from gj.requirements import Consts
+from gj.responsibility import GenGuardian, ResponsibilityLevel as RespLvl
+from gj.role import Role, Roles_Definition
+from n_to_n_matching.person_player import PersonBank, PersonPlayer
+
+
+def make_person(id, responsibility=GenGuardian, role_id=None, grade_class=None):
+    """
+    @summary: A person with dummy contacts, derived from `id`.
+    @param responsibility: Class of the only responsibility of the person.
+    @param role_id: ID of the only role of the person.
+    """
+    return PersonPlayer(name=f"guardian-name{id}", id=id, email_addr=f"{id}@dot.com.dummy", phone_num="000-000-0000",
+                        grade_class=grade_class, responsibilities=[responsibility()], roles=[Role(role_id)], assigned_dates=[])
+
+def make_requirements(type_duty=Roles_Definition.TOSHO_COMMITEE):
+    """
+    @summary: Requirements with the duty and the intervals between the dates of a person, 3, 4 and 5 days per responsibility level.
+    """
+    return SimpleNamespace(type_duty=type_duty,
+                           interval_assigneddates_leader=3, interval_assigneddates_commitee=4, interval_assigneddates_general=5)
+
+def make_solution(dates_lgtm, dates_failed=(), persons=(), person_bank=None, max_stint=None, type_duty=Roles_Definition.TOSHO_COMMITEE):
+    """
+    @summary: A stand-in for `GjVolunteerMatching`, carrying only the attributes that the readers of a solution access.
+    @param persons: Persons of the bank, ignored when `person_bank` is given.
+    @param max_stint: Max stint of the general guardians. No allowance is set when None.
+    """
+    return SimpleNamespace(
+        dates_lgtm=dates_lgtm, dates_failed=list(dates_failed),
+        reqs=make_requirements(type_duty),
+        max_allowance={RespLvl.GENERAL: {Consts.ATTR_MAX_STINT_OPPORTUNITIES: max_stint}} if max_stint is not None else None,
+        person_bank=person_bank if person_bank is not None else PersonBank(list(persons)))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+from conftest import make_person, make_requirements, make_solution
+from gj.assigned_date import AssignedDate
+from gj.equivalence import GjClassAllocation, GjRosterCompression
+from gj.grade_class import GjGrade, GjGradeGroup
+from gj.household import GjHouseholdIndex
+from gj.requirements import Consts
+from gj.responsibility import Committeer, ResponsibilityLevel as RespLvl
+from gj.role import Roles_Definition
+from gj.validator import GjSolutionValidator
+from n_to_n_matching.person_player import PersonBank
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def test_classes():
+    persons = [make_person(1), make_person(2), make_person(3, Committeer), make_person(4, grade_class=GjGrade.ELEM_SHOU_1_1), make_person(5)]
+    persons[4].last_assigned_date = AssignedDate(datetime.date(2025, 6, 1), RespLvl.GENERAL)
+    dates = [WorkDate("2025-06-07", req_num_leader=1, req_num_committee=0, req_num_noncommittee=2, exempt_conditions=GjGradeGroup.ELEM_SHOU_1STG)]
+    classes = GjRosterCompression().classes(PersonBank(persons), dates)
+
+    assert [[1, 2], [3], [4], [5]] == [[person.id for person in person_class.members] for person_class in classes]
+    assert [(), (), (0,), ()] == [person_class.exempted for person_class in classes]
+    assert (datetime.date(2025, 6, 1),) == classes[3].history
+
+def test_assign():
+    generals = [make_person(id) for id in range(1, 7)]
+    committees = [make_person(id, Committeer) for id in range(11, 14)]
+    excluded = make_person(21, role_id=Roles_Definition.SAFETY_COMMITEE.value)
+    person_bank = PersonBank(generals + committees + [excluded],
+                             max_allowance={resp: {Consts.ATTR_MAX_STINT_OPPORTUNITIES: 2} for resp in (RespLvl.LEADER, RespLvl.COMMITTEE, RespLvl.GENERAL)})
+    dates = [WorkDate(f"2025-06-{day:02}", req_num_leader=1, req_num_committee=0, req_num_noncommittee=2) for day in (7, 14, 21)]
+    GjClassAllocation().assign(dates, person_bank, make_requirements())
+
+    # The members of a class are taken round-robin.
+    assert [[1, 2], [3, 4], [5, 6]] == [[person.id for person in date_wd.assignees_noncommittee] for date_wd in dates]
+    assert [[11], [12], [13]] == [[person.id for person in date_wd.assignees_leader] for date_wd in dates]
+    assert dates[2].date == generals[4].last_assigned_date.date
+    solution = make_solution(dates, person_bank=person_bank)
+    assert [] == GjSolutionValidator().validate(solution)
+
+def test_assign_spacing_overbook():
+    generals = [make_person(id) for id in range(1, 3)]
+    person_bank = PersonBank(generals, max_allowance={RespLvl.GENERAL: {Consts.ATTR_MAX_STINT_OPPORTUNITIES: 1}})
+    # 2 days apart, within the interval of generals.
+    dates = [WorkDate(day, req_num_leader=0, req_num_committee=0, req_num_noncommittee=1) for day in ("2025-06-07", "2025-06-09", "2025-06-21")]
+    GjClassAllocation().assign(dates, person_bank, make_requirements())
+
+    # 06-09 takes the other member. 06-21 overbooks the first one, as both have already reached the max.
+    assert [[1], [2], [1]] == [[person.id for person in date_wd.assignees_noncommittee] for date_wd in dates]
+
+def test_assign_household():
+    generals = [make_person(id) for id in range(1, 5)]
+    households = GjHouseholdIndex()
+    # 1 and 2 are rows of the same household.
+    for person in generals:
+        households.add(person.id, "guardian" if person.id <= 2 else f"guardian{person.id}", "family@dot.com.dummy", None)
+    person_bank = PersonBank(generals, max_allowance={RespLvl.GENERAL: {Consts.ATTR_MAX_STINT_OPPORTUNITIES: 1}}, households=households)
+    classes = GjRosterCompression().classes(person_bank, [])
+    assert [[1, 2], [3, 4]] == [[person.id for person in person_class.members] for person_class in classes]
+    assert 1 == classes[0].household_id
+
+    dates = [WorkDate(day, req_num_leader=0, req_num_committee=0, req_num_noncommittee=1) for day in ("2025-06-07", "2025-06-14", "2025-06-21")]
+    GjClassAllocation().assign(dates, person_bank, make_requirements())
+    # The household gets a date as any other family, not one per row.
+    assert [[1], [3], [4]] == [[person.id for person in date_wd.assignees_noncommittee] for date_wd in dates]
+
+def test_assign_household_responsibilities():
+    persons = [make_person(1, Committeer), make_person(2), make_person(3, Committeer), make_person(4)]
+    households = GjHouseholdIndex()
+    # 1 (committee) and 2 (general) are rows of the same household, so are 2 classes sharing the load of the household.
+    for person in persons:
+        households.add(person.id, "guardian" if person.id <= 2 else f"guardian{person.id}", "family@dot.com.dummy", None)
+    person_bank = PersonBank(persons, max_allowance={resp: {Consts.ATTR_MAX_STINT_OPPORTUNITIES: 1} for resp in (RespLvl.LEADER, RespLvl.GENERAL)},
+                             households=households)
+    dates = [WorkDate("2025-06-07", req_num_leader=1, req_num_committee=0, req_num_noncommittee=1)]
+    GjClassAllocation().assign(dates, person_bank, make_requirements())
+    # The household leads, so its general row isn't taken on the same date.
+    assert ([1], [4]) == ([person.id for person in dates[0].assignees_leader], [person.id for person in dates[0].assignees_noncommittee])
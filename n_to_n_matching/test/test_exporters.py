@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import json
+import os
+
+from conftest import make_person, make_solution
+from gj.exporters import GjCsvExporter, GjIcsExporter, GjJsonExporter
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def _solution():
+    p1, p2 = make_person(1), make_person(2)
+    dates = [WorkDate("2025-06-07", assignee_leader=[p1], assignee_noncommitee=[p2]),
+             WorkDate("2025-06-14", assignee_noncommitee=[p1])]
+    return make_solution(dates)
+
+def test_csv_json_exporter(tmp_path):
+    solution = _solution()
+    with open(GjCsvExporter().export(solution, str(tmp_path / "a.csv")), encoding=GjCsvExporter.ENCODING) as f:
+        rows = list(csv.reader(f))
+    assert list(GjCsvExporter.COLUMNS) == rows[0]
+    assert [["2025-06-07", "LEADER", "1"], ["2025-06-07", "GENERAL", "2"], ["2025-06-14", "GENERAL", "1"]] == \
+           [[row[0], row[2], row[3]] for row in rows[1:]]
+    with open(GjJsonExporter().export(solution, str(tmp_path / "a.json")), encoding="utf-8") as f:
+        exported = json.load(f)
+    assert "図書委員" == exported["duty"]
+    assert [[row[0], row[2], int(row[3]), row[6]] for row in rows[1:]] == \
+           [[assignment["date"], assignment["responsibility"], assignment["person_id"], assignment["email"]] for assignment in exported["assignments"]]
+
+def test_ics_exporter(tmp_path):
+    assert ("a.csv", "a_ics") == (GjCsvExporter.output_name("a"), GjIcsExporter.output_name("a"))
+    assert str(tmp_path / "ics") == GjIcsExporter().export(_solution(), str(tmp_path / "ics"))
+    paths = GjIcsExporter(max_workers=2).export_persons(_solution(), str(tmp_path / "ics"))
+    assert ["1.ics", "2.ics"] == sorted(os.path.basename(path) for path in paths)
+    with open(tmp_path / "ics" / "1.ics", encoding="utf-8", newline="") as f:
+        lines = f.read().split("\r\n")
+    assert ["DTSTART;VALUE=DATE:20250607", "DTSTART;VALUE=DATE:20250614"] == [line for line in lines if line.startswith("DTSTART")]
+    assert "END:VCALENDAR" == lines[-2]
+    _long = "SUMMARY:" + "図" * 40
+    assert all(len(line.encode("utf-8")) <= 75 for line in GjIcsExporter.fold(_long).split("\r\n"))
+    assert _long == GjIcsExporter.fold(_long).replace("\r\n ", "")
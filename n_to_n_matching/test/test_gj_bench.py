@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from gj.role import Roles_ID
+from gj.spreadsheet_access import GjToubanAccess2024
+from gj_bench.master_sheet import SyntheticMasterSheet
+from gj_bench.runner import GjBenchmark
+from gj_bench.synthetic import SyntheticCalendar, SyntheticRoster
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def test_synthetic_seeded():
+    assert list(SyntheticRoster(seed=3).iter_families(200)) == list(SyntheticRoster(seed=3).iter_families(200))
+    assert list(SyntheticRoster(seed=3).iter_families(200)) != list(SyntheticRoster(seed=4).iter_families(200))
+    dates = SyntheticCalendar(seed=3).dates_prefs(num_weeks=52)
+    assert dates == SyntheticCalendar(seed=3).dates_prefs(num_weeks=52)
+    assert 52 == len(dates[WorkDate.ATTR_SECTION])
+    with pytest.raises(ValueError):
+        SyntheticCalendar().dates_prefs(num_weeks=53)
+
+@pytest.mark.parametrize("layout", list(SyntheticMasterSheet.LAYOUTS))
+def test_master_sheet_ingest(tmp_path, layout):
+    path_xlsx = str(tmp_path / "master.xlsx")
+    row_spec = SyntheticMasterSheet.LAYOUTS[layout]
+    families = list(SyntheticRoster(seed=1).iter_families(120))
+    assert 120 == SyntheticMasterSheet(row_spec).write(path_xlsx, families)
+    # Columns are detected from the titles.
+    person_bank = GjToubanAccess2024().gj_xls_to_personobj(path_xlsx, SyntheticMasterSheet.SHEET_NAME)
+    assert 120 == len(person_bank.persons)
+    for family in families:
+        person = person_bank.persons[family.id]
+        assert (family.student_name, family.phone) == (person.name, person.phone_num)
+        assert (family.role.value if family.role else None) == person.roles[0].id
+
+def test_benchmark_run():
+    report = GjBenchmark(sizes=[50], num_weeks=4, roles=[Roles_ID.TOSHO]).run()
+    assert ["ingest", "ingest_xlsx", "ingest_cached", "solve", "validate", "docx"] == [r["stage"] for r in report["results"]]
+    assert all(r["peak_mib"] is not None for r in report["results"])
+    assert isinstance(next(r["violations"] for r in report["results"] if r["stage"] == "validate"), int)
+    json.dumps(report)
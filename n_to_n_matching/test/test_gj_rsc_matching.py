@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+import pytest
+
+from conftest import make_person
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def test_indexes():
+    p1, p2 = make_person(1), make_person(2)
+    date_0 = WorkDate("2025-06-07", assignee_leader=[p1], assignee_noncommitee=[p2])
+    date_1 = WorkDate("2025-06-14", assignee_noncommitee=[p1])
+    date_failed = WorkDate("2025-06-21", assignee_commitee=[p2])
+    solution = GjVolunteerMatching(None, [date_0, date_1], [date_failed])
+
+    assert [p1] == solution.assignees("2025-06-07", RespLvl.LEADER)
+    # Same list as the date holds.
+    assert date_1.assignees_noncommittee is solution.assignees(datetime.date(2025, 6, 14), RespLvl.GENERAL)
+    assert [p2] == solution.assignees("2025-06-21", RespLvl.COMMITTEE)
+    assert [(date_0, RespLvl.LEADER), (date_1, RespLvl.GENERAL)] == solution.person_assignments(1)
+    assert [(date_0, RespLvl.GENERAL), (date_failed, RespLvl.COMMITTEE)] == solution.person_assignments(2)
+    assert [] == solution.person_assignments(3)
+    with pytest.raises(LookupError):
+        solution.assignees("2025-06-28", RespLvl.LEADER)
+
+    date_1.assignee_noncommittee(make_person(3))
+    assert [] == solution.person_assignments(3)
+    solution.reset_indexes()
+    assert [(date_1, RespLvl.GENERAL)] == solution.person_assignments(3)
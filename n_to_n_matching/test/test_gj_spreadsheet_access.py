@@ -14,10 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+
 import openpyxl as xl
 import pytest
 
+from gj import spreadsheet_access
 from gj.util import GjUtil
+from gj.role import Roles_Definition
+from gj.spreadsheet_access import GjColumnIndex, GjExemptionIndex, GjHeaderDetector, GjRowEntity
 from gj.spreadsheet_access import GjToubanAccess2024 as GTA
 
 @pytest.fixture
@@ -46,7 +51,8 @@ def test_get_a_sheet_by_name(_master_sheet, touban_accessor):
     """
     assert _master_sheet.title == GTA.MASTERSHEET_2024
 
-def test_get_candidates_tosho(_master_sheet, touban_accessor):
+def test_get_candidates_tosho(path_to_202406, _master_sheet, touban_accessor):
+    touban_accessor.gj_xls_to_personobj(path_to_202406, GTA.MASTERSHEET_2024)
     candidate_rows, row_ids = touban_accessor.get_candidates(_master_sheet, touban_accessor.NAME_TOSHOIIN)
     assert candidate_rows, f"Array of candidate not meeting criteria: '{candidate_rows}'"
     for row in candidate_rows:
@@ -58,3 +64,123 @@ def test_gj_xls_to_personobj(path_to_202406):
     #assert len(person_bank.persons) == 269
     persons = person_bank.persons
     assert len(persons) == 269
+
+@pytest.mark.parametrize("single_sheet_reader", [True, False])
+def test_iter_sheet_rows_stops_at_empty_row(tmp_path, touban_accessor, single_sheet_reader):
+    touban_accessor.SINGLE_SHEET_READER = single_sheet_reader
+    path_xlsx = str(tmp_path / "rows.xlsx")
+    wb = xl.Workbook()
+    sheet = wb.active
+    sheet.title = "master"
+    for row in (["title"], [1, "a"], [2, None, "b"], [None], [3, "c"]):
+        sheet.append(row)
+    wb.create_sheet("other").append(["not read"])
+    wb.save(path_xlsx)
+    rows = list(touban_accessor.iter_sheet_rows(path_xlsx, sheet_name="master", min_row=2))
+    assert [2, 3] == [row.row_id for row in rows]
+    assert ["a", None] == [row.value(2) for row in rows]
+    assert "b" == rows[1].value(3)
+    assert rows[0].value(30) is None
+    with pytest.raises(LookupError):
+        list(touban_accessor.iter_sheet_rows(path_xlsx, sheet_name="missing"))
+
+def test_open_sheet_readonly_fallback(tmp_path, touban_accessor, monkeypatch):
+    def _read(self):
+        raise KeyError("changed internals")
+    monkeypatch.setattr(spreadsheet_access._SingleSheetReader, "read", _read)
+    path_xlsx = str(tmp_path / "rows.xlsx")
+    wb = xl.Workbook()
+    wb.active.title = "master"
+    for row in (["title"], [1, "a", None, "d"]):
+        wb.active.append(row)
+    wb.save(path_xlsx)
+    # Read by the public API instead, with the dimension reset.
+    assert [(1, "a", None, "d")] == [row.values for row in touban_accessor.iter_sheet_rows(path_xlsx, sheet_name="master", min_row=2)]
+
+def test_column_index():
+    columns = GjColumnIndex.compile(GjRowEntity.COL_TITLE_IDS_202407)
+    assert columns is GjColumnIndex.compile(dict(GjRowEntity.COL_TITLE_IDS_202407))
+    assert 23 == columns.position(GjRowEntity.COLTITLE_EXEMPTED_BY)
+    values = (None, 7, "小1－1")
+    assert 7 == columns.value(values, GjRowEntity.COLTITLE_ID_IN_SHEET)
+    assert columns.value(values, GjRowEntity.COLTITLE_EXEMPTED_BY) is None
+    with pytest.raises(ValueError):
+        GjColumnIndex({2: GjRowEntity.COLTITLE_ID_IN_SHEET, 3: GjRowEntity.COLTITLE_ID_IN_SHEET})
+
+def test_header_detector():
+    titles = ["事務局登録TEL", "No", "学年組", None, "氏 名", "当番用ＴＥＬ", "兄姉２", "兄姉氏名", "兄姉３", "兄姉氏名", "免除対象", "事務局登録TEL"]
+    spec = GjHeaderDetector.row_spec(tuple(titles))
+    assert GjRowEntity.COLTITLE_STUDENT_NAME == spec[5]
+    assert GjRowEntity.COLTITLE_PHONE_EMERGENCY == spec[6]
+    assert GjRowEntity.COLTITLE_SIBLING_2_PERSONNAME == spec[8]
+    assert GjRowEntity.COLTITLE_SIBLING_3_PERSONNAME == spec[10]
+    assert GjRowEntity.COLTITLE_PHONENUM_REGISTERED == spec[12]
+    assert 1 not in spec
+    assert spec is GjHeaderDetector.row_spec(tuple(titles + [None]))
+    with pytest.raises(ValueError):
+        GjHeaderDetector.row_spec(("No", "学年組", "氏名"))
+
+def test_gj_csv_jsonl_to_personobj(tmp_path, touban_accessor):
+    path_csv = tmp_path / "master.tsv"
+    path_csv.write_text("\t\t@\n"
+                        "No\t学年組\t氏　名\t当番用TEL\t免除対象\n"
+                        "1\t小1－1\tname1\t000-000-0001\t\n"
+                        "2\t中1－1\tname2\t\t図書委員\n"
+                        "\n"
+                        "3\t中1－1\tname3\t\t\n", encoding="utf-8-sig")
+    persons = touban_accessor.gj_file_to_personobj(str(path_csv)).persons
+    assert [1, 2] == list(persons)
+    assert ("name1", "000-000-0001", None) == (persons[1].name, persons[1].phone_num, persons[1].roles[0].id)
+    assert (None, "図書委員") == (persons[2].phone_num, persons[2].roles[0].id)
+
+    path_jsonl = tmp_path / "master.jsonl"
+    path_jsonl.write_text("\n".join(json.dumps(obj, ensure_ascii=False) for obj in [
+        {"id_in_sheet": 5, "grade_class": "小1－1", "person_name": "name5", "exempted_on": None},
+        {"No": 6, "学年組": "小1－2", "氏名": "name6", "免除対象": "安全対策委員"}]), encoding="utf-8")
+    persons = touban_accessor.gj_file_to_personobj(str(path_jsonl)).persons
+    assert ["name5", "name6"] == [person.name for person in persons.values()]
+    assert "安全対策委員" == persons[6].roles[0].id
+
+def test_records_streamed(tmp_path, touban_accessor):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text("No,学年組,氏　名,保護者名,兄姉２,免除対象\n"
+                        "1,小1－1,name1,guardian1,小3－2,\n"
+                        ",小2－1,name2,guardian2,,図書委員\n", encoding="utf-8")
+    records = touban_accessor.records_from_rows(touban_accessor._person_rows(touban_accessor.iter_csv_rows(str(path_csv))))
+    # Streamed, i.e. the file isn't read until the records are.
+    assert not isinstance(records, list)
+    records = list(records)
+    assert records == list(touban_accessor.records_from_table(touban_accessor.read_table(str(path_csv))))
+    assert [(1, ("小3－2",)), (2, ())] == [(record.id, record.siblings) for record in records]
+
+def test_exemption_index(tmp_path, touban_accessor):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text("No,学年組,氏　名,免除対象\n"
+                        "1,小1－1,name1,図書委員\n"
+                        "2,小1－1,name2,\n"
+                        "3,小2－1,name3,安全対策委員\n"
+                        "4,小3－1,name4,図書委員\n", encoding="utf-8")
+    touban_accessor.gj_csv_to_personobj(str(path_csv))
+    index = touban_accessor.exemption_index
+    assert [1, 4] == index.person_ids(Roles_Definition.TOSHO_COMMITEE)
+    assert [4] == index.row_ids(Roles_Definition.SAFETY_COMMITEE)
+    assert [] == index.person_ids(Roles_Definition.HOKEN_COMMITEE.value)
+    with pytest.raises(ValueError):
+        index.row_ids("unknown")
+
+    with pytest.raises(RuntimeError):
+        GTA().get_candidates(None, Roles_Definition.TOSHO_COMMITEE)
+    path_xlsx = str(tmp_path / "master.xlsx")
+    wb = xl.Workbook()
+    sheet = wb.active
+    sheet.title = "master"
+    for row in (["No", "学年組", "氏　名", "免除対象"], [1, "小1－1", "name1", "図書委員"], [2, "小1－1", "name2", "学級委員"], [3, "小2－1", "name3", "図書委員"]):
+        sheet.append(row)
+    wb.save(path_xlsx)
+    touban_accessor.gj_xls_to_personobj(path_xlsx, "master")
+    # Looked up in the index of the ingest, not in the column of the sheet.
+    sheet["D3"] = "図書委員"
+    candidate_rows, row_ids = touban_accessor.get_candidates(sheet, Roles_Definition.TOSHO_COMMITEE)
+    assert [2, 4] == row_ids
+    assert [2, 4] == [row[0].row for row in candidate_rows]
+    assert [3] == touban_accessor.get_candidates(sheet, "学級委員")[1]
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+import pytest
+
+from conftest import make_solution
+from gj.equivalence import GjRosterCompression
+from gj.grade_class import GjGradeGroup
+from gj.household import GjHouseholdIndex, GjHouseholdLoad
+from gj.requirements import Consts, DateRequirement
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from gj.role import Roles_Definition, Roles_ID
+from gj.spreadsheet_access import GjToubanAccess2024 as GTA
+from gj.util import GjUtil
+from gj.validator import GjSolutionValidator, GjViolationType
+from gj_bench.synthetic import SyntheticCalendar
+from n_to_n_matching.match_game import GjVolunteerAllocationGame
+from n_to_n_matching.workdate_player import WorkDate
+
+_MASTER_CSV = ("No,学年組,氏　名,保護者名,当番用TEL,当番用メール,兄姉２,免除対象\n"
+               "1,小1－1,name1,guardian1,000-000-0001,One@example.com,,\n"
+               "2,小3－1,name2,guardian2,000-000-0002,,小5－1,\n"
+               "3,小4－2,name3,guardian1,000-000-0001, one@example.com ,,図書委員\n"
+               "4,中1－1,name4,guardian2,(000)000-0002,,,\n"
+               "5,小2－1,name5,guardian5,,,,\n"
+               "6,小2－1,name6,guardian5,,,,\n")
+# 8 households of 2 rows each, and committee members who don't take Hoken.
+_MASTER_CSV_HOUSEHOLDS = ("No,学年組,氏　名,保護者名,当番用メール,免除対象\n" + "".join(
+    f"{person_id},小1－1,name{person_id},guardian{person_id % 8},{person_id % 8}@example.com,\n" for person_id in range(1, 17)) +
+    "17,小1－1,name17,guardian17,,図書委員\n18,小1－1,name18,guardian18,,図書委員\n")
+
+def test_household_collapse(tmp_path):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text(_MASTER_CSV, encoding="utf-8")
+    accessor = GTA()
+    persons = accessor.gj_csv_to_personobj(str(path_csv)).persons
+    # Rows without any contact are never the same household.
+    assert [1, 2, 5, 6] == list(persons)
+    index = accessor.household_index
+    assert (1, 2, 1, 2) == tuple(index.household_id(person_id) for person_id in (1, 2, 3, 4))
+    assert [1, 3] == index.members(1)
+    # The committee of a collapsed row is kept.
+    assert Roles_Definition.TOSHO_COMMITEE.value == persons[1].roles[0].id
+    assert [1] == accessor.exemption_index.person_ids(Roles_Definition.TOSHO_COMMITEE)
+    # The row collapsed is indexed by its own exemption.
+    assert [4] == accessor.exemption_index.row_ids(Roles_Definition.TOSHO_COMMITEE)
+
+def test_household_records_siblings(tmp_path):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text(_MASTER_CSV, encoding="utf-8")
+    records = {record.id: record for record in GjHouseholdIndex().collapse(GTA().read_records(str(path_csv)))}
+    assert ("guardian2", ("小5－1", "中1－1")) == (records[2].guardian_name, records[2].siblings)
+    assert ("小4－2",) == records[1].siblings
+
+@pytest.mark.parametrize("grades", [("小1－1", "小2－1"), ("小2－1", "小1－1")])
+def test_household_collapse_keeps_exemption(tmp_path, grades):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text("No,学年組,氏　名,保護者名,当番用メール,免除対象\n" +
+                        "".join(f"{person_id},{grade},name{person_id},guardian1,one@example.com,\n" for person_id, grade in enumerate(grades, start=1)),
+                        encoding="utf-8")
+    person_bank = GTA().gj_csv_to_personobj(str(path_csv))
+    assert [1] == list(person_bank.persons)
+    person = person_bank.persons[1]
+    # Whichever row comes first, the date exempting the grade of the other child exempts the household.
+    date_wd = WorkDate("2025-06-07", req_num_leader=0, req_num_committee=0, req_num_noncommittee=1,
+                       exempt_conditions=GjGradeGroup.ELEM_SHOU_2STG, assignee_noncommitee=[person])
+    solution = make_solution([date_wd], person_bank=person_bank)
+    assert [GjViolationType.EXEMPTED_GRADE] == [violation.type for violation in GjSolutionValidator().validate(solution)]
+    assert [(0,)] == [person_class.exempted for person_class in GjRosterCompression().classes(person_bank, [date_wd])]
+
+def test_household_load():
+    index = GjHouseholdIndex()
+    for person_id, guardian in ((1, "guardian1"), (2, "guardian2"), (3, "guardian1")):
+        index.add(person_id, guardian, f"{guardian}@example.com", None)
+    assert index.has_shared
+    load = GjHouseholdLoad(index)
+    load.add(1, datetime.date(2025, 6, 7))
+    assert (1, 1, 0) == (load.num_dates(1), load.num_dates(3), load.num_dates(2))
+    assert load.too_soon(3, datetime.date(2025, 6, 14), 7)
+    assert not load.too_soon(3, datetime.date(2025, 6, 15), 7)
+    assert not load.too_soon(2, datetime.date(2025, 6, 7), 7)
+
+def test_household_load_in_solve(tmp_path):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text(_MASTER_CSV_HOUSEHOLDS, encoding="utf-8")
+    accessor = GTA(collapse_households=False)
+    person_bank = accessor.gj_csv_to_personobj(str(path_csv))
+    assert 18 == len(person_bank.persons)
+    # 2 slots (leader, general) on each date.
+    dates_prefs = SyntheticCalendar().dates_prefs(4, duty_type=Roles_Definition.HOKEN_COMMITEE, ratio_grade_exempted=0)
+    solution = GjVolunteerAllocationGame.create_from_dictionaries_2(dates_prefs, person_bank, role=Roles_ID.HOKEN.value).solve()
+
+    dates_per_household = {}
+    for date_wd in solution.dates_lgtm:
+        for person in date_wd.assignees_leader + date_wd.assignees_noncommittee:
+            dates_per_household.setdefault(accessor.household_index.household_id(person.id), []).append(date_wd.date)
+    # No household has 2 dates, or 2 persons on a date, while another household has none.
+    assert 8 == len(dates_per_household)
+    assert all(len(dates) == 1 for dates in dates_per_household.values())
+
+def test_household_max_stint(tmp_path):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text(_MASTER_CSV_HOUSEHOLDS, encoding="utf-8")
+    accessor = GTA(collapse_households=False)
+    person_bank = accessor.gj_csv_to_personobj(str(path_csv))
+    dates = [WorkDate(f"{2025 + month // 12}-{month % 12 + 1:02}-01", req_num_leader=1, req_num_committee=0, req_num_noncommittee=1)
+             for month in range(16)]
+    # 16 general slots are 1 per row of the 16 rows, but 2 per household of the 8 households.
+    assert 1 == GjUtil.max_allowed_days_per_person(dates, person_bank).max_allowance[RespLvl.GENERAL][Consts.ATTR_MAX_STINT_OPPORTUNITIES]
+    assert {RespLvl.LEADER: 8, RespLvl.COMMITTEE: 0, RespLvl.GENERAL: 2} == GjUtil.max_stint_per_household(dates, person_bank)
+
+def test_household_max_stint_in_solve(tmp_path):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text(_MASTER_CSV_HOUSEHOLDS, encoding="utf-8")
+    accessor = GTA(collapse_households=False)
+    person_bank = accessor.gj_csv_to_personobj(str(path_csv))
+    dates_prefs = SyntheticCalendar().dates_prefs(16, duty_type=Roles_Definition.HOKEN_COMMITEE, ratio_grade_exempted=0)
+    # Only the general slots, and a spacing short enough not to limit the households.
+    dates_prefs[DateRequirement.ATTR_SECTION].update({WorkDate.ATTR_NUM_LEADER: 0, WorkDate.REQ_INTERVAL_ASSIGNEDDATES_GENERAL: 7})
+    solution = GjVolunteerAllocationGame.create_from_dictionaries_2(dates_prefs, person_bank, role=Roles_ID.HOKEN.value).solve()
+
+    _person_ids = [person.id for date_wd in solution.dates_lgtm for person in date_wd.assignees_noncommittee]
+    # 16 general slots are 2 per household, i.e. within the max stint per household, so each takes its 2nd date
+    # by the other row rather than overbooking the row that already has one.
+    assert list(range(1, 17)) == sorted(_person_ids)
+
+@pytest.mark.parametrize("num_weeks", [16, 24])
+def test_household_limit_compress(tmp_path, num_weeks):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text(_MASTER_CSV_HOUSEHOLDS, encoding="utf-8")
+    dates_per_household = []
+    for compress in (False, True):
+        accessor = GTA(collapse_households=False)
+        person_bank = accessor.gj_csv_to_personobj(str(path_csv))
+        dates_prefs = SyntheticCalendar().dates_prefs(num_weeks, duty_type=Roles_Definition.HOKEN_COMMITEE, ratio_grade_exempted=0)
+        dates_prefs[DateRequirement.ATTR_SECTION].update({WorkDate.ATTR_NUM_LEADER: 0, WorkDate.REQ_INTERVAL_ASSIGNEDDATES_GENERAL: 7})
+        solution = GjVolunteerAllocationGame.create_from_dictionaries_2(dates_prefs, person_bank, role=Roles_ID.HOKEN.value).solve(compress=compress)
+        _dates = {}
+        for date_wd in solution.dates_lgtm:
+            for person in date_wd.assignees_noncommittee:
+                _dates.setdefault(accessor.household_index.household_id(person.id), []).append(date_wd.date)
+        dates_per_household.append({household_id: len(dates) for household_id, dates in _dates.items()})
+    # 24 weeks are 1 date per row, but 3 per household. Both paths limit a household by `GjHouseholdLoad`, not by the max of a row + 1.
+    assert {household_id: num_weeks // 8 for household_id in range(1, 9)} == dates_per_household[0] == dates_per_household[1]
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from conftest import make_person
+from gj.requirements import ReasonCode
+from gj.responsibility import ResponsibilityLevel
+from gj.role import Roles_Definition, Roles_ID
+from gj_bench.synthetic import SyntheticCalendar, SyntheticRoster
+from n_to_n_matching.gj_rsc_matching import GjVolunteerMatching
+from n_to_n_matching.match_game import GjVolunteerAllocationGame as Game
+from n_to_n_matching.person_player import PersonBank
+from n_to_n_matching.workdate_player import WorkDate
+
+
+@pytest.fixture
+def date_0():
+    return WorkDate("2025-06-07", req_num_leader=1, req_num_committee=0, req_num_noncommittee=1)
+
+@pytest.fixture
+def date_1():
+    return WorkDate("2025-06-14", req_num_leader=1, req_num_committee=0, req_num_noncommittee=1)
+
+def test_can_assign_ok(date_0):
+    assert ReasonCode.OK == Game.can_assign(date_0, make_person(1), ResponsibilityLevel.GENERAL, 7)
+
+def test_can_assign_slot_filled(date_0):
+    Game.assign_unchecked(date_0, make_person(1), ResponsibilityLevel.GENERAL)
+    assert ReasonCode.SLOT_FILLED == Game.can_assign(date_0, make_person(2), ResponsibilityLevel.GENERAL, 7)
+    # No committee slot on the date at all.
+    assert ReasonCode.SLOT_FILLED == Game.can_assign(date_0, make_person(2), ResponsibilityLevel.COMMITTEE, 7)
+
+def test_can_assign_date_filled(date_0):
+    Game.assign_unchecked(date_0, make_person(1), ResponsibilityLevel.GENERAL)
+    Game.assign_unchecked(date_0, make_person(2), ResponsibilityLevel.LEADER)
+    assert ReasonCode.DATE_FILLED == Game.can_assign(date_0, make_person(3), ResponsibilityLevel.LEADER, 7)
+
+def test_can_assign_too_soon(date_0, date_1):
+    person = make_person(1)
+    Game.assign_unchecked(date_0, person, ResponsibilityLevel.GENERAL)
+    assert ReasonCode.TOO_SOON == Game.can_assign(date_1, person, ResponsibilityLevel.LEADER, 7)
+    assert ReasonCode.OK == Game.can_assign(date_1, person, ResponsibilityLevel.LEADER, 6)
+
+def test_check_before_and_after_solve():
+    person_bank = PersonBank(Game.create_from_dict_persons(SyntheticRoster().person_records(30)))
+    dates_prefs = SyntheticCalendar().dates_prefs(2, duty_type=Roles_Definition.HOKEN_COMMITEE)
+    game = Game.create_from_dictionaries_2(dates_prefs, person_bank, role=Roles_ID.HOKEN.value)
+    with pytest.raises(RuntimeError):
+        game.check_validity()
+    solution = game.solve()
+    # A matching is a dict, which is falsy when empty. It's still a solution to check.
+    solution.__class__ = type("_EmptyMatching", (GjVolunteerMatching,), {"__len__": lambda self: 0})
+    assert not solution
+    assert game.check_validity()
+    game.check_stability()
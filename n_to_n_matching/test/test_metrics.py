@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from conftest import make_person, make_solution
+from gj.metrics import GjSolutionMetrics
+from gj.responsibility import Committeer, ResponsibilityLevel as RespLvl, ToubanExempt
+from gj.role import Roles_Definition
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def test_metrics():
+    c1, g2, g3, g4, x5 = make_person(1, Committeer), make_person(2), make_person(3), make_person(4), make_person(5, ToubanExempt)
+    dates = [WorkDate("2025-06-07", req_num_leader=1, req_num_committee=0, req_num_noncommittee=2, assignee_leader=[c1], assignee_noncommitee=[g2, g3]),
+             WorkDate("2025-06-14", req_num_leader=1, req_num_committee=0, req_num_noncommittee=2, assignee_noncommitee=[g2])]
+    solution = make_solution(dates, persons=[c1, g2, g3, g4, x5], max_stint=1)
+    metrics = GjSolutionMetrics(solution)
+
+    assert [1, 2, 3, 4] == metrics.person_ids.tolist()
+    assert [[1, 0, 0], [0, 0, 2], [0, 0, 1], [0, 0, 0]] == metrics.loads.tolist()
+    assert [2, 1, 0] == metrics.load_vector(RespLvl.GENERAL).tolist()
+    assert 1 == metrics.num_over_allowance(RespLvl.GENERAL)
+    assert [1, 0, 1] == metrics.unfilled_slots().tolist()
+    # 7 days between the dates of guardian 2, whose interval is 5, i.e. the 6th day on is allowed.
+    assert [1] == metrics.spacing_slack().tolist()
+    assert [0] == metrics.spacing_slack(intervals=(3, 4, 6)).tolist()
+    assert [-2] == metrics.spacing_slack(intervals=(3, 4, 8)).tolist()
+
+    assert 0.0 == GjSolutionMetrics.gini(np.array([2, 2, 2]))
+    assert GjSolutionMetrics.gini(np.array([0, 0, 3])) == pytest.approx(2 / 3)
+    summary = metrics.summary()
+    assert (2, 0, 1, 0) == (summary["load_max_general"], summary["load_min_general"], summary["over_allowance_general"], summary["spacing_violations"])
+
+def test_load_vector_hoken():
+    g1, g2, c3 = make_person(1), make_person(2), make_person(3, Committeer)
+    dates = [WorkDate("2025-06-07", req_num_leader=1, req_num_committee=1, req_num_noncommittee=1,
+                      assignee_leader=[g1], assignee_commitee=[c3], assignee_noncommitee=[g2])]
+    metrics = GjSolutionMetrics(make_solution(dates, persons=[g1, g2, c3], type_duty=Roles_Definition.HOKEN_COMMITEE))
+
+    # For hoken, the general guardians take the leader slots and the committee members don't.
+    assert [1, 0] == metrics.load_vector(RespLvl.LEADER).tolist()
+    assert [1] == metrics.load_vector(RespLvl.COMMITTEE).tolist()
+    assert 0.5 == metrics.summary()["gini_leader"]
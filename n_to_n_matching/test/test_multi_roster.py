@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from gj.multi_roster import GjMultiRosterIngest, GjRosterSource
+from gj.roster_cache import GjRosterCache
+from gj_bench.master_sheet import SyntheticMasterSheet
+from gj_bench.synthetic import SyntheticRoster
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_multi_roster_read(tmp_path, max_workers):
+    sources = []
+    for seed, num_families in ((0, 30), (1, 20)):
+        path = str(tmp_path / f"master{seed}.xlsx")
+        SyntheticMasterSheet().write(path, SyntheticRoster(seed=seed).iter_families(num_families))
+        sources.append(GjRosterSource(path, SyntheticMasterSheet.SHEET_NAME))
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text("No,学年組,氏　名,免除対象\n7,小1－1,name7,\n", encoding="utf-8")
+    sources.append(str(path_csv))
+
+    cache = GjRosterCache(str(tmp_path / "cache"))
+    ingest = GjMultiRosterIngest(cache=cache, max_workers=max_workers, id_stride=1000)
+    person_bank = ingest.read(sources)
+    # IDs in the sheets overlap, but not once namespaced.
+    assert 51 == len(person_bank.persons)
+    assert (2, 7) == ingest.split_id(2007)
+    assert "name7" == person_bank.persons[2007].name
+    assert [0] * 30 + [1] * 20 + [2] == [ingest.split_id(person_id)[0] for person_id in person_bank.persons]
+    # Workers stored the parsed .xlsx rows.
+    assert 20 == len(cache.load(*sources[1]))
+
+def test_multi_roster_id_stride(tmp_path):
+    path_csv = tmp_path / "master.csv"
+    path_csv.write_text("No,学年組,氏　名,免除対象\n1000,小1－1,name,\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        GjMultiRosterIngest(id_stride=1000).read([str(path_csv)])
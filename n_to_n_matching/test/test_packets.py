@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import docx
+
+from conftest import make_person, make_solution
+from gj.packets import GjPacketEntry, GjPacketGenerator
+from gj.responsibility import ResponsibilityLevel as RespLvl
+from gj.role import Roles_Definition
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def _solutions():
+    p1, p2 = make_person(1), make_person(2)
+    return [make_solution([WorkDate("2025-06-14", assignee_noncommitee=[p1])]),
+            make_solution([WorkDate("2025-06-07", assignee_commitee=[p1], assignee_noncommitee=[p2])], type_duty=Roles_Definition.HOKEN_COMMITEE)]
+
+def test_packets():
+    packets = GjPacketGenerator.packets(_solutions())
+    assert [1, 2] == list(packets)
+    # Across the duties, in the order of the dates.
+    assert (GjPacketEntry("2025-06-07", Roles_Definition.HOKEN_COMMITEE, RespLvl.COMMITTEE),
+            GjPacketEntry("2025-06-14", Roles_Definition.TOSHO_COMMITEE, RespLvl.GENERAL)) == packets[1].entries
+    # No grade, rather than "None".
+    assert "" == packets[1].grade_class
+
+def test_generate(tmp_path):
+    report = GjPacketGenerator(str(tmp_path / "docx"), max_workers=2, batch_size=1).generate(_solutions())
+    assert ["1.docx", "2.docx"] == [os.path.basename(path) for path in report.paths]
+    assert 0 < report.packets_per_second
+    document = docx.Document(report.paths[0])
+    assert not any(paragraph.text.startswith("学級") for paragraph in document.paragraphs)
+    table = document.tables[0]
+    assert [["日付", "当番", "担当"], ["2025-06-07", "保健委員", "委員"], ["2025-06-14", "図書委員", "保護者"]] == \
+           [[cell.text for cell in row.cells] for row in table.rows]
+    report = GjPacketGenerator(str(tmp_path / "pdf"), "pdf", max_workers=1).generate(_solutions())
+    with open(report.paths[1], "rb") as f:
+        assert f.read(5) == b"%PDF-"
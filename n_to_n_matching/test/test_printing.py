@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import glob
+from types import SimpleNamespace
+
+import docx
+import pytest
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph
+
+from conftest import make_person, make_requirements
+from gj.printing import _GjLazyDocTemplate, GjDocx, GjPdf, GjPdfSection
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def _solution():
+    dates = {
+        "2025-06-07": {WorkDate.ATTR_LIST_ASSIGNED_LEADER: [make_person(1)],
+                       WorkDate.ATTR_LIST_ASSIGNED_COMMITTEE: [make_person(2)],
+                       WorkDate.ATTR_LIST_ASSIGNED_GENERAL: [make_person(3)]},
+        "2025-06-14": {WorkDate.ATTR_LIST_ASSIGNED_LEADER: [],
+                       WorkDate.ATTR_LIST_ASSIGNED_COMMITTEE: [],
+                       WorkDate.ATTR_LIST_ASSIGNED_GENERAL: [make_person(4)]},
+    }
+    return SimpleNamespace(items=dates.items, reqs=make_requirements())
+
+def test_print_distributable(tmp_path):
+    solution = _solution()
+    GjDocx(str(tmp_path)).print_distributable(solution=solution, requirements=solution.reqs, heading1="heading <&>")
+    table = docx.Document(glob.glob(str(tmp_path / "*.docx"))[0]).tables[0]
+    assert ["日付", "順", "担当", "学級", "生徒氏名", "電話番号"] == [cell.text for cell in table.rows[0].cells]
+    assert [["2025-06-07", "", "リーダー", "None", "guardian-name1", "000-000-0000"],
+            ["2025-06-07", "", "委員", "None", "guardian-name2", "000-000-0000"],
+            ["2025-06-07", "", "保護者", "None", "guardian-name3", "000-000-0000"],
+            ["2025-06-14", "", "保護者", "None", "guardian-name4", "000-000-0000"]] == \
+           [[cell.text for cell in row.cells] for row in table.rows[1:]]
+    # The date column is a single cell per date.
+    assert table.cell(1, 0)._tc is table.cell(3, 0)._tc
+    assert table.cell(3, 0)._tc is not table.cell(4, 0)._tc
+    assert 0 == table.cell(2, 4).paragraphs[0].paragraph_format.space_after
+
+def test_gj_pdf(tmp_path):
+    solution = _solution()
+    pdf = GjPdf(str(tmp_path), font_path=str(tmp_path / "missing.ttf"), rows_per_chunk=2)
+    assert GjPdf.FONT_NAME_CID == pdf.register_font(str(tmp_path / "missing.ttf"))
+    # A date isn't split, so the first chunk has all 3 rows of the first date.
+    assert [4, 2] == [len(table._cellvalues) for table in pdf.table_chunks(solution)]
+    path_pdf = pdf.print_distributables([GjPdfSection(solution, "heading <&>", "before\nthe table"), GjPdfSection(solution, "2nd")],
+                                        file_name="all.pdf", path_input_file="master.xlsx")
+    with open(path_pdf, "rb") as f:
+        assert f.read(5) == b"%PDF-"
+    with pytest.raises(ValueError):
+        pdf.print_distributables(iter([]), file_name="none.pdf")
+
+def test_lazy_doc_template(tmp_path):
+    _pulled = []
+    _held = []
+
+    def _paragraphs():
+        for idx in range(200):
+            _pulled.append(idx)
+            yield Paragraph(f"paragraph {idx}", getSampleStyleSheet()["Normal"])
+
+    class _Template(_GjLazyDocTemplate):
+        def afterFlowable(self, flowable):
+            if isinstance(flowable, Paragraph):
+                _held.append(len(_pulled) - int(flowable.getPlainText().split()[-1]))
+
+    _Template(str(tmp_path / "lazy.pdf"), _paragraphs()).build_lazily()
+    assert 200 == len(_pulled)
+    # Flowables are pulled only up to a few ahead of the one laid out.
+    assert max(_held) <= _GjLazyDocTemplate.LOOKAHEAD + 1
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import pstats
+
+from n_to_n_matching.profiler import NULL_PROFILER, SolveProfiler
+
+
+def test_null_profiler_phase_is_shared():
+    assert NULL_PROFILER.phase("a") is NULL_PROFILER.phase("b", "x")
+    assert not NULL_PROFILER.running
+
+def test_phases_counted_and_dumped(tmp_path):
+    profiler = SolveProfiler()
+    profiler.start()
+    for date in ["2025-06-07", "2025-06-14"]:
+        with profiler.phase("assign_date", date):
+            pass
+    path_pstats, path_trace = profiler.dump(str(tmp_path), "prof")
+    assert not profiler.running
+    assert profiler.stats["assign_date"][0] == 2
+    with open(path_trace) as f:
+        events = json.load(f)["traceEvents"]
+    assert ["2025-06-07", "2025-06-14"] == [event["name"] for event in events]
+    assert os.path.exists(path_pstats)
+    pstats.Stats(path_pstats)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import os
+
+import pytest
+
+from gj.grade_class import GjGradeGroup
+from gj.recurrence import GjRecurrence
+from n_to_n_matching.match_game import GjVolunteerAllocationGame
+from n_to_n_matching.util import Util
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def test_recurrence_iter_dates():
+    recurrence = GjRecurrence.from_dict({
+        GjRecurrence.ATTR_WEEKDAY: "Saturday",
+        GjRecurrence.ATTR_START: "2025-04-10",
+        GjRecurrence.ATTR_END: "2025-05-10",
+        GjRecurrence.ATTR_EXCEPT: ["2025-04-26"],
+    })
+    assert ["2025-04-12", "2025-04-19", "2025-05-03", "2025-05-10"] == [d.isoformat() for d in recurrence.iter_dates()]
+    with pytest.raises(ValueError):
+        GjRecurrence.from_dict({GjRecurrence.ATTR_WEEKDAY: "SAT", GjRecurrence.ATTR_START: "2025-04-10"})
+    with pytest.raises(ValueError):
+        GjRecurrence.parse_weekday("Caturday")
+
+def test_create_from_dict_dates_recurrence():
+    dates_prefs = Util.read_yaml_to_dict(os.path.dirname(os.path.abspath(__file__)), "test_volunteer-dates.yaml")
+    # Listed dates take precedence over the expanded ones.
+    dates_prefs[WorkDate.ATTR_SECTION] = [{WorkDate.ATTR_DATE: "2024-04-08", WorkDate.ATTR_NUM_GENERAL: 3},
+                                          {WorkDate.ATTR_DATE: "2024-05-13"}]
+    dates, requirement = GjVolunteerAllocationGame.create_from_dict_dates(dates_prefs)
+    assert ["2024-04-01", "2024-04-08", "2024-04-15", "2024-04-22", "2024-04-29", "2024-05-06", "2024-05-13"] == [d.name for d in dates]
+    assert datetime.date(2024, 4, 1) == dates[0].date == requirement.date_earliest
+    assert dates[0].school_off
+    assert (1, 2, 3) == dates[1].get_required_persons()
+    assert (1, 3, 2) == dates[4].get_required_persons()
+    assert GjGradeGroup.ELEM_SHOU == dates[5].exempt_conditions
+    assert (1, 2, 1) == dates[6].get_required_persons()
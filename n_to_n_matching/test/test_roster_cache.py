@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from gj.roster_cache import GjRosterCache
+from gj.spreadsheet_access import GjToubanAccess2024 as GTA
+from gj_bench.master_sheet import SyntheticMasterSheet
+from gj_bench.synthetic import SyntheticRoster
+
+SHEET = SyntheticMasterSheet.SHEET_NAME
+
+
+@pytest.fixture
+def path_xlsx(tmp_path):
+    path = str(tmp_path / "master.xlsx")
+    SyntheticMasterSheet().write(path, SyntheticRoster(seed=2).iter_families(40))
+    return path
+
+def test_roster_cache_warm(path_xlsx, tmp_path):
+    cache = GjRosterCache(str(tmp_path / "cache"))
+    assert cache.load(path_xlsx, SHEET) is None
+    person_bank = GTA().gj_xls_to_personobj(path_xlsx, SHEET, cache=cache)
+    records = cache.load(path_xlsx, SHEET)
+    assert 40 == len(records)
+    person_bank_warm = GTA().gj_xls_to_personobj(path_xlsx, SHEET, cache=cache)
+    assert [(p.id, p.name, p.grade_class, p.roles[0].id) for p in person_bank.persons.values()] == \
+           [(p.id, p.name, p.grade_class, p.roles[0].id) for p in person_bank_warm.persons.values()]
+    # Entries are per sheet and per schema.
+    assert cache.load(path_xlsx, "another sheet") is None
+    assert cache.load(path_xlsx, SHEET, title_row=3) is None
+
+def test_roster_cache_invalidated(path_xlsx, tmp_path):
+    cache = GjRosterCache(str(tmp_path / "cache"))
+    GTA().gj_xls_to_personobj(path_xlsx, SHEET, cache=cache)
+    # Rewritten with different content, with the same mtime.
+    _stat = os.stat(path_xlsx)
+    SyntheticMasterSheet().write(path_xlsx, SyntheticRoster(seed=3).iter_families(30))
+    os.utime(path_xlsx, ns=(_stat.st_atime_ns, _stat.st_mtime_ns))
+    assert cache.load(path_xlsx, SHEET) is None
+    assert 30 == len(GTA().gj_xls_to_personobj(path_xlsx, SHEET, cache=cache).persons)
+    # Broken file is ignored.
+    with open(cache.path_cache(path_xlsx, SHEET, None, None), "wb") as f:
+        f.write(b"GJRC")
+    assert cache.load(path_xlsx, SHEET) is None
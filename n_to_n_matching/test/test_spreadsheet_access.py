@@ -14,10 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from array import array
 import openpyxl as xl
 import pytest
 
-from n_to_n_matching.spreadsheet_access import Cell, Row
+from n_to_n_matching.spreadsheet_access import Cell, Row, Table
 
 @pytest.fixture
 def cell_titles():
@@ -53,3 +54,36 @@ def test_get_col_id(cell_titles, a_row):
 
     index_test = cell_titles.index(TITLE_TEST)
     assert index_test == a_row.get_col_id(TITLE_TEST)
+
+def test_cell_init():
+    cell = Cell()
+    cell.init(3, 2, "value")
+    assert (3, 2, "value") == (cell.row_id, cell.col_id, cell.value)
+
+def test_table(cell_titles):
+    table = Table.from_rows(cell_titles, [(("a1", "a2", "a3", "a4", "dropped"), 5), (("b1", None), 6)])
+    assert 2 == len(table)
+    assert ["a3", None] == table.column("title3")
+    row = table[1]
+    assert (6, "b1", None) == (row.row_id, row["title1"], row[2])
+    assert ("b1", None, None, None) == row.values
+    assert "default" == row.get("title2", "default") == row.get("no such title", "default")
+    # Views read what the table holds.
+    table.column("title2")[1] = "b2"
+    assert "b2" == row.value(2)
+    assert [5, 6] == [row.row_id for row in table]
+    with pytest.raises(ValueError):
+        table.column("no such title")
+    with pytest.raises(ValueError):
+        Table(["title", "title"])
+
+def test_table_typecodes(cell_titles):
+    table = Table.from_rows(cell_titles[:2], [((1, "a"), 5), ((2, None), 6)], typecodes={"title1": "q"})
+    assert isinstance(table.column("title1"), array)
+    assert [1, 2] == list(table.column("title1"))
+    assert isinstance(table.column("title2"), list)
+    with pytest.raises(TypeError):
+        table.append(("c", "c"))
+    assert 2 == len(table) == len(table.column("title2"))
+    with pytest.raises(ValueError):
+        Table(cell_titles, typecodes={"no such title": "q"})
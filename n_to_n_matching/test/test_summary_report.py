@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import io
+import json
+
+from conftest import make_person, make_solution
+from gj.requirements import Consts
+from gj.summary_report import GjSummaryReport
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def test_summary_report():
+    p1, p2, p3 = make_person(1), make_person(2), make_person(3)
+    solution = make_solution([WorkDate("2025-06-14", assignee_noncommitee=[p1, p2]), WorkDate("2025-06-07", assignee_noncommitee=[p1])],
+                             [WorkDate("2025-06-21")], persons=[p1, p2, p3], max_stint=1)
+    report = GjSummaryReport(solution)
+    summary = report.persons[1]
+    assert (2, datetime.date(2025, 6, 7), datetime.date(2025, 6, 14), True) == \
+           (summary.num_general, summary.date_first, summary.date_last, summary.overbooked)
+    assert [0, None] == [report.persons[3].num_total, report.persons[3].date_first]
+    assert [1] == [summary.person_id for summary in report.persons_overbooked]
+
+    text = io.StringIO()
+    report.write_text(text)
+    assert "2025-06-14\n\tLeader: []\n\t Commitee assignee: []\n\t General assignee: [guardian-name1, guardian-name2]\n" in text.getvalue()
+    assert "P-ID 1, #assigned date: 2 (leader 0, committee 0, general 2), first: 2025-06-07, last: 2025-06-14, OVERBOOKED\n" in text.getvalue()
+
+    machine = io.StringIO()
+    report.write_json(machine)
+    loaded = json.loads(machine.getvalue())
+    assert {"GENERAL": {Consts.ATTR_MAX_STINT_OPPORTUNITIES: 1}} == loaded["max_allowance"]
+    assert ["2025-06-21"] == [date["date"] for date in loaded["dates_failed"]]
+    assert [True, False, False] == [person["overbooked"] for person in loaded["persons"]]
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from n_to_n_matching.util import Util
+
+
+def test_read_yaml_to_dict_cached(tmp_path):
+    path = tmp_path / "dates.yaml"
+    path.write_text("dates:\n  - date: 2025-04-12\n", encoding="utf-8")
+    dates = Util.read_yaml_to_dict(str(tmp_path), "dates.yaml")
+    assert 1 == len(dates["dates"])
+    # Callers get their own copy.
+    dates["dates"].clear()
+    assert 1 == len(Util.read_yaml_to_dict(str(tmp_path), "dates.yaml")["dates"])
+    # Parsed again once the file changes.
+    _stat = os.stat(path)
+    path.write_text("dates:\n  - date: 2025-04-12\n  - date: 2025-04-19\n", encoding="utf-8")
+    os.utime(path, ns=(_stat.st_atime_ns, _stat.st_mtime_ns + 1))
+    assert 2 == len(Util.read_yaml_to_dict(str(tmp_path), "dates.yaml")["dates"])
+    assert Util.read_yaml_to_dict(tmp_path.as_uri(), "dates.yaml") == Util.read_yaml_to_dict(str(tmp_path), "dates.yaml")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from conftest import make_person, make_solution
+from gj.responsibility import Committeer, ResponsibilityLevel as RespLvl, ToubanExempt
+from gj.role import Roles_Definition
+from gj.validator import GjSolutionValidator, GjViolationType
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def test_validate_valid():
+    c1, g2, g3 = make_person(1, Committeer), make_person(2), make_person(3)
+    dates = [WorkDate("2025-06-07", req_num_leader=1, req_num_committee=0, req_num_noncommittee=2, assignee_leader=[c1], assignee_noncommitee=[g2, g3]),
+             WorkDate("2025-06-14", req_num_leader=0, req_num_committee=0, req_num_noncommittee=1, assignee_noncommitee=[g2])]
+    assert [] == GjSolutionValidator().validate(make_solution(dates))
+
+def test_validate_violations():
+    g1, g2, x3 = make_person(1), make_person(2, role_id=Roles_Definition.HOKEN_COMMITEE.value), make_person(3, ToubanExempt)
+    dates = [WorkDate("2025-06-07", req_num_leader=0, req_num_committee=0, req_num_noncommittee=2, assignee_noncommitee=[g1, g1, g2, x3]),
+             WorkDate("2025-06-10", req_num_leader=0, req_num_committee=0, req_num_noncommittee=2, assignee_noncommitee=[g1])]
+    violations = GjSolutionValidator().validate(make_solution(dates))
+
+    assert [GjViolationType.SLOT_COUNT, GjViolationType.DUPLICATE_PERSON, GjViolationType.EXCLUDED_ROLE, GjViolationType.TOUBAN_EXEMPT,
+            GjViolationType.SLOT_COUNT, GjViolationType.SPACING] == [violation.type for violation in violations]
+    assert ("2025-06-10", 1, RespLvl.GENERAL) == violations[-1][1:4]
+
+def test_blocking_pairs():
+    g1, g2, g3, g4 = make_person(1), make_person(2), make_person(3), make_person(4, role_id=Roles_Definition.SAFETY_COMMITEE.value)
+    date_lgtm = WorkDate("2025-06-07", req_num_leader=0, req_num_committee=0, req_num_noncommittee=1, assignee_noncommitee=[g1])
+    date_failed = WorkDate("2025-06-10", req_num_leader=0, req_num_committee=0, req_num_noncommittee=2, assignee_noncommitee=[g2])
+    solution = make_solution([date_lgtm], [date_failed], persons=[g1, g2, g3, g4])
+
+    # Guardian 1 is too soon after 06-07, 2 is already on the date, and 4 is in a role excluded from Tosho.
+    assert [(date_failed, g3, RespLvl.GENERAL)] == GjSolutionValidator().blocking_pairs(solution)
+    assert [] == GjSolutionValidator().blocking_pairs(make_solution([date_lgtm], [date_failed], persons=[g1, g2, g3, g4], max_stint=0))
+    assert [(GjViolationType.SLOT_COUNT, "2025-06-10")] == [violation[:2] for violation in GjSolutionValidator().validate(solution)]
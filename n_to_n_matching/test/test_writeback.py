@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+# Copyright 2025 Kinu Garage Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import re
+import zipfile
+
+import openpyxl
+import pytest
+
+from conftest import make_person, make_solution
+from gj.household import GjHouseholdIndex
+from gj.role import Roles_Definition
+from gj.spreadsheet_access import GjToubanAccess
+from gj.writeback import GjAssignmentWriteback
+from n_to_n_matching.person_player import PersonBank
+from n_to_n_matching.workdate_player import WorkDate
+
+
+def _solution(duty, dates):
+    return make_solution([WorkDate(date, assignee_noncommitee=[make_person(id) for id in ids]) for date, ids in dates], type_duty=duty)
+
+def test_write(tmp_path):
+    path_src = str(tmp_path / "master.xlsx")
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = "master"
+    sheet.append(["memo", "=1+1"])
+    sheet.append(["No", "学年組", "氏　名", "図書", "保健", "免除対象"])
+    sheet.append([1, "小1－1", "name1", datetime.datetime(2025, 4, 12), None, None])
+    sheet.append([2, "小1－1", "name2", None, "2025-04-19", None])
+    sheet.append([3, "小1－1", "name3", None, None, None])
+    wb.create_sheet("other").append(["x", "=A1"])
+    wb.save(path_src)
+
+    solutions = [_solution(Roles_Definition.TOSHO_COMMITEE, [("2025-06-14", [1]), ("2025-06-07", [1, 2])]),
+                 _solution(Roles_Definition.HOKEN_COMMITEE, [("2025-04-19", [2]), ("2025-05-10", [2, 9])])]
+    with pytest.raises(ValueError):
+        GjAssignmentWriteback().write(path_src, "master", path_src, solutions)
+    report = GjAssignmentWriteback().write(path_src, "master", str(tmp_path / "out.xlsx"), solutions)
+    assert (2, [9]) == (report.num_rows_updated, report.ids_not_found)
+
+    wb = openpyxl.load_workbook(report.path)
+    assert ["master", "other"] == wb.sheetnames
+    rows = list(wb["master"].iter_rows(values_only=True))
+    assert ("memo", "=1+1") == rows[0][:2]
+    assert ("2025-04-12, 2025-06-07, 2025-06-14", None) == rows[2][3:5]
+    # A date already in the cell isn't repeated.
+    assert ("2025-06-07", "2025-04-19, 2025-05-10") == rows[3][3:5]
+    assert (None, None) == rows[4][3:5]
+    assert "=A1" == wb["other"]["B1"].value
+
+def _truncate_dimension(path, ref):
+    # Rewrites the dimension recorded for every sheet, as a stale one some writers leave.
+    with zipfile.ZipFile(path) as zf:
+        entries = {name: zf.read(name) for name in zf.namelist()}
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in entries.items():
+            if name.startswith("xl/worksheets/"):
+                data = re.sub(rb'<dimension ref="[^"]*"/>', f'<dimension ref="{ref}"/>'.encode(), data)
+            zf.writestr(name, data)
+
+def test_write_truncated_dimension(tmp_path):
+    path_src = str(tmp_path / "master.xlsx")
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = "master"
+    sheet.append(["No", "学年組", "氏　名", "図書", "保健", "免除対象", "memo"])
+    sheet.append([1, "小1－1", "name1", None, None, None, "kept"])
+    wb.save(path_src)
+    _truncate_dimension(path_src, "A1:B2")
+    wb = openpyxl.load_workbook(path_src, read_only=True)
+    # As recorded, the rows end at column B.
+    assert [(1, "小1－1")] == list(wb["master"].iter_rows(min_row=2, values_only=True))
+    wb.close()
+
+    report = GjAssignmentWriteback().write(path_src, "master", str(tmp_path / "out.xlsx"), [_solution(Roles_Definition.TOSHO_COMMITEE, [("2025-06-07", [1])])])
+    assert 1 == report.num_rows_updated
+    assert (1, "小1－1", "name1", "2025-06-07", None, None, "kept") == next(openpyxl.load_workbook(report.path)["master"].iter_rows(min_row=2, values_only=True))
+
+def test_write_ids(tmp_path):
+    assert (12, 12, 3, None, None) == tuple(GjToubanAccess.family_id(id_in_sheet, 3) for id_in_sheet in ("12", 12.0, None, "A-12", 1.5))
+    path_src = str(tmp_path / "master.xlsx")
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = "master"
+    sheet.append(["No", "学年組", "氏　名", "図書", "保健", "免除対象"])
+    for id_in_sheet in (1, "A-12", 3, 4):
+        sheet.append([id_in_sheet, "小1－1", f"name{id_in_sheet}", None, None, None])
+    wb.save(path_src)
+    # Row 3 was collapsed into the household of row 1 at ingest.
+    index = GjHouseholdIndex()
+    for person_id, guardian in ((1, "guardian1"), (3, "guardian1"), (4, "guardian4")):
+        index.add(person_id, guardian, f"{guardian}@example.com", None)
+    person_bank = PersonBank([make_person(1), make_person(4)], households=index)
+
+    report = GjAssignmentWriteback().write(path_src, "master", str(tmp_path / "out.xlsx"),
+                                           [_solution(Roles_Definition.TOSHO_COMMITEE, [("2025-06-07", [1]), ("2025-06-14", [4])])],
+                                           person_bank=person_bank)
+    assert (3, []) == (report.num_rows_updated, report.ids_not_found)
+    # The row of the ID that isn't a number is copied as it is.
+    assert [(1, "2025-06-07"), ("A-12", None), (3, "2025-06-07"), (4, "2025-06-14")] == \
+           [(row[0], row[3]) for row in openpyxl.load_workbook(report.path)["master"].iter_rows(min_row=2, values_only=True)]